@@ -0,0 +1,185 @@
+"""
+ArchardWearCycleDriver.py
+
+Closed loop Archard wear iteration: solve, wear, remesh and resubmit until the total number of physical load cycles is reached.
+
+Every iteration the current orphan mesh INP is submitted with the abaqus command, the wear of one load cycle (the wearing step) is
+integrated from CSLIP1, CSLIP2 and CPRESS of the ODB (ArchardWearIntegrator, ArchardWearEngine.py) and extrapolated over a number of
+physical cycles (cycle jump), then the nodes of the node set are moved by that wear along CNORMF summed over the frames of the step and
+the next INP is written from the current one (PatchInpNodes). The number of cycles of an iteration is the cycle jump, reduced so that
+no node wears more than the maximum wear increment per solve (CycleJumpCycles), so the contact pressure is updated before the worn
+shape changes too much.
+
+Every iteration is written to ARCHARD_WEAR_CYCLES.csv (job, cycles, largest wear of one cycle and of the iteration, largest total wear).
+
+PROCEDURE:
+1. Keep the orphan mesh INP (one step is one physical load cycle, with CSLIP, CPRESS and CNORMF field output) in the working folder
+2. Enter the inputs in INPUTS-ARCHARD-WEAR-CYCLES.csv
+3. Run abq2020 python ArchardWearCycleDriver.py
+
+The abaqus command is entered in the inputs, the jobs are run as COMMAND job=JOB input=JOB.inp cpus=N interactive. To test without
+an Abaqus license enter 'python /path/to/FakeAbaqus/FakeSolver.py frames=10' as the command and run the script with python and the
+FakeAbaqus folder on PYTHONPATH.
+
+Please note:
+1. Keep ArchardWearEngine.py, OdbArrayTools.py and ScriptProfiler.py in the same folder as this script
+2. Only the wear is applied to the next INP, the nodes are not moved to the deformed shape of the solve
+3. Nodes with zero CNORMF over the whole step are not worn
+4. LAPLACIAN or TAUBIN smoothing of the wear offsets over the element faces of the node set (SurfaceSmoother, ArchardWearEngine.py) keeps
+   the worn surface smooth, so a larger maximum wear increment and fewer solves can be used
+
+Revision history:
+REV-00 (18th October 2026): 1st release
+REV-01 (18th October 2026): Optional LAPLACIAN or TAUBIN smoothing of the wear offsets
+REV-02 (18th October 2026): Time integration and smoothing inputs are checked before the first solve
+
+Author:
+Ranjit GOPI
+Solution Consultant, SIMULIA India COE
+ranjit.gopi@3ds.com
+Simulia India Support Frontdesk:+91 44 43443000
+Simulia India Support Email: simulia.in.support@3ds.com
+3DS.COM/SIMULIA
+"""
+
+from odbAccess import *
+from abaqusConstants import *
+
+import os
+import csv
+import time
+import numpy
+from OdbArrayTools import NodeSetLabelIndex
+from ArchardWearEngine import ArchardWearIntegrator, CycleJumpCycles, WornCoordinates, PatchInpNodes, ARCHARD_CONTACT_FIELD_NAMES
+from ArchardWearEngine import FacetNormals, SurfaceSmoother, ARCHARD_TIME_INTEGRATIONS, SMOOTHING_METHODS
+from ScriptProfiler import ScriptProfiler
+
+start = time.time()
+
+# Phases are recorded in the file named by environment variable SCRIPT_PROFILE_FILE (see ScriptProfiler.py)
+Profiler = ScriptProfiler('ArchardWearCycleDriver.py')
+
+# Reading all the input values from a csv file
+with open('INPUTS-ARCHARD-WEAR-CYCLES.csv', 'r') as f:
+	x = [row[1].strip() if len(row) > 1 else '' for row in csv.reader(f)]
+
+JobName = x[0]
+WearingStepName = x[1]
+NodeSetName = x[2]
+kD = float(x[3])
+TotalCycles = int(float(x[4]))
+CycleJump = int(float(x[5]))
+MaxWearIncrement = float(x[6])
+ABAQUS_PATH = x[7]
+CPUS = int(x[8]) if len(x) > 8 and x[8] else 1
+InstanceName = x[9].upper() if len(x) > 9 and x[9] else 'PART-1-1'
+TimeIntegration = x[10].upper() if len(x) > 10 and x[10] else 'TRAPEZOIDAL'
+Smoothing = x[11].upper() if len(x) > 11 and x[11] else 'NONE'
+SmoothingIterations = int(x[12]) if len(x) > 12 and x[12] else 5
+
+if TotalCycles < 1 or CycleJump < 1:
+	raise ValueError('Total cycles and cycle jump must be at least 1, got '+str(TotalCycles)+' and '+str(CycleJump))
+
+# Modes are checked before the first solve, not after it
+if TimeIntegration not in ARCHARD_TIME_INTEGRATIONS:
+	raise ValueError('Time integration must be '+', '.join(ARCHARD_TIME_INTEGRATIONS)+', got '+TimeIntegration)
+if Smoothing not in SMOOTHING_METHODS or SmoothingIterations < 0:
+	raise ValueError('Smoothing must be '+', '.join(SMOOTHING_METHODS)+' with at least 0 iterations, got '+Smoothing+' and '+str(SmoothingIterations))
+
+def SubmitJob(Job, InpName):
+	# Runs the job with the abaqus command and waits for it, the ODB of an earlier run of the same job is removed first
+	if os.path.exists(Job+'.odb'):
+		os.remove(Job+'.odb')
+	os.system(ABAQUS_PATH + " " + "job=" + Job + " " + "input=" + InpName + " " + "cpus=" + str(CPUS) + " " + "interactive")
+	if not os.path.exists(Job+'.odb'):
+		raise RuntimeError('Job '+Job+' did not write '+Job+'.odb, check the abaqus command and the .dat/.msg files')
+
+def WearOfOneCycle(Job):
+	# Labels of the node set, wear of one load cycle and CNORMF summed over the frames of the wearing step
+	odb = openOdb(path=Job+'.odb', readOnly=True)
+
+	SlidingNodesIndex = NodeSetLabelIndex(odb.rootAssembly.instances[InstanceName].nodeSets[NodeSetName])
+	step = odb.steps[WearingStepName]
+
+	Integrator = ArchardWearIntegrator(kD, [frame.frameValue for frame in step.frames], TimeIntegration)
+	CNORMFSUM = numpy.zeros((len(SlidingNodesIndex), 3))
+
+	for frame in step.frames:
+		Integrator.Add(*[SlidingNodesIndex.ScatterField(frame, FieldName) for FieldName in ARCHARD_CONTACT_FIELD_NAMES])
+		CNORMFSUM = CNORMFSUM + SlidingNodesIndex.ScatterField(frame, 'CNORMF', 3)
+
+	# The worn INPs have the elements of the first INP, the smoother is built once for all iterations
+	global Smoother
+	if Smoothing != 'NONE' and Smoother is None:
+		Smoother = SurfaceSmoother(FacetNormals(odb.rootAssembly.instances[InstanceName], SlidingNodesIndex), Smoothing, SmoothingIterations)
+
+	odb.close()
+
+	WearPerCycle = Integrator.WearSum if Integrator.WearSum is not None else numpy.zeros(len(SlidingNodesIndex))
+
+	return SlidingNodesIndex.Labels, WearPerCycle, CNORMFSUM
+
+with open('ARCHARD_WEAR_CYCLES.csv', 'w') as myfile:
+	myfile.write('ITERATION,JOB,CYCLES BEFORE,CYCLES OF ITERATION,CYCLES AFTER,MAX WEAR PER CYCLE,MAX WEAR OF ITERATION,MAX TOTAL WEAR,WORN INP\n')
+
+InpName = JobName+'.inp'
+Smoother = None
+CyclesDone = 0
+Iteration = 0
+TotalWear = None
+
+while CyclesDone < TotalCycles:
+
+	Iteration = Iteration + 1
+	Job = JobName+'-CYCLE-'+str(Iteration)
+
+	print('Iteration '+str(Iteration)+': '+Job+' from '+InpName+', '+str(CyclesDone)+' of '+str(TotalCycles)+' cycles done')
+
+	Profiler.Start('SOLVE')
+	SubmitJob(Job, InpName)
+	Profiler.Stop(iteration=Iteration)
+
+	Profiler.Start('WEAR')
+
+	Labels, WearPerCycle, CNORMFSUM = WearOfOneCycle(Job)
+
+	JumpCycles = CycleJumpCycles(WearPerCycle, CycleJump, MaxWearIncrement, TotalCycles - CyclesDone)
+	WearOfIteration = JumpCycles*WearPerCycle
+
+	if TotalWear is None:
+		TotalWear = WearOfIteration.copy()
+	else:
+		TotalWear = TotalWear + WearOfIteration
+
+	Profiler.Stop(iteration=Iteration)
+
+	Profiler.Start('REMESH')
+
+	# Offsets of the sliding nodes, the wear of the iteration along the unit vector of the summed CNORMF
+	Offsets = WornCoordinates(numpy.zeros((len(Labels), 3)), WearOfIteration, CNORMFSUM)[0]
+	if Smoother is not None:
+		Offsets = Smoother.Smooth(Offsets)
+
+	WornInpName = JobName+'-CYCLE-'+str(Iteration)+'-WORN.inp'
+	PatchInpNodes(InpName, WornInpName, Labels, Offsets)
+
+	Profiler.Stop(iteration=Iteration)
+
+	with open('ARCHARD_WEAR_CYCLES.csv', 'a') as myfile:
+		myfile.write(','.join([str(Iteration), Job, str(CyclesDone), str(JumpCycles), str(CyclesDone + JumpCycles),
+			repr(float(WearPerCycle.max()) if len(WearPerCycle) else 0.0),
+			repr(float(WearOfIteration.max()) if len(WearOfIteration) else 0.0),
+			repr(float(TotalWear.max()) if len(TotalWear) else 0.0), WornInpName]) + '\n')
+
+	CyclesDone = CyclesDone + JumpCycles
+	InpName = WornInpName
+
+print('Worn INP after '+str(CyclesDone)+' cycles: '+InpName)
+
+end = time.time()
+
+TimeTaken=end - start
+
+with open('Time_Taken_By_Script_'+'ArchardWearCycleDriver.py'+'_InSeconds.txt', 'a') as myfile:
+	myfile.write('Time taken by script in seconds is: '+str(TimeTaken) +'\n')
+	myfile.close
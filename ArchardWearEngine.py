@@ -0,0 +1,894 @@
+"""
+ArchardWearEngine.py
+
+Array based helpers used by ArchardWearIterator.py to write the worn geometry of the contact nodes.
+
+PatchInpNodes writes a worn INP straight from the original orphan mesh INP (the template). Every node of the *Node blocks
+is moved by its displacement of the frame (the DEFORMED shape which PartFromOdb would give) and the sliding nodes are set to
+their worn coordinates. All other lines of the template (elements, sets, materials, steps) are written unchanged.
+Unlike PartFromOdb and writeInput no CAE kernel is needed, so worn INPs can be written with abq2018 python.
+
+RewriteInpNodeBlocks streams the INP in large binary blocks (INP_BUFFER_SIZE). The labels of the node lines of the *Node blocks are
+parsed and looked up in array operations, only the patched node lines are split. Everything else (other keywords, comments, line endings) is
+copied byte for byte, so INPs with millions of nodes are rewritten in seconds.
+
+SplitInpAtNodes and WriteWornNodesInclude write a worn model without copying the mesh for every frame. The template is split once after
+its last *Node block into a head (ending with the node lines) and a tail. The worn INP of a frame is a master file including the head,
+a small file with only the worn nodes and the tail. Abaqus uses the last definition of a node defined more than once, so the worn
+nodes override the nodes of the head.
+
+ArchardWearIntegrator integrates the Archard wear of the sliding nodes in one pass over the frames. It keeps only the CSLIP1, CSLIP2
+and CPRESS arrays of the previous frame and the wear sum, the slip increments, averaged contact pressure and wear of every frame
+are array operations (ArchardKernel). The wear of a frame is kD times the trapezoidal integral of contact pressure x slip rate over the
+time increment of the frame (TRAPEZOIDAL). The slip rate is constant over the increment, so the time increment cancels and the wear is
+kD x averaged pressure x slip increment, also for a frame repeated at the same time. LEGACY gives the wear of earlier revisions,
+kD x averaged pressure x slip increment divided by the time increment of the last frame of the step.
+
+WearResultsSidecar writes the wear fields and worn coordinates of the sliding nodes to a columnar binary file instead of a copy of
+the ODB. Name+'.npz' holds the node labels, the column names and the frame numbers and frame values of the records, Name+'.records'
+holds one float64 record (columns x nodes) per frame. ReadWearResults reads them back, the records as a memory map.
+
+WearStatisticsLog writes the statistics of the worn nodes of every frame in bulk from the arrays of the frame, one formatted string and
+one write per frame into a file kept open. SUMMARY gives one row per frame (Name+'Summary.csv'), NODES also one row per node and
+frame (Name+'.csv'), TEXT also the node by node text of earlier revisions of ArchardWearIterator.py (Name+'.txt'), NONE no log.
+
+WornFrameSession gives the worn nodes of a frame of the wearing step (COORD and CNORMF of the frame and the wear sum) and writes its
+worn INP in TEMPLATE or INCLUDE mode. Once the wear sums of all frames are known the frames are independent, EvaluateFrames can spread
+them over worker processes. Each worker opens the ODB read only and writes the worn INPs of its frames, the worn nodes come back to
+the parent process in frame order for the statistics log and the sidecar.
+
+Several contact pairs (node sets of one instance, each with its own kD, see WearPairs) are worn in one pass over the frames. The node
+sets are merged into one sorted set of unique labels (NodeSetLabelIndex in OdbArrayTools.py), every field of a frame is read on each
+node set and scattered into one array for all pairs and each pair integrates its wear on its view of the arrays (WornFrameSession.NodeSetView). The worn INP of a frame moves
+the nodes of all pairs by the sum of their wear, a node shared by two pairs wears by both.
+
+CycleJumpCycles gives the number of physical load cycles one FE solve stands for in the closed loop wear iteration of
+ArchardWearCycleDriver.py: the cycle jump, reduced so that no node wears more than the maximum wear increment per solve.
+
+FacetNormals gives normals of the sliding nodes from the geometry when CNORMF is not written or is zero (open contact). The faces of the
+3D solid elements with all corner nodes in the node sets which belong to one element only (the surface) are found and oriented into the body
+once, like CNORMF of a slave surface. The normal of a node in a frame is the sum of the area vectors (normal x area, at the current
+coordinates) of its faces, a few array operations per frame. WornFrameSession uses CNORMF, the facet normals (GEOMETRY) or CNORMF and the
+facet normals for the nodes and frames without CNORMF (AUTO).
+
+SurfaceSmoother smooths the wear offsets of the sliding nodes over the edges of these facets, so that the worn surface stays smooth and
+larger wear increments can be applied per FE solve. LAPLACIAN moves every offset towards the mean of its neighbours, TAUBIN follows
+every such step with a step back (negative factor) so that the worn shape does not shrink. The adjacency is kept as edge arrays,
+an iteration costs a few bincounts over the edges, linear in the number of nodes.
+
+WornCoordinates moves the coordinates of all sliding nodes along their unit contact normals (CNORMF) by their wear sums in one
+array operation. Nodes with a zero normal (no contact force) keep their coordinates.
+
+Please note:
+1. Keep this file, OdbArrayTools.py and ScriptProfiler.py in the same folder as ArchardWearIterator.py and ArchardWearCycleDriver.py
+2. The template must be an orphan mesh INP (nodes of one part, as written by ANSA or Hypermesh), node labels are looked up in all *Node blocks
+3. numpy is shipped with Abaqus python, no extra installation is needed
+4. Worker processes are started with multiprocessing, use abq2018 python ArchardWearIterator.py on Linux for parallel runs
+
+Revision history:
+REV-00 (18th October 2026): 1st release
+REV-01 (18th October 2026): Added WornCoordinates
+REV-02 (18th October 2026): Added ArchardWearIntegrator
+REV-03 (18th October 2026): Added WearResultsSidecar and ReadWearResults
+REV-04 (18th October 2026): Time increment of every frame, TRAPEZOIDAL and LEGACY time integration
+REV-05 (18th October 2026): Added CycleJumpCycles
+REV-06 (18th October 2026): Added RewriteInpNodeBlocks, PatchInpNodes streams the INP and copies unpatched lines byte for byte
+REV-07 (18th October 2026): Added SplitInpAtNodes and WriteWornNodesInclude
+REV-08 (18th October 2026): Added WearStatisticsLog
+REV-09 (18th October 2026): Added WornFrameSession and EvaluateFrames, worn coordinates of a sidecar record can be set after later records
+REV-10 (18th October 2026): Added WearPairs, WornFrameSession indexes the union of several node sets
+REV-11 (18th October 2026): Added FacetNormals, the sliding nodes can wear along area weighted normals of the element faces
+REV-12 (18th October 2026): Added SurfaceSmoother, the wear offsets of the sliding nodes can be smoothed over the facets
+REV-13 (18th October 2026): TRAPEZOIDAL wear is kD x averaged pressure x slip increment (the time increment cancels), also for frames at a repeated time
+REV-14 (18th October 2026): Several node sets are read one region per node set instead of on the whole instance
+REV-15 (18th October 2026): FacetNormals finds the faces shared by two elements without numpy.unique(axis=0) (numpy < 1.13)
+
+Author:
+Ranjit GOPI
+Solution Consultant, SIMULIA India COE
+ranjit.gopi@3ds.com
+Simulia India Support Frontdesk:+91 44 43443000
+Simulia India Support Email: simulia.in.support@3ds.com
+3DS.COM/SIMULIA
+"""
+from odbAccess import *
+import os
+import math
+import multiprocessing
+import numpy
+from OdbArrayTools import NodeSetLabelIndex
+
+ARCHARD_CONTACT_FIELD_NAMES = ('CSLIP1', 'CSLIP2', 'CPRESS')
+
+# (name, description) of the field outputs written for every frame
+ARCHARD_WEAR_FIELDS = (('ARCHARDWEAR', 'Archard WEAR calculated from Averaged CPRESS and Resultant CSLIP'),
+	('ARCHARDWEARSUM', 'Sum of Archard WEAR'))
+
+# (name, description) of the intermediate field outputs, written only on request
+ARCHARD_INTERMEDIATE_FIELDS = (('CSLIP1DELTA', 'DIFFERENCE IN CSLIP1 FROM CURRENT FRAME AND PREVIOUS FRAME'),
+	('CSLIP2DELTA', 'DIFFERENCE IN CSLIP2 FROM CURRENT FRAME AND PREVIOUS FRAME'),
+	('RESULTANTCSLIPDELTA', 'RESULTANT CSLIP FROM CURRENT FRAME AND PREVIOUS FRAME'),
+	('CPRESS_AVERAGED', 'AVERAGED CPRESS FROM CURRENT FRAME AND PREVIOUS FRAME'),
+	('RESULTANTCSLIPRATE', 'RESULTANT CSLIP DIVIDED BY THE TIME INCREMENT OF THE FRAME'),
+	('AVG_CONTACT_PRESSURE_MULTIPLIED_RESULTANT_SLIP_DISTANCE', 'Averaged CONTACT PRESSURE multiplied by RESULTANT CSLIP'))
+
+ARCHARD_TIME_INTEGRATIONS = ('TRAPEZOIDAL', 'LEGACY')
+
+def ArchardKernel(CSLIP1i, CSLIP2i, CPRESSi, CSLIP1iMinusOne, CSLIP2iMinusOne, CPRESSiMinusOne, kD, IncrementTime, TimeIntegration='TRAPEZOIDAL', LegacyIncrementTime=None):
+	# Fields of one frame by name, all inputs are label aligned arrays, IncrementTime is the time increment of the frame (used for
+	# RESULTANTCSLIPRATE only)
+	# Archard Wear equation = Contact Pressure * Slip Velocity, Slip Velocity = Resultant Slip Distance / Time of Increment
+	Fields = {}
+
+	Fields['CSLIP1DELTA'] = CSLIP1i - CSLIP1iMinusOne
+	Fields['CSLIP2DELTA'] = CSLIP2i - CSLIP2iMinusOne
+	Fields['RESULTANTCSLIPDELTA'] = numpy.sqrt(Fields['CSLIP1DELTA']**2 + Fields['CSLIP2DELTA']**2)
+	Fields['CPRESS_AVERAGED'] = 0.5*(CPRESSi + CPRESSiMinusOne)
+	Fields['AVG_CONTACT_PRESSURE_MULTIPLIED_RESULTANT_SLIP_DISTANCE'] = Fields['CPRESS_AVERAGED']*Fields['RESULTANTCSLIPDELTA']
+
+	# Slip rate is constant over the increment, a frame repeated at the same time has no slip rate
+	if IncrementTime > 0.0:
+		Fields['RESULTANTCSLIPRATE'] = Fields['RESULTANTCSLIPDELTA']/IncrementTime
+	else:
+		Fields['RESULTANTCSLIPRATE'] = numpy.zeros_like(Fields['RESULTANTCSLIPDELTA'])
+
+	if TimeIntegration == 'LEGACY':
+		# Wear of earlier revisions, one time increment (of the last frame of the step) for all frames
+		Fields['ARCHARDWEAR'] = Fields['AVG_CONTACT_PRESSURE_MULTIPLIED_RESULTANT_SLIP_DISTANCE']*kD/LegacyIncrementTime
+	else:
+		# Trapezoidal rule for the linear contact pressure over the increment times the constant slip rate,
+		# kD*CPRESS_AVERAGED*(RESULTANTCSLIPDELTA/IncrementTime)*IncrementTime: the time increment cancels
+		Fields['ARCHARDWEAR'] = kD*Fields['AVG_CONTACT_PRESSURE_MULTIPLIED_RESULTANT_SLIP_DISTANCE']
+
+	return Fields
+
+def IncrementTimes(FrameValues):
+	# Time increment of every frame (0.0 for the first frame) from the frame values of a step
+	FrameValues = numpy.asarray(FrameValues, dtype=numpy.float64)
+	return numpy.concatenate((numpy.zeros(min(len(FrameValues), 1)), numpy.diff(FrameValues)))
+
+class ArchardWearIntegrator:
+	# Archard wear sum of the sliding nodes, the contact fields of the frames are added in frame order
+	# FrameValues are the frame values of all frames of the step, TimeIntegration is TRAPEZOIDAL or LEGACY
+
+	def __init__(self, kD, FrameValues, TimeIntegration='TRAPEZOIDAL'):
+
+		if TimeIntegration not in ARCHARD_TIME_INTEGRATIONS:
+			raise ValueError('Time integration must be '+' or '.join(ARCHARD_TIME_INTEGRATIONS)+', got '+str(TimeIntegration))
+
+		self.kD = kD
+		self.IncrementTimes = IncrementTimes(FrameValues)
+		self.TimeIntegration = TimeIntegration
+		self.LegacyIncrementTime = self.IncrementTimes[-1]
+
+		self.FrameIndex = 0
+		self.Previous = None
+		self.WearSum = None
+
+	def Add(self, CSLIP1, CSLIP2, CPRESS):
+		# Contact fields of the next frame, returns the fields of the frame by name (see ArchardKernel) and ARCHARDWEARSUM,
+		# None for the first frame
+		Previous = self.Previous
+		self.Previous = (CSLIP1, CSLIP2, CPRESS)
+
+		FrameIndex = self.FrameIndex
+		self.FrameIndex = self.FrameIndex + 1
+
+		if Previous is None:
+			return None
+
+		Fields = ArchardKernel(CSLIP1, CSLIP2, CPRESS, Previous[0], Previous[1], Previous[2], self.kD,
+			self.IncrementTimes[FrameIndex], self.TimeIntegration, self.LegacyIncrementTime)
+
+		if self.WearSum is None:
+			self.WearSum = Fields['ARCHARDWEAR'].copy()
+		else:
+			self.WearSum = self.WearSum + Fields['ARCHARDWEAR']
+
+		Fields['ARCHARDWEARSUM'] = self.WearSum
+
+		return Fields
+
+# Coordinate of a patched node line, 12 significant digits keep wear increments much smaller than the coordinates
+INP_COORDINATE_FORMAT = ', %.12g'
+
+def IsNodeKeyword(line):
+	# True for *Node keyword lines (*NODE, NSET=...), False for *NODE OUTPUT, *NODE PRINT and *NODE FILE
+	return line.split(',')[0].strip().upper() == '*NODE'
+
+# Bytes of the INP read at a time by RewriteInpNodeBlocks
+INP_BUFFER_SIZE = 16*1024*1024
+
+def InpKeywordLines(Buffer):
+	# Start and end (position of the line feed) of the keyword and comment lines of Buffer, the lines starting with *
+	if Buffer.startswith(b'*'):
+		LineStart = 0
+	else:
+		LineStart = Buffer.find(b'\n*') + 1
+		if LineStart == 0:
+			return
+
+	while True:
+		LineEnd = Buffer.find(b'\n', LineStart)
+		if LineEnd < 0:
+			LineEnd = len(Buffer)
+		yield LineStart, LineEnd
+
+		LineStart = Buffer.find(b'\n*', LineEnd) + 1
+		if LineStart == 0:
+			return
+
+def InpBuffers(InpFile, BufferSize=INP_BUFFER_SIZE):
+	# Blocks of complete lines of the INP opened in binary mode, the last partial line of a read is kept for the next block
+	Rest = b''
+
+	while True:
+
+		Buffer = InpFile.read(BufferSize)
+
+		if Buffer:
+			Buffer = Rest + Buffer
+			End = Buffer.rfind(b'\n') + 1
+			Buffer, Rest = Buffer[:End], Buffer[End:]
+			if Buffer:
+				yield Buffer
+		elif Rest:
+			yield Rest
+			return
+		else:
+			return
+
+def RewriteInpNodeBlocks(SourceInpName, RewrittenInpName, Labels, NodeLine, BufferSize=INP_BUFFER_SIZE):
+	# Copies SourceInpName to RewrittenInpName, the node lines of the *Node blocks with a label in Labels (dictionary or set) are
+	# replaced by NodeLine(Label, Values), Values are the text fields after the label, the line ending is kept
+	# Returns the number of node lines replaced
+	Patched = 0
+	InNodeBlock = False
+
+	LabelArray = numpy.unique(numpy.fromiter(Labels, dtype=numpy.int64, count=len(Labels)))
+
+	with open(SourceInpName, 'rb') as SourceFile:
+		with open(RewrittenInpName, 'wb') as RewrittenFile:
+
+			for Buffer in InpBuffers(SourceFile, BufferSize):
+
+				Start = 0
+				for LineStart, LineEnd in InpKeywordLines(Buffer):
+					Patched = Patched + RewriteInpSegment(Buffer[Start:LineStart], RewrittenFile, InNodeBlock, LabelArray, NodeLine)
+					RewrittenFile.write(Buffer[LineStart:LineEnd])
+					if not Buffer.startswith(b'**', LineStart):
+						InNodeBlock = IsNodeKeyword(Buffer[LineStart:LineEnd].decode('ascii', 'replace'))
+					Start = LineEnd
+
+				Patched = Patched + RewriteInpSegment(Buffer[Start:], RewrittenFile, InNodeBlock, LabelArray, NodeLine)
+
+	return Patched
+
+def RewriteInpSegment(Segment, RewrittenFile, InNodeBlock, LabelArray, NodeLine):
+	# Writes the lines between two keyword lines, the labels of all node lines are parsed in array operations and only the lines
+	# with a label in LabelArray (sorted) are split and replaced, the other bytes are written unchanged
+	if not InNodeBlock or not len(LabelArray) or not Segment:
+		RewrittenFile.write(Segment)
+		return 0
+
+	Data = numpy.frombuffer(Segment, dtype=numpy.uint8)
+	LineStarts = numpy.concatenate(([0], numpy.flatnonzero(Data == ord('\n')) + 1))
+	LineEnds = numpy.append(LineStarts[1:], len(Data))
+
+	# First comma of every line, the label is the digits before it (blank lines and lines without comma have no label)
+	Commas = numpy.flatnonzero(Data == ord(','))
+	if not len(Commas):
+		RewrittenFile.write(Segment)
+		return 0
+	LineCommas = Commas[numpy.minimum(numpy.searchsorted(Commas, LineStarts), len(Commas) - 1)]
+	HasLabel = (LineCommas >= LineStarts) & (LineCommas < LineEnds)
+
+	LineStarts, LineEnds, LineCommas = LineStarts[HasLabel], LineEnds[HasLabel], LineCommas[HasLabel]
+	if not len(LineStarts):
+		RewrittenFile.write(Segment)
+		return 0
+
+	# Labels are read one character column at a time for all lines, spaces and tabs around the label are skipped
+	Widths = LineCommas - LineStarts
+	LineLabels = numpy.zeros(len(LineStarts), dtype=numpy.int64)
+	for Column in range(int(Widths.max())):
+		Digits = Data[numpy.minimum(LineStarts + Column, len(Data) - 1)].astype(numpy.int64) - ord('0')
+		IsDigit = (Column < Widths) & (Digits >= 0) & (Digits <= 9)
+		LineLabels = numpy.where(IsDigit, LineLabels*10 + Digits, LineLabels)
+
+	Positions = numpy.minimum(numpy.searchsorted(LabelArray, LineLabels), len(LabelArray) - 1)
+	Patch = numpy.flatnonzero(LabelArray[Positions] == LineLabels)
+
+	Pieces = []
+	Start = 0
+	for Index in Patch.tolist():
+		LineStart, LineComma = int(LineStarts[Index]), int(LineCommas[Index])
+		line = Segment[LineStart:int(LineEnds[Index])]
+		Body = line.rstrip(b'\r\n')
+		Pieces.append(Segment[Start:LineStart])
+		Pieces.append(NodeLine(int(LineLabels[Index]), Body[LineComma - LineStart + 1:].decode('ascii').split(',')).encode('ascii'))
+		Pieces.append(line[len(Body):])
+		Start = int(LineEnds[Index])
+
+	Pieces.append(Segment[Start:])
+	RewrittenFile.write(b''.join(Pieces))
+
+	return len(Patch)
+
+def SplitInpAtNodes(InpName, HeadInpName, TailInpName, BufferSize=INP_BUFFER_SIZE):
+	# Writes InpName up to the end of its last *Node block to HeadInpName and the rest to TailInpName, byte for byte
+	# Returns the size of the head in bytes
+	HeadSize = None
+	InNodeBlock = False
+	Offset = 0
+
+	with open(InpName, 'rb') as InpFile:
+		for Buffer in InpBuffers(InpFile, BufferSize):
+			for LineStart, LineEnd in InpKeywordLines(Buffer):
+				if Buffer.startswith(b'**', LineStart):
+					continue
+				if InNodeBlock:
+					HeadSize = Offset + LineStart
+				InNodeBlock = IsNodeKeyword(Buffer[LineStart:LineEnd].decode('ascii', 'replace'))
+			Offset = Offset + len(Buffer)
+
+	if InNodeBlock:
+		HeadSize = Offset
+	if HeadSize is None:
+		raise ValueError('No *Node block in '+InpName)
+
+	with open(InpName, 'rb') as InpFile:
+		for PartName, Size in ((HeadInpName, HeadSize), (TailInpName, Offset - HeadSize)):
+			with open(PartName, 'wb') as PartFile:
+				while Size > 0:
+					Buffer = InpFile.read(min(BufferSize, Size))
+					PartFile.write(Buffer)
+					Size = Size - len(Buffer)
+
+	return HeadSize
+
+def WriteWornNodesInclude(MasterInpName, HeadInpName, TailInpName, WornLabels, WornCoordinates):
+	# Writes the nodes of WornLabels with their rows of WornCoordinates to MasterInpName without extension+'Nodes.inp' and the master
+	# INP including the head, the worn nodes and the tail (see SplitInpAtNodes), returns the name of the worn nodes file
+	NodesInpName = os.path.splitext(MasterInpName)[0] + 'Nodes.inp'
+	WornCoordinates = numpy.asarray(WornCoordinates, dtype=numpy.float64).reshape(len(WornLabels), 3)
+
+	with open(NodesInpName, 'w') as NodesFile:
+		NodesFile.write('*NODE\n')
+		for Label, Coordinates in zip(numpy.asarray(WornLabels).tolist(), WornCoordinates.tolist()):
+			NodesFile.write(str(Label) + ''.join(INP_COORDINATE_FORMAT % value for value in Coordinates) + '\n')
+
+	with open(MasterInpName, 'w') as MasterFile:
+		MasterFile.write('** Worn nodes override the nodes of the head, Abaqus uses the last definition of a node\n')
+		for Name in (HeadInpName, NodesInpName, TailInpName):
+			MasterFile.write('*INCLUDE, INPUT=' + os.path.basename(Name) + '\n')
+
+	return NodesInpName
+
+# Columns of the worn coordinates in a WearResultsSidecar record, NaN for nodes and frames without worn coordinates
+WORN_COORDINATE_COLUMNS = ('WORNCOORD1', 'WORNCOORD2', 'WORNCOORD3')
+
+class WearResultsSidecar:
+	# Wear results of the sliding nodes, one record per frame with a column per field name in FieldNames and the worn coordinates
+	# The record of a frame is kept until the next frame is added, so that worn coordinates can be set after the wear fields
+
+	def __init__(self, Name, Labels, FieldNames):
+
+		self.HeaderName = Name+'.npz'
+		self.RecordsName = Name+'.records'
+		self.Labels = numpy.asarray(Labels, dtype=numpy.int64)
+		self.Columns = tuple(FieldNames) + WORN_COORDINATE_COLUMNS
+
+		self.FrameNumbers = []
+		self.FrameValues = []
+		self.Record = None
+
+		self.RecordsFile = open(self.RecordsName, 'w+b')
+
+	def Add(self, FrameNumber, FrameValue, Fields):
+		# Record of the next frame, Fields gives the label aligned array of each field name (see ArchardKernel)
+		self.Flush()
+
+		self.Record = numpy.empty((len(self.Columns), len(self.Labels)), dtype=numpy.float64)
+		self.Record.fill(numpy.nan)
+
+		for Column in range(len(self.Columns) - len(WORN_COORDINATE_COLUMNS)):
+			self.Record[Column] = Fields[self.Columns[Column]]
+
+		self.FrameNumbers.append(FrameNumber)
+		self.FrameValues.append(FrameValue)
+
+	def SetWornCoordinates(self, Labels, NewCoordinates, FrameNumber=None):
+		# Worn coordinates (nodes, 3) of Labels for the frame added last, or for the record of FrameNumber already written to the file
+		# Labels which are not labels of the sidecar (nodes of other contact pairs) are skipped
+		Labels = numpy.asarray(Labels, dtype=numpy.int64)
+		Positions = numpy.searchsorted(self.Labels, Labels)
+		Positions[Positions == len(self.Labels)] = 0
+		InSidecar = self.Labels[Positions] == Labels if len(self.Labels) else numpy.zeros(len(Labels), dtype=bool)
+		Positions = Positions[InSidecar]
+		NewCoordinates = numpy.asarray(NewCoordinates, dtype=numpy.float64).reshape(len(Labels), 3)[InSidecar].T
+
+		if self.Record is not None and (FrameNumber is None or FrameNumber == self.FrameNumbers[-1]):
+			self.Record[-len(WORN_COORDINATE_COLUMNS):, Positions] = NewCoordinates
+			return
+
+		# The worn coordinate columns are the last rows of a record, they are read, set and written back in place
+		Offset = ((self.FrameNumbers.index(FrameNumber) + 1)*len(self.Columns) - len(WORN_COORDINATE_COLUMNS))*len(self.Labels)*8
+
+		self.RecordsFile.seek(Offset)
+		Worn = numpy.fromfile(self.RecordsFile, dtype=numpy.float64, count=len(WORN_COORDINATE_COLUMNS)*len(self.Labels))
+		Worn = Worn.reshape(len(WORN_COORDINATE_COLUMNS), len(self.Labels))
+		Worn[:, Positions] = NewCoordinates
+
+		self.RecordsFile.seek(Offset)
+		Worn.tofile(self.RecordsFile)
+		self.RecordsFile.seek(0, 2)
+
+	def Flush(self):
+		if self.Record is not None:
+			self.Record.tofile(self.RecordsFile)
+			self.Record = None
+
+	def Close(self):
+		# Header is written to a temporary file first so that a crash while writing leaves no header of a different run
+		self.Flush()
+		self.RecordsFile.close()
+
+		TemporaryName = self.HeaderName+'.tmp'
+
+		HeaderFile = open(TemporaryName, 'wb')
+		numpy.savez(HeaderFile, Labels=self.Labels, Columns=numpy.array(self.Columns),
+			FrameNumbers=numpy.array(self.FrameNumbers, dtype=numpy.int64), FrameValues=numpy.array(self.FrameValues, dtype=numpy.float64))
+		HeaderFile.close()
+
+		if os.path.exists(self.HeaderName):
+			os.remove(self.HeaderName)
+		os.rename(TemporaryName, self.HeaderName)
+
+def ReadWearResults(Name):
+	# Labels, column names, frame numbers, frame values and the records (frames, columns, nodes) of a WearResultsSidecar
+	Header = numpy.load(Name+'.npz')
+
+	Labels = Header['Labels']
+	Columns = [str(Column) for Column in Header['Columns']]
+	FrameNumbers = Header['FrameNumbers']
+
+	if len(FrameNumbers) == 0 or len(Labels) == 0:
+		Records = numpy.zeros((len(FrameNumbers), len(Columns), len(Labels)), dtype=numpy.float64)
+	else:
+		Records = numpy.memmap(Name+'.records', dtype=numpy.float64, mode='r', shape=(len(FrameNumbers), len(Columns), len(Labels)))
+
+	return Labels, Columns, FrameNumbers, Header['FrameValues'], Records
+
+# Verbosities of WearStatisticsLog, from no log to the node by node text, and the columns of its CSV files
+STATISTICS_VERBOSITIES = ('NONE', 'SUMMARY', 'NODES', 'TEXT')
+STATISTICS_COLUMNS = ('FRAME', 'NODE LABEL', 'WEAR SUM', 'CNORMF MAGNITUDE', 'CNORMF1', 'CNORMF2', 'CNORMF3', 'CNORMF UNIT1', 'CNORMF UNIT2',
+	'CNORMF UNIT3', 'OLD COORD1', 'OLD COORD2', 'OLD COORD3', 'NEW COORD1', 'NEW COORD2', 'NEW COORD3')
+STATISTICS_SUMMARY_COLUMNS = ('FRAME', 'WORN NODES', 'MAX WEAR SUM', 'MEAN WEAR SUM', 'MAX WEAR DISPLACEMENT', 'MAX CNORMF MAGNITUDE')
+STATISTICS_NUMBER_FORMAT = '%.12g'
+STATISTICS_TEXT_FORMAT = ('node label=%d\nWEAR SUM=%s\nCNORMF Direction Magnitude=%s\n' +
+	''.join('CNORMF Direction '+direction+' Component=%s\nCNORMF Direction '+direction+' Unit Vector=%s\n' +
+	'Old '+direction+' Coordinate=%s\nNew '+direction+' Coordinate=%s\n' for direction in 'XYZ'))
+
+class WearStatisticsLog:
+	# Statistics of the worn nodes of the frames, Verbosity is one of STATISTICS_VERBOSITIES
+
+	def __init__(self, Name, Verbosity='NODES'):
+
+		if Verbosity not in STATISTICS_VERBOSITIES:
+			raise ValueError('Statistics verbosity must be '+', '.join(STATISTICS_VERBOSITIES)+', got '+str(Verbosity))
+
+		self.Verbosity = Verbosity
+		self.Files = {}
+
+		if Verbosity != 'NONE':
+			self.Files['SUMMARY'] = open(Name+'Summary.csv', 'w')
+			self.Files['SUMMARY'].write(','.join(STATISTICS_SUMMARY_COLUMNS) + '\n')
+		if Verbosity == 'NODES':
+			self.Files['NODES'] = open(Name+'.csv', 'w')
+			self.Files['NODES'].write(','.join(STATISTICS_COLUMNS) + '\n')
+		if Verbosity == 'TEXT':
+			self.Files['TEXT'] = open(Name+'.txt', 'w')
+			self.Files['TEXT'].write('\n')
+
+	def Add(self, FrameNumber, Labels, WearSum, Normals, NormalMagnitudes, UnitNormals, Coordinates, NewCoordinates):
+		# Arrays of the worn nodes of a frame, Labels (nodes,), WearSum and NormalMagnitudes (nodes,), the others (nodes, 3)
+		if 'SUMMARY' in self.Files:
+			Summary = [FrameNumber, len(Labels)]
+			if len(Labels):
+				Summary = Summary + [numpy.max(WearSum), numpy.mean(WearSum), numpy.sqrt(((NewCoordinates - Coordinates)**2).sum(axis=1)).max(),
+					numpy.max(NormalMagnitudes)]
+			else:
+				Summary = Summary + [0.0, 0.0, 0.0, 0.0]
+			self.Files['SUMMARY'].write('%d,%d,' % tuple(Summary[:2]) + ','.join(STATISTICS_NUMBER_FORMAT % value for value in Summary[2:]) + '\n')
+
+		if not len(Labels) or not ('NODES' in self.Files or 'TEXT' in self.Files):
+			return
+
+		# Labels are stored as float64 in the rows (exact below 2**53) and written with %d
+		Labels = numpy.asarray(Labels, dtype=numpy.float64)
+
+		if 'NODES' in self.Files:
+			Data = numpy.column_stack((Labels, WearSum, NormalMagnitudes, Normals, UnitNormals, Coordinates, NewCoordinates))
+			RowFormat = str(int(FrameNumber)) + ',%d' + (',' + STATISTICS_NUMBER_FORMAT)*(len(STATISTICS_COLUMNS) - 2) + '\n'
+			self.Files['NODES'].write((RowFormat*len(Labels)) % tuple(Data.ravel().tolist()))
+
+		if 'TEXT' in self.Files:
+			Data = numpy.column_stack([Labels, WearSum, NormalMagnitudes] + [Column for component in range(3) for Column in
+				(Normals[:, component], UnitNormals[:, component], Coordinates[:, component], NewCoordinates[:, component])])
+			self.Files['TEXT'].write((STATISTICS_TEXT_FORMAT*len(Labels)) % tuple(Data.ravel().tolist()))
+
+	def Close(self):
+		for LogFile in self.Files.values():
+			LogFile.close()
+		self.Files = {}
+
+def CycleJumpCycles(WearPerCycle, CycleJump, MaxWearIncrement, RemainingCycles):
+	# Cycles extrapolated from the wear of one cycle (WearPerCycle, nodes), at most CycleJump and RemainingCycles and at most
+	# as many as keep the largest nodal wear increment below MaxWearIncrement, at least 1 so that every solve advances
+	Cycles = min(int(CycleJump), int(RemainingCycles))
+
+	MaxWearPerCycle = float(numpy.max(WearPerCycle)) if len(WearPerCycle) else 0.0
+	if MaxWearPerCycle > 0.0 and MaxWearIncrement > 0.0:
+		Cycles = min(Cycles, int(math.floor(MaxWearIncrement/MaxWearPerCycle)))
+
+	return max(Cycles, 1)
+
+def WornCoordinates(Coordinates, WearSum, Normals):
+	# New coordinates (nodes, 3) of Coordinates moved by WearSum (nodes,) along the unit vectors of Normals (nodes, 3)
+	# Returns the new coordinates, the unit normals and the normal magnitudes, the unit normal of a zero normal is zero
+
+	Coordinates = numpy.asarray(Coordinates, dtype=numpy.float64).reshape(-1, 3)
+	Normals = numpy.asarray(Normals, dtype=numpy.float64).reshape(len(Coordinates), 3)
+	WearSum = numpy.asarray(WearSum, dtype=numpy.float64).reshape(len(Coordinates))
+
+	Magnitudes = numpy.sqrt((Normals**2).sum(axis=1))
+	InContact = Magnitudes > 0.0
+
+	UnitNormals = numpy.zeros_like(Normals)
+	UnitNormals[InContact] = Normals[InContact]/Magnitudes[InContact, numpy.newaxis]
+
+	return Coordinates + WearSum[:, numpy.newaxis]*UnitNormals, UnitNormals, Magnitudes
+
+# Sources of the normals along which the sliding nodes wear: CNORMF of the frame, GEOMETRY (FacetNormals) or AUTO (CNORMF, GEOMETRY
+# for the nodes with a zero CNORMF and for frames without CNORMF)
+NORMAL_SOURCES = ('CNORMF', 'GEOMETRY', 'AUTO')
+
+# Corner nodes (positions in the connectivity) of the faces of the 3D continuum elements by number of corner nodes, quadratic elements
+# use their corner nodes, the orientation of the faces is set from the element centroid (FacetNormals)
+SOLID_ELEMENT_PREFIXES = ('C3D', 'DC3D', 'AC3D', 'SC6', 'SC8')
+SOLID_ELEMENT_CORNERS = {4: 4, 10: 4, 6: 6, 15: 6, 8: 8, 20: 8, 27: 8}
+SOLID_ELEMENT_FACES = {4: ((0, 1, 2), (0, 3, 1), (1, 3, 2), (2, 3, 0)),
+	6: ((0, 1, 2), (3, 5, 4), (0, 3, 4, 1), (1, 4, 5, 2), (2, 5, 3, 0)),
+	8: ((0, 1, 2, 3), (4, 7, 6, 5), (0, 4, 5, 1), (1, 5, 6, 2), (2, 6, 7, 3), (3, 7, 4, 0))}
+
+class FacetNormals:
+	# Area weighted normals of the sliding nodes from the element faces (facets) of instance which have all corner nodes in the node sets
+	# of SlidingNodesIndex and belong to one element only (faces on the surface). The facets are found and oriented once, into the body
+	# like CNORMF of a slave surface, the normals of a frame are array operations on the coordinates of the sliding nodes
+
+	def __init__(self, instance, SlidingNodesIndex):
+
+		self.NumberOfNodes = len(SlidingNodesIndex)
+
+		# Connectivity of the corner nodes of the solid elements, grouped by number of corner nodes
+		Corners = {}
+		for element in instance.elements:
+			if not element.type.startswith(SOLID_ELEMENT_PREFIXES) or len(element.connectivity) not in SOLID_ELEMENT_CORNERS:
+				continue
+			NumberOfCorners = SOLID_ELEMENT_CORNERS[len(element.connectivity)]
+			Corners.setdefault(NumberOfCorners, []).append(element.connectivity[:NumberOfCorners])
+
+		# Faces as 4 positions in the arrays of the sliding nodes (the last corner of a triangle is repeated) and the corner node
+		# labels of their elements
+		Faces = []
+		FaceElements = []
+		for NumberOfCorners, Connectivity in Corners.items():
+			Connectivity = numpy.array(Connectivity, dtype=numpy.int64)
+			Positions, InSet = SlidingNodesIndex.Positions(Connectivity.ravel())
+			Positions = Positions.reshape(Connectivity.shape)
+			InSet = InSet.reshape(Connectivity.shape)
+			for Face in SOLID_ELEMENT_FACES[NumberOfCorners]:
+				OnFace = InSet[:, Face].all(axis=1)
+				if OnFace.any():
+					Faces.append(Positions[OnFace][:, list(Face) + [Face[-1]]*(4 - len(Face))])
+					FaceElements.append(Connectivity[OnFace])
+
+		self.Faces = numpy.zeros((0, 4), dtype=numpy.int64)
+
+		if Faces:
+			# Undeformed coordinates of the nodes of the instance, sorted by label
+			Nodes = [(node.label, node.coordinates) for node in instance.nodes]
+			NodeLabels = numpy.array([label for label, coordinates in Nodes], dtype=numpy.int64)
+			NodeCoordinates = numpy.array([coordinates for label, coordinates in Nodes], dtype=numpy.float64).reshape(-1, 3)
+			Order = numpy.argsort(NodeLabels)
+			NodeLabels = NodeLabels[Order]
+			NodeCoordinates = NodeCoordinates[Order]
+
+			Faces = numpy.concatenate(Faces)
+			Centroids = numpy.concatenate([NodeCoordinates[numpy.searchsorted(NodeLabels, Elements)].mean(axis=1) for Elements in FaceElements])
+
+			# A face shared by two elements is inside the node sets, only the faces of one element are kept (triangles are compared by their 3 corners)
+			Keys = Faces.copy()
+			Keys[Faces[:, 2] == Faces[:, 3], 3] = -1
+			# Equal face keys are grouped by a lexicographic sort of the rows, a group starts where a row differs from the previous one
+			Keys = numpy.sort(Keys, axis=1)
+			Order = numpy.lexsort(Keys.T[::-1])
+			GroupStarts = numpy.concatenate(([True], (numpy.diff(Keys[Order], axis=0) != 0).any(axis=1)))
+			Groups = numpy.empty(len(Order), dtype=numpy.int64)
+			Groups[Order] = numpy.cumsum(GroupStarts) - 1
+			OnSurface = numpy.bincount(Groups)[Groups] == 1
+			Faces = Faces[OnSurface]
+			Centroids = Centroids[OnSurface]
+
+			# Faces are turned to point from the face towards the centroid of their element (into the body) in the undeformed mesh
+			Coordinates = NodeCoordinates[numpy.searchsorted(NodeLabels, SlidingNodesIndex.Labels)]
+			Outward = (self.FaceAreaVectors(Faces, Coordinates)*(Centroids - Coordinates[Faces].mean(axis=1))).sum(axis=1) < 0.0
+			Triangles = Faces[:, 2] == Faces[:, 3]
+			Faces[Outward & ~Triangles] = Faces[Outward & ~Triangles][:, [0, 3, 2, 1]]
+			Faces[Outward & Triangles] = Faces[Outward & Triangles][:, [1, 0, 2, 2]]
+
+			self.Faces = Faces
+
+		# A triangle adds its normal to its 3 corners only
+		self.CornerWeights = numpy.ones(self.Faces.shape)
+		self.CornerWeights[self.Faces[:, 2] == self.Faces[:, 3], 3] = 0.0
+
+	def FaceAreaVectors(self, Faces, Coordinates):
+		# Normal of every face with the face area as magnitude, half the cross product of the diagonals (of the edges of a triangle)
+		X = Coordinates[Faces]
+		return 0.5*numpy.cross(X[:, 2] - X[:, 0], X[:, 3] - X[:, 1])
+
+	def Normals(self, Coordinates):
+		# Normals (nodes, 3) of the sliding nodes at Coordinates (nodes, 3), the sum of the area vectors of the faces at each node,
+		# zero for nodes on no face
+		Coordinates = numpy.asarray(Coordinates, dtype=numpy.float64).reshape(self.NumberOfNodes, 3)
+		AreaVectors = self.FaceAreaVectors(self.Faces, Coordinates)
+
+		Normals = numpy.zeros((self.NumberOfNodes, 3))
+		for Corner in range(4):
+			for Component in range(3):
+				Normals[:, Component] = Normals[:, Component] + numpy.bincount(self.Faces[:, Corner],
+					weights=AreaVectors[:, Component]*self.CornerWeights[:, Corner], minlength=self.NumberOfNodes)
+
+		return Normals
+
+# Smoothing of the wear offsets of the sliding nodes (SurfaceSmoother), Taubin steps with the pass band of Taubin (1995), kPB = 0.1
+SMOOTHING_METHODS = ('NONE', 'LAPLACIAN', 'TAUBIN')
+SMOOTHING_LAMBDA = 0.5
+SMOOTHING_MU = -0.53
+
+class SurfaceSmoother:
+	# Laplacian or Taubin smoothing of values of the sliding nodes (nodes,) or (nodes, components) over the edges of the facets of
+	# a FacetNormals, every iteration moves each value towards the mean of its neighbours, nodes on no facet keep their values
+	# The adjacency is kept as two label aligned edge arrays, an iteration is a few bincounts (linear in the number of nodes)
+
+	def __init__(self, Facets, Method='TAUBIN', Iterations=5, Lambda=SMOOTHING_LAMBDA, Mu=SMOOTHING_MU):
+
+		if Method not in SMOOTHING_METHODS:
+			raise ValueError('Smoothing method must be '+', '.join(SMOOTHING_METHODS)+', got '+str(Method))
+
+		self.NumberOfNodes = Facets.NumberOfNodes
+		self.Method = Method
+		self.Iterations = int(Iterations)
+		self.Lambda = Lambda
+		self.Mu = Mu
+
+		# Edges of the faces in both directions as one key per edge (From x nodes + To), the repeated corner of a triangle gives no edge
+		Faces = numpy.asarray(Facets.Faces, dtype=numpy.int64)
+		From = numpy.concatenate([Faces[:, Corner] for Corner in range(4)])
+		To = numpy.concatenate([Faces[:, (Corner + 1) % 4] for Corner in range(4)])
+		Keys = numpy.sort(numpy.concatenate((From*self.NumberOfNodes + To, To*self.NumberOfNodes + From)))
+		Keys = Keys[numpy.concatenate(([True], Keys[1:] != Keys[:-1]))] if len(Keys) else Keys
+
+		self.From = Keys//max(self.NumberOfNodes, 1)
+		self.To = Keys % max(self.NumberOfNodes, 1)
+		self.From, self.To = self.From[self.From != self.To], self.To[self.From != self.To]
+
+		Degrees = numpy.bincount(self.From, minlength=self.NumberOfNodes).astype(numpy.float64)
+		self.HasNeighbours = (Degrees > 0.0).astype(numpy.float64)
+		self.InverseDegrees = numpy.zeros(self.NumberOfNodes)
+		self.InverseDegrees[Degrees > 0.0] = 1.0/Degrees[Degrees > 0.0]
+
+	def Laplacian(self, Values):
+		# Mean of the neighbours minus the value of every node, zero for nodes without neighbours
+		Laplacian = numpy.empty_like(Values)
+		for Component in range(Values.shape[1]):
+			NeighbourSums = numpy.bincount(self.From, weights=Values[self.To, Component], minlength=self.NumberOfNodes)
+			Laplacian[:, Component] = NeighbourSums*self.InverseDegrees - Values[:, Component]*self.HasNeighbours
+		return Laplacian
+
+	def Smooth(self, Values):
+		# Smoothed copy of Values, LAPLACIAN steps with Lambda, TAUBIN alternates Lambda and Mu steps (no shrinkage of the worn shape)
+		Values = numpy.asarray(Values, dtype=numpy.float64)
+
+		if self.Method == 'NONE' or not self.NumberOfNodes:
+			return Values.copy()
+
+		Smoothed = Values.reshape(self.NumberOfNodes, -1)
+
+		for Iteration in range(self.Iterations):
+			Smoothed = Smoothed + self.Lambda*self.Laplacian(Smoothed)
+			if self.Method == 'TAUBIN':
+				Smoothed = Smoothed + self.Mu*self.Laplacian(Smoothed)
+
+		return Smoothed.reshape(Values.shape)
+
+def PatchInpNodes(TemplateInpName, PatchedInpName, Labels, Displacements, WornLabels=(), WornCoordinates=()):
+	# Writes the template INP with the nodes of Labels moved by their rows of Displacements and the nodes of WornLabels
+	# set to their rows of WornCoordinates, returns the number of node lines patched
+
+	Displacements = numpy.asarray(Displacements, dtype=numpy.float64).reshape(len(Labels), 3)
+	DisplacementRow = dict(zip(numpy.asarray(Labels).tolist(), range(len(Labels))))
+	Worn = dict(zip(numpy.asarray(WornLabels).tolist(), numpy.asarray(WornCoordinates, dtype=numpy.float64).reshape(len(WornLabels), 3).tolist()))
+
+	def NodeLine(Label, Values):
+		Coordinates = [float(value) for value in Values[:3] if value.strip()]
+
+		if Label in Worn:
+			Coordinates = Worn[Label][:len(Coordinates)]
+		else:
+			Displacement = Displacements[DisplacementRow[Label]]
+			Coordinates = [Coordinates[i] + Displacement[i] for i in range(len(Coordinates))]
+
+		return str(Label) + ''.join(INP_COORDINATE_FORMAT % value for value in Coordinates)
+
+	PatchedLabels = set(DisplacementRow)
+	PatchedLabels.update(Worn)
+
+	return RewriteInpNodeBlocks(TemplateInpName, PatchedInpName, PatchedLabels, NodeLine)
+
+def WearPairs(NodeSetNames, kDs):
+	# (node set name, kD) of the contact pairs, one kD is used for all node sets
+	NodeSetNames = list(NodeSetNames)
+	kDs = [float(kD) for kD in kDs]
+
+	if len(kDs) == 1:
+		kDs = kDs*len(NodeSetNames)
+
+	if not NodeSetNames or len(kDs) != len(NodeSetNames):
+		raise ValueError('Enter one kD or one kD per node set, got '+str(len(kDs))+' kD for '+str(len(NodeSetNames))+' node sets')
+	if len(set(NodeSetNames)) != len(NodeSetNames):
+		raise ValueError('Every node set can be entered once, got '+', '.join(NodeSetNames))
+
+	return list(zip(NodeSetNames, kDs))
+
+class WornFrameSession:
+	# Worn nodes and worn INP of the frames of the wearing step of odb (which can be opened read only)
+	# NodeSetNames is a node set name or a list of node sets of the instance, the sliding nodes are the union of their nodes
+	# TEMPLATE moves all nodes of JobName.inp to the deformed shape of the frame, INCLUDE writes only the worn sliding nodes
+	# (split JobName.inp with SplitInpAtNodes first), CAE writes no INP (PartFromOdb needs the CAE kernel of the caller)
+	# NormalSource is one of NORMAL_SOURCES, the facets of GEOMETRY and AUTO are found once for all frames
+	# Smoothing is one of SMOOTHING_METHODS, the wear offsets of the sliding nodes are smoothed over the facets with SmoothingIterations
+
+	def __init__(self, odb, InstanceName, NodeSetNames, StepName, JobName, WornInpMode, NormalSource='CNORMF', Smoothing='NONE', SmoothingIterations=5):
+
+		if NormalSource not in NORMAL_SOURCES:
+			raise ValueError('Normal source must be '+', '.join(NORMAL_SOURCES)+', got '+str(NormalSource))
+
+		if not isinstance(NodeSetNames, (list, tuple)):
+			NodeSetNames = [NodeSetNames]
+
+		instance = odb.rootAssembly.instances[InstanceName]
+		NodeSets = [instance.nodeSets[NodeSetName] for NodeSetName in NodeSetNames]
+
+		self.instance = instance
+		self.InstanceName = InstanceName
+		self.NodeSetNames = list(NodeSetNames)
+		self.StepName = StepName
+		self.JobName = JobName
+		self.WornInpMode = WornInpMode
+		self.NormalSource = NormalSource
+		self.Smoothing = Smoothing
+		self.SmoothingIterations = SmoothingIterations
+
+		self.step = odb.steps[StepName]
+
+		# Labels of the node sets are indexed once, COORD and CNORMF of every frame are scattered into arrays aligned to these labels
+		# Every node set is read as its own region, nodes shared by several sets are read again with the same values
+		self.SlidingNodesIndex = NodeSetLabelIndex(NodeSets)
+
+		if NormalSource != 'CNORMF' or Smoothing != 'NONE':
+			self.SurfaceNormals = FacetNormals(instance, self.SlidingNodesIndex)
+
+		self.Smoother = None
+		if Smoothing != 'NONE':
+			self.Smoother = SurfaceSmoother(self.SurfaceNormals, Smoothing, SmoothingIterations)
+
+		# All nodes of the instance for the displacements of the TEMPLATE mode
+		if WornInpMode == 'TEMPLATE':
+			self.InstanceNodesIndex = NodeSetLabelIndex(instance)
+
+		# Coordinates of the sliding nodes in JobName.inp, the worn nodes of the INCLUDE mode are moved from these by their wear
+		if WornInpMode == 'INCLUDE':
+			SlidingNodes = [(node.label, node.coordinates) for NodeSet in NodeSets for node in NodeSet.nodes]
+			self.UndeformedCoordinates = numpy.zeros((len(self.SlidingNodesIndex), 3))
+			self.UndeformedCoordinates[self.SlidingNodesIndex.Positions([label for label, coordinates in SlidingNodes])[0]] = [coordinates for label, coordinates in SlidingNodes]
+
+	def NodeSetView(self, NodeSetName):
+		# Positions of the nodes of one of the node sets in the arrays of the sliding nodes
+		return self.SlidingNodesIndex.View(self.instance.nodeSets[NodeSetName])
+
+	def WornInpName(self, FrameIndex):
+		return self.JobName+'Step'+self.StepName+'AtFrame'+str(FrameIndex)+'WithWear.inp'
+
+	def WornNodes(self, FrameIndex, WearSum):
+		# Labels, wear sums, CNORMF, CNORMF magnitudes, unit normals, coordinates and worn coordinates of the sliding nodes having COORD
+		# in the frame (see WornCoordinates), in the order of the arguments of WearStatisticsLog.Add, WearSum is the wear sum of all pairs
+		frame = self.step.frames[FrameIndex]
+
+		Coordinates, HasCoordinates = self.SlidingNodesIndex.ScatterFieldWithMask(frame, 'COORD', 3)
+		Normals = self.Normals(frame, Coordinates)
+
+		NewCoordinates, UnitNormals, NormalMagnitudes = WornCoordinates(Coordinates, WearSum, Normals)
+
+		if self.Smoother is not None:
+			NewCoordinates = Coordinates + self.Smoother.Smooth(NewCoordinates - Coordinates)
+
+		return tuple(Array[HasCoordinates] for Array in (self.SlidingNodesIndex.Labels, WearSum, Normals, NormalMagnitudes, UnitNormals,
+			Coordinates, NewCoordinates))
+
+	def Normals(self, frame, Coordinates):
+		# Normals (nodes, 3) of the sliding nodes in the frame, CNORMF or the area weighted normals of the facets at Coordinates
+		if self.NormalSource == 'GEOMETRY' or (self.NormalSource == 'AUTO' and 'CNORMF' not in frame.fieldOutputs.keys()):
+			return self.SurfaceNormals.Normals(Coordinates)
+
+		Normals = self.SlidingNodesIndex.ScatterField(frame, 'CNORMF', 3)
+
+		if self.NormalSource == 'AUTO':
+			NoNormal = ~(Normals != 0.0).any(axis=1)
+			if NoNormal.any():
+				Normals[NoNormal] = self.SurfaceNormals.Normals(Coordinates)[NoNormal]
+
+		return Normals
+
+	def WriteWornInp(self, FrameIndex, Worn):
+		# Worn INP of the frame from the worn nodes of WornNodes
+		Labels, Coordinates, NewCoordinates = Worn[0], Worn[5], Worn[6]
+
+		if self.WornInpMode == 'TEMPLATE':
+			Displacements = self.InstanceNodesIndex.ScatterField(self.step.frames[FrameIndex], 'U', 3)
+			PatchInpNodes(self.JobName+'.inp', self.WornInpName(FrameIndex), self.InstanceNodesIndex.Labels, Displacements, Labels, NewCoordinates)
+
+		elif self.WornInpMode == 'INCLUDE':
+			UndeformedWornCoordinates = self.UndeformedCoordinates[self.SlidingNodesIndex.Positions(Labels)[0]] + NewCoordinates - Coordinates
+			WriteWornNodesInclude(self.WornInpName(FrameIndex), self.JobName+'WornMeshHead.inp', self.JobName+'WornMeshTail.inp', Labels,
+				UndeformedWornCoordinates)
+
+	def EvaluateFrame(self, FrameIndex, WearSum):
+		Worn = self.WornNodes(FrameIndex, WearSum)
+		self.WriteWornInp(FrameIndex, Worn)
+		return Worn
+
+WorkerSession = None
+
+def InitialiseWornFrameWorker(OdbName, InstanceName, NodeSetNames, StepName, JobName, WornInpMode, NormalSource, Smoothing, SmoothingIterations):
+	# Each worker process opens its own read only handle of the ODB
+	global WorkerSession
+	WorkerSession = WornFrameSession(openOdb(path=OdbName, readOnly=True), InstanceName, NodeSetNames, StepName, JobName, WornInpMode, NormalSource,
+		Smoothing, SmoothingIterations)
+
+def EvaluateFrameInWorker(Arguments):
+	FrameIndex, WearSum = Arguments
+	return FrameIndex, WorkerSession.EvaluateFrame(FrameIndex, WearSum)
+
+def EvaluateFrames(Session, OdbName, Frames, NumberOfProcesses=1):
+	# Frame index and worn nodes of the (frame index, wear sum) pairs of Frames in order, the worn INPs are written by the session
+	# or, if NumberOfProcesses > 1, by worker processes with their own session on OdbName
+	if NumberOfProcesses <= 1 or len(Frames) < 2:
+		for FrameIndex, WearSum in Frames:
+			yield FrameIndex, Session.EvaluateFrame(FrameIndex, WearSum)
+		return
+
+	NumberOfProcesses = min(NumberOfProcesses, len(Frames))
+
+	Pool = multiprocessing.Pool(processes=NumberOfProcesses, initializer=InitialiseWornFrameWorker,
+		initargs=(OdbName, Session.InstanceName, Session.NodeSetNames, Session.StepName, Session.JobName, Session.WornInpMode, Session.NormalSource,
+		Session.Smoothing, Session.SmoothingIterations))
+
+	try:
+		for Result in Pool.imap(EvaluateFrameInWorker, Frames):
+			yield Result
+	finally:
+		Pool.terminate()
+		Pool.join()
@@ -11,18 +11,48 @@ The workflow implemented in the script is as follows:
 
 1. For a model, the script obtains results of contact pressure and slip for the required contact pair from the ODB
 2. Using these outputs, the script calculates Archad's wear using the input dimensional Archard wear coefficient and stores it as field output
+   (ARCHARDWEAR and ARCHARDWEARSUM, the slip increment and averaged pressure fields are written only if requested)
+   in a copy of the ODB (JobName+WithWearCalculation.odb) or in SIDECAR mode together with the worn coordinates in JobName+WearResults.npz
+   and JobName+WearResults.records (read them with ReadWearResults in ArchardWearEngine.py), then the ODB is not copied.
+   The wear of a frame is kD x trapezoidal integral of CPRESS x slip rate over the time increment of the frame (TRAPEZOIDAL), the time increment
+   cancels and the wear is kD x averaged CPRESS x slip increment. LEGACY integration gives the wear of REV-13 and earlier (averaged CPRESS x slip
+   of every frame divided by the time increment of the last frame of the step), see note 11
 3. The script then imports the final ODB as an input file, edits the input file for those nodes by subtracting calculated wear in the required direction (along normal direction using CNORMF)
    hence creating a new input file with wear included. The user will have to import Stress results from original ODB if further analysis is to be performed.
+   In TEMPLATE mode the worn input files are written from the original INP (JobName.inp) by moving its nodes to the DEFORMED shape of the frame
+   and the sliding nodes to their worn coordinates (ArchardWearEngine.py), in CAE mode they are written with PartFromOdb and writeInput.
+   In INCLUDE mode JobName.inp is split once after its nodes (JobName+WornMeshHead.inp and JobName+WornMeshTail.inp) and the worn input file
+   of a frame only includes them and a file with the sliding nodes moved by their wear (...WithWearNodes.inp), the other nodes keep their
+   coordinates of JobName.inp. Abaqus uses the last definition of a node defined more than once.
 
 PROCEDURE:
 1. You should have the ODB and INP in the same folder
 2. Enter required inputs below as shown
 3. Open Abaqus CAE and go to File > Run Script > Locate the script and run
    OR go to command line and go to directory where ODB and INP exisits and run abq2020 cae nogui=Script.py
+   OR for TEMPLATE mode enter the inputs in INPUTS-ARCHARD-WEAR-SCRIPT.csv and run abq2020 python Script.py (no CAE license token is needed)
 
 NOTES:
 1. You can test the script with attached Blocks.inp or BallJoint.inp after submitting the job and obtaining the ODB
-2. You should have COORD, CDISP, CPRESS and CNORMF field outputs requested for script to work
+2. You should have COORD, CDISP, CPRESS and CNORMF field outputs requested for script to work (CNORMF is not needed with GEOMETRY normals)
+3. OdbArrayTools.py, ArchardWearEngine.py and ScriptProfiler.py should be in the same folder as this script
+4. TEMPLATE mode needs the orphan mesh INP from which the ODB was run (JobName.inp), the ODB must have U field output
+5. The statistics of the worn nodes are written to StatisticsSummary.csv (one row per frame) and, depending on the verbosity input,
+   Statistics.csv (NODES, one row per node and frame) or Statistics.txt (TEXT, node by node text of earlier revisions)
+6. INCLUDE mode also needs JobName.inp, keep the head, tail and nodes files in the folder of the worn input files
+7. With more than 1 worker process the wear sums of the worn frames are kept in memory until the end of the step, then the worn INPs
+   of the frames are written by worker processes, each with its own read only handle of JobName.odb (run with abq2018 python on Linux)
+8. Several node sets of contact pairs of the instance can be entered, each with its own kD. The frames are read once for all of them.
+   The wear fields of a pair are named FieldName_NodeSetName (sidecar JobName+WearResults_NodeSetName), the worn INPs and the statistics
+   are written once for all pairs, nodes in several node sets are moved by the sum of their wear
+9. GEOMETRY normals are the area weighted normals of the 3D solid element faces of the node sets (FacetNormals in ArchardWearEngine.py),
+   AUTO uses them for the nodes with zero CNORMF and the frames without CNORMF. The CNORMF columns of the statistics then hold the
+   area weighted normals
+10. LAPLACIAN or TAUBIN smoothing moves the wear offset of every sliding node towards the mean of its neighbours on the element faces of the
+    node sets (SurfaceSmoother in ArchardWearEngine.py), the worn surface stays smooth with larger wear increments. TAUBIN does not shrink it
+11. The default time integration is TRAPEZOIDAL since REV-14, it was LEGACY before. INPUTS-ARCHARD-WEAR-SCRIPT.csv files of REV-13 and earlier
+    have no time integration row and now give TRAPEZOIDAL wear, which differs from the ARCHARDWEAR of those revisions by the time increment
+    of the last frame of the step. Enter LEGACY to reproduce the results of earlier revisions
 
 Revision history:
 REV-00: 1st June 2018: First release
@@ -31,6 +61,25 @@ REV-02: 10th July 2020: Modified workflow for moving wear direction
 REV-03: 11th July 2020: House-keeping, fixed some bugs, refined moving direction wear implementation
 REV-04: 9th March 2022: Added increment time to wear calculation
 REV-05: 10th March 2022: Some house-keeping
+REV-06: 18th October 2026: CSLIP and CPRESS fields are scattered into label aligned arrays with NodeSetLabelIndex (OdbArrayTools.py)
+REV-07: 18th October 2026: addData payloads are built from arrays with AddDataPayload instead of tuple concatenation
+REV-08: 18th October 2026: Per-phase wall time, CPU time and peak memory with ScriptProfiler.py (set SCRIPT_PROFILE_FILE)
+REV-09: 18th October 2026: Runs with python 3 and without a license with the FakeAbaqus package (abaqus module imported before getInputs)
+REV-10: 18th October 2026: TEMPLATE mode writes the worn INPs by patching the *Node blocks of JobName.inp (ArchardWearEngine.py), runs with abaqus python
+REV-11: 18th October 2026: Worn coordinates of all sliding nodes are computed from label aligned COORD, CNORMF and ARCHARDWEARSUM arrays (no getSubset per node)
+REV-12: 18th October 2026: Wear is integrated in memory in one pass over the frames (ArchardWearIntegrator), intermediate fields are optional
+REV-13: 18th October 2026: SIDECAR mode writes the wear results to a columnar binary file (WearResultsSidecar) instead of a copy of the ODB
+REV-14: 18th October 2026: Wear of each frame is integrated over its own time increment (TRAPEZOIDAL), LEGACY keeps the wear of earlier revisions
+REV-15: 18th October 2026: CAE mode patches the INP of writeInput with PatchInpNodes (buffered, label lookup in arrays), no before/after lines per node in Statistics.txt
+REV-16: 18th October 2026: INCLUDE mode writes only the worn sliding nodes of a frame to an include file of a small master INP
+REV-17: 18th October 2026: Statistics of the worn nodes are written in bulk per frame to Statistics.csv (one row per node and frame), StatisticsSummary.csv or Statistics.txt
+REV-18: 18th October 2026: Worn nodes and worn INPs of the frames can be written by worker processes (WornFrameSession and EvaluateFrames)
+REV-19: 18th October 2026: Wear of several node sets (contact pairs) with their own kD in one pass over the frames, instance name is an input
+REV-20: 18th October 2026: Nodes can wear along area weighted normals of the element faces (GEOMETRY or AUTO) instead of CNORMF
+REV-21: 18th October 2026: Optional LAPLACIAN or TAUBIN smoothing of the wear offsets of the sliding nodes
+REV-22: 18th October 2026: TRAPEZOIDAL wear does not drop frames slipping at a repeated time, note 11 on the change of the default from LEGACY
+REV-23: 18th October 2026: All enumerated inputs are checked before the ODB is copied
+REV-24: 18th October 2026: The addData labels of every pair are built once, only the data is built per field and frame
 
 Author:
 Ranjit Gopi
@@ -39,19 +88,101 @@ Simulia India Support Frontdesk:+91 44 43443000
 Simulia India Support Email: simulia.in.support@3ds.com
 """
 
+try:
+    from abaqus import*
+    CAEKernel = True
+except ImportError:
+    # abaqus python, there is no getInputs and no mdb, the inputs are read from INPUTS-ARCHARD-WEAR-SCRIPT.csv
+    CAEKernel = False
+from abaqusConstants import *
+from odbAccess import *
+import csv
+from shutil import copyfile
+import numpy
+from OdbArrayTools import AddDataFromArray
+from ArchardWearEngine import PatchInpNodes, SplitInpAtNodes, ArchardWearIntegrator, WearResultsSidecar, WearStatisticsLog
+from ArchardWearEngine import WornFrameSession, EvaluateFrames, WearPairs
+from ArchardWearEngine import ARCHARD_CONTACT_FIELD_NAMES, ARCHARD_WEAR_FIELDS, ARCHARD_INTERMEDIATE_FIELDS
+from ArchardWearEngine import ARCHARD_TIME_INTEGRATIONS, STATISTICS_VERBOSITIES, NORMAL_SOURCES, SMOOTHING_METHODS
+from ScriptProfiler import ScriptProfiler
+
 #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~OBTAIN INPUTS HERE~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
-x = getInputs((('Enter INP OR ODB NAME', 'JobName'),
-               ('Enter Step Name for which wear is to be calculated', 'StepName'),
-               ('Enter ALL for wear to be calculated for all frames or LAST for calculation for only last frame of step', 'ALL'),
-               ('Enter Node set of contact pair for which wear is to be calculated', 'NodeSetName'),
-               ('Enter kd, Dimensional Archard wear coefficient mm2/N', 'kD'),
-               ))
+if CAEKernel:
+    x = getInputs((('Enter INP OR ODB NAME', 'JobName'),
+                   ('Enter Step Name for which wear is to be calculated', 'StepName'),
+                   ('Enter ALL for wear to be calculated for all frames or LAST for calculation for only last frame of step', 'ALL'),
+                   ('Enter Node sets of contact pairs for which wear is to be calculated (separated by comma)', 'NodeSetName'),
+                   ('Enter kd, Dimensional Archard wear coefficient mm2/N (one for all node sets or one per node set, separated by comma)', 'kD'),
+                   ('Enter TEMPLATE to write worn INPs from JobName.inp, CAE to write them with PartFromOdb or INCLUDE to write only the worn nodes', 'TEMPLATE'),
+                   ('Enter YES to also write CSLIP1DELTA, CSLIP2DELTA, RESULTANTCSLIPDELTA and CPRESS_AVERAGED fields to the ODB', 'NO'),
+                   ('Enter ODB to write wear fields to a copy of the ODB or SIDECAR to write them to JobName+WearResults.npz/.records', 'ODB'),
+                   ('Enter TRAPEZOIDAL to integrate wear over the time increment of each frame or LEGACY for the wear of REV-13 and earlier (default before REV-14)', 'TRAPEZOIDAL'),
+                   ('Enter NONE, SUMMARY, NODES (Statistics.csv) or TEXT (Statistics.txt of REV-16 and earlier) for the statistics of the worn nodes', 'NODES'),
+                   ('Enter number of worker processes for the worn INPs of the frames (TEMPLATE and INCLUDE modes)', '1'),
+                   ('Enter instance name of the node sets', 'PART-1-1'),
+                   ('Enter CNORMF, GEOMETRY (area weighted normals of the element faces of the node sets) or AUTO (GEOMETRY where CNORMF is zero or missing)', 'CNORMF'),
+                   ('Enter NONE, LAPLACIAN or TAUBIN smoothing of the wear offsets of the sliding nodes', 'NONE'),
+                   ('Enter number of smoothing iterations', '5'),
+                   ))
+else:
+    # Reading all the input values from a csv file, same order as the getInputs fields above
+    with open('INPUTS-ARCHARD-WEAR-SCRIPT.csv', 'r') as f:
+        x = [row[1].strip() if len(row) > 1 else '' for row in csv.reader(f)]
 
 JobName=x[0]
 WearingStepName=x[1]
-FramesForWhichWearToBeCalculated=x[2]
-NodeSetName=x[3]
-kD=float(x[4])
+FramesForWhichWearToBeCalculated=x[2].upper()
+NodeSetNames=[each.strip() for each in x[3].split(',') if each.strip()]
+kDs=[each.strip() for each in x[4].split(',') if each.strip()]
+WornInpMode='TEMPLATE'
+if len(x) > 5 and x[5]:
+    WornInpMode=x[5].upper()
+if WornInpMode not in ('TEMPLATE', 'CAE', 'INCLUDE') or (WornInpMode == 'CAE' and not CAEKernel):
+    raise ValueError('Worn INP mode must be TEMPLATE, CAE or INCLUDE (CAE needs abaqus cae), got '+WornInpMode)
+WriteIntermediateFields = len(x) > 6 and x[6].upper() == 'YES'
+WearOutputMode='ODB'
+if len(x) > 7 and x[7]:
+    WearOutputMode=x[7].upper()
+if WearOutputMode not in ('ODB', 'SIDECAR'):
+    raise ValueError('Wear output mode must be ODB or SIDECAR, got '+WearOutputMode)
+TimeIntegration='TRAPEZOIDAL'
+if len(x) > 8 and x[8]:
+    TimeIntegration=x[8].upper()
+StatisticsVerbosity='NODES'
+if len(x) > 9 and x[9]:
+    StatisticsVerbosity=x[9].upper()
+NumberOfProcesses=1
+if len(x) > 10 and x[10]:
+    NumberOfProcesses=int(x[10])
+if NumberOfProcesses > 1 and WornInpMode == 'CAE':
+    raise ValueError('CAE mode writes the worn INPs with the CAE kernel of this process, enter 1 process or TEMPLATE or INCLUDE mode')
+InstanceName='PART-1-1' #ANY ORPHAN INPUT FILE CREATED BY ANSA OR HYPERMESH WILL HAVE DEFAULT INSTANCE NAME PART-1-1 IN ABAQUS
+if len(x) > 11 and x[11]:
+    InstanceName=x[11].upper()
+NormalSource='CNORMF'
+if len(x) > 12 and x[12]:
+    NormalSource=x[12].upper()
+Smoothing='NONE'
+if len(x) > 13 and x[13]:
+    Smoothing=x[13].upper()
+SmoothingIterations=5
+if len(x) > 14 and x[14]:
+    SmoothingIterations=int(x[14])
+
+# Enumerated inputs are checked before the ODB is copied, a typo in the inputs fails at once and not after the copy of a large ODB
+for InputName, InputValue, AllowedValues in (('Frames', FramesForWhichWearToBeCalculated, ('ALL', 'LAST')),
+        ('Intermediate fields', x[6].upper() if len(x) > 6 and x[6] else 'NO', ('YES', 'NO')),
+        ('Time integration', TimeIntegration, ARCHARD_TIME_INTEGRATIONS),
+        ('Statistics verbosity', StatisticsVerbosity, STATISTICS_VERBOSITIES),
+        ('Normal source', NormalSource, NORMAL_SOURCES),
+        ('Smoothing method', Smoothing, SMOOTHING_METHODS)):
+    if InputValue not in AllowedValues:
+        raise ValueError(InputName+' must be '+', '.join(AllowedValues)+', got '+InputValue)
+if NumberOfProcesses < 1 or SmoothingIterations < 0:
+    raise ValueError('Number of processes must be at least 1 and smoothing iterations at least 0, got '+str(NumberOfProcesses)+' and '+str(SmoothingIterations))
+
+# (node set, kD) of every contact pair, the wear of all pairs is calculated in one pass over the frames
+Pairs=WearPairs(NodeSetNames, kDs)
 #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~INPUTS~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
 
 #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~ENTER INPUTS OLD DO NOT USE~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
@@ -62,344 +193,143 @@ kD=float(x[4])
 #kD=1e-5                                  #Dimensional Archard wear coefficient mm2/N
 #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~ENTER INPUTS OLD DO NOT USE~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
 
-from abaqus import*
-from abaqusConstants import *
-from odbAccess import *
-import os
-from shutil import copyfile
-import math
-
-def StatisticsPrintToFile1():
-    with open('Statistics.txt', 'w') as myfile:
-    	myfile.write( "" + '\n')
-    	myfile.close
-
-def StatisticsPrintToFile2():
-    with open('Statistics.txt', 'a') as myfile:
-        myfile.write( "node label=" +str(NodeLabel) + '\n')
-        myfile.write("WEAR SUM=" + str(WEARSUM.getSubset(region=NodeOfInterest).values[0].data) + '\n')
-        myfile.write("CNORMF Direction Magnitude=" +str(CNORMFMAGNITUDE) + '\n')
-        myfile.write("CNORMF Direction X Component=" +str(CNORMFX) + '\n')
-        myfile.write("CNORMF Direction X Unit Vector=" + str(CNORMFDirectionXUnitVector) + '\n')
-        myfile.write("Old X Coordinate=" + str(COORDINATES.getSubset(region=NodeOfInterest).values[0].data[0]) + '\n')
-        myfile.write("New X Coordinate=" + str(NewCOORDINATES1) + '\n')
-        myfile.write("CNORMF Direction Y Component=" +str(CNORMFY) + '\n')
-        myfile.write("CNORMF Direction Y Unit Vector=" + str(CNORMFDirectionYUnitVector) + '\n')
-        myfile.write("Old Y Coordinate=" + str(COORDINATES.getSubset(region=NodeOfInterest).values[0].data[1]) + '\n')
-        myfile.write("New Y Coordinate=" + str(NewCOORDINATES2) + '\n')
-        myfile.write("CNORMF Direction Z Component=" +str(CNORMFZ) + '\n')
-        myfile.write("CNORMF Direction Z Unit Vector=" + str(CNORMFDirectionZUnitVector) + '\n')
-        myfile.write("Old Z Coordinate=" + str(COORDINATES.getSubset(region=NodeOfInterest).values[0].data[2]) + '\n')
-        myfile.write("New Z Coordinate=" + str(NewCOORDINATES3) + '\n')
-        myfile.close
-
-def StatisticsPrintToFile3():
-    with open('Statistics.txt', 'a') as myfile:
-    	myfile.write("before values"+str(line) + '\n')
-        myfile.write("after values"+str(line_list) + '\n')
-    	myfile.close
-
-StatisticsPrintToFile1()
-
-copyfile(JobName+'.odb',JobName+'WithWearCalculation.odb')
-
-originalodb=openOdb(path=JobName+'.odb', readOnly=True)
-
-odb = openOdb(path=JobName+'WithWearCalculation.odb', readOnly=False)
-
-NodeSetOfSlidingNodes = odb.rootAssembly.instances['PART-1-1'].nodeSets[NodeSetName]
-nodeLabelData=()
-for node in (NodeSetOfSlidingNodes.nodes):
-    nodeLabelData=nodeLabelData+(node.label,)
-
-step=odb.steps[WearingStepName]
-NumberOfFrames=len(step.frames)
-
-for firstindex in range(1,NumberOfFrames):
-
-    currentFramei=step.frames[firstindex]
-    currentFrameiMinusOne=step.frames[firstindex-1]
-
-    IncrementTimeDelta=currentFramei.frameValue - currentFrameiMinusOne.frameValue
-
-    CSLIP1iNodeList=[]
-    CSLIP1iList=[]
-    CSLIP1iListFinal=[]
-
-    CSLIP2iNodeList=[]
-    CSLIP2iList=[]
-    CSLIP2iListFinal=[]
-
-    CSLIP1iMinusOneNodeList=[]
-    CSLIP1iMinusOneList=[]
-    CSLIP1iMinusOneListFinal=[]
-
-    CSLIP2iMinusOneNodeList=[]
-    CSLIP2iMinusOneList=[]
-    CSLIP2iMinusOneListFinal=[]
-
-    CPRESSiNodeList=[]
-    CPRESSiList=[]
-    CPRESSiListFinal=[]
-
-    CPRESSiMinusOneNodeList=[]
-    CPRESSiMinusOneList=[]
-    CPRESSiMinusOneListFinal=[]
-
-    CSLIP1i =   currentFramei.fieldOutputs['CSLIP1'].getSubset(region=NodeSetOfSlidingNodes)
-    for value in (CSLIP1i.values):
-        CSLIP1iNodeList.append(value.nodeLabel)
-        CSLIP1iList.append(value.data)
-
-    CSLIP1iDictUnSorted = {}
-
-    for secondindex in range(len(CSLIP1iNodeList)):
-            CSLIP1iDictUnSorted[CSLIP1iNodeList[secondindex]] = CSLIP1iList[secondindex]
-
-    for node in (NodeSetOfSlidingNodes.nodes):
-        if node.label not in CSLIP1iDictUnSorted.keys():
-            CSLIP1iDictUnSorted[node.label]=0.0
-
-    CSLIP1iListofDict=list(CSLIP1iDictUnSorted.items())
-    CSLIP1iListofDict.sort()
-
-    for secondindex in range(len(CSLIP1iListofDict)):
-        CSLIP1iListFinal.append(CSLIP1iListofDict[secondindex][1])
-
-    CSLIP1iMinusOne =   currentFrameiMinusOne.fieldOutputs['CSLIP1'].getSubset(region=NodeSetOfSlidingNodes)
-    for value in (CSLIP1iMinusOne.values):
-        CSLIP1iMinusOneNodeList.append(value.nodeLabel)
-        CSLIP1iMinusOneList.append(value.data)
-
-    CSLIP1iMinusOneDictUnSorted = {}
-
-    for secondindex in range(len(CSLIP1iMinusOneNodeList)):
-            CSLIP1iMinusOneDictUnSorted[CSLIP1iMinusOneNodeList[secondindex]] = CSLIP1iMinusOneList[secondindex]
-
-    for node in (NodeSetOfSlidingNodes.nodes):
-        if node.label not in CSLIP1iMinusOneDictUnSorted.keys():
-            CSLIP1iMinusOneDictUnSorted[node.label]=0.0
-
-    CSLIP1iMinusOneListofDict=list(CSLIP1iMinusOneDictUnSorted.items())
-    CSLIP1iMinusOneListofDict.sort()
-
-    for secondindex in range(len(CSLIP1iMinusOneListofDict)):
-        CSLIP1iMinusOneListFinal.append(CSLIP1iMinusOneListofDict[secondindex][1])
-
-    CSLIP1DELTA=map(lambda x,y: x-y, CSLIP1iListFinal,CSLIP1iMinusOneListFinal)
-
-    CSLIP1DELTATuple=()
-    for secondindex in range(len(CSLIP1DELTA)):
-        CSLIP1DELTATuple=CSLIP1DELTATuple+((CSLIP1DELTA[secondindex],),)
-
-    CSLIP2i =   currentFramei.fieldOutputs['CSLIP2'].getSubset(region=NodeSetOfSlidingNodes)
-    for value in (CSLIP2i.values):
-        CSLIP2iNodeList.append(value.nodeLabel)
-        CSLIP2iList.append(value.data)
-
-    CSLIP2iDictUnSorted = {}
-
-    for secondindex in range(len(CSLIP2iNodeList)):
-            CSLIP2iDictUnSorted[CSLIP2iNodeList[secondindex]] = CSLIP2iList[secondindex]
-
-    for node in (NodeSetOfSlidingNodes.nodes):
-        if node.label not in CSLIP2iDictUnSorted.keys():
-            CSLIP2iDictUnSorted[node.label]=0.0
-
-    CSLIP2iListofDict=list(CSLIP2iDictUnSorted.items())
-    CSLIP2iListofDict.sort()
-
-    for secondindex in range(len(CSLIP2iListofDict)):
-        CSLIP2iListFinal.append(CSLIP2iListofDict[secondindex][1])
-
-    CSLIP2iMinusOne =   currentFrameiMinusOne.fieldOutputs['CSLIP2'].getSubset(region=NodeSetOfSlidingNodes)
-    for value in (CSLIP2iMinusOne.values):
-        CSLIP2iMinusOneNodeList.append(value.nodeLabel)
-        CSLIP2iMinusOneList.append(value.data)
-
-    CSLIP2iMinusOneDictUnSorted = {}
-
-    for secondindex in range(len(CSLIP2iMinusOneNodeList)):
-            CSLIP2iMinusOneDictUnSorted[CSLIP2iMinusOneNodeList[secondindex]] = CSLIP2iMinusOneList[secondindex]
-
-    for node in (NodeSetOfSlidingNodes.nodes):
-        if node.label not in CSLIP2iMinusOneDictUnSorted.keys():
-            CSLIP2iMinusOneDictUnSorted[node.label]=0.0
-
-    CSLIP2iMinusOneListofDict=list(CSLIP2iMinusOneDictUnSorted.items())
-    CSLIP2iMinusOneListofDict.sort()
-
-    for secondindex in range(len(CSLIP2iMinusOneListofDict)):
-        CSLIP2iMinusOneListFinal.append(CSLIP2iMinusOneListofDict[secondindex][1])
-
-    CSLIP2DELTA=map(lambda x,y: x-y, CSLIP2iListFinal,CSLIP2iMinusOneListFinal)
-
-    CSLIP2DELTATuple=()
-    for secondindex in range(len(CSLIP2DELTA)):
-        CSLIP2DELTATuple=CSLIP2DELTATuple+((CSLIP2DELTA[secondindex],),)
-
-    RESULTANTCSLIPDELTA=map(lambda x,y: math.sqrt((x**2)+(y**2)), CSLIP1DELTA, CSLIP2DELTA)
+def RecordWornNodes(frameindex, Worn):
+    # Statistics and sidecar worn coordinates of the worn nodes of a frame (see WornFrameSession.WornNodes in ArchardWearEngine.py)
+    StatisticsLog.Add(frameindex, *Worn)
+    if WearOutputMode == 'SIDECAR':
+        for Sidecar in Sidecars:
+            Sidecar.SetWornCoordinates(Worn[0], Worn[6], frameindex)
 
-    RESULTANTCSLIPDELTATuple=()
-    for secondindex in range(len(RESULTANTCSLIPDELTA)):
-        RESULTANTCSLIPDELTATuple=RESULTANTCSLIPDELTATuple+((RESULTANTCSLIPDELTA[secondindex],),)
+# Statistics of the worn nodes are written in bulk per frame (WearStatisticsLog, ArchardWearEngine.py)
+StatisticsLog = WearStatisticsLog('Statistics', StatisticsVerbosity)
 
-    CPRESSi =   currentFramei.fieldOutputs['CPRESS'].getSubset(region=NodeSetOfSlidingNodes)
-    for value in (CPRESSi.values):
-        CPRESSiNodeList.append(value.nodeLabel)
-        CPRESSiList.append(value.data)
+# Phases are recorded in the file named by environment variable SCRIPT_PROFILE_FILE (see ScriptProfiler.py)
+Profiler = ScriptProfiler('ArchardWearIterator.py')
 
-    CPRESSiDictUnSorted = {}
+Profiler.Start('ODB COPY')
+if WearOutputMode == 'ODB':
+    copyfile(JobName+'.odb',JobName+'WithWearCalculation.odb')
+Profiler.Stop()
 
-    for secondindex in range(len(CPRESSiNodeList)):
-            CPRESSiDictUnSorted[CPRESSiNodeList[secondindex]] = CPRESSiList[secondindex]
-
-    for node in (NodeSetOfSlidingNodes.nodes):
-        if node.label not in CPRESSiDictUnSorted.keys():
-            CPRESSiDictUnSorted[node.label]=0.0
-
-    CPRESSiListofDict=list(CPRESSiDictUnSorted.items())
-    CPRESSiListofDict.sort()
-
-    for secondindex in range(len(CPRESSiListofDict)):
-        CPRESSiListFinal.append(CPRESSiListofDict[secondindex][1])
-
-    CPRESSiMinusOne =   currentFrameiMinusOne.fieldOutputs['CPRESS'].getSubset(region=NodeSetOfSlidingNodes)
-    for value in (CPRESSiMinusOne.values):
-        CPRESSiMinusOneNodeList.append(value.nodeLabel)
-        CPRESSiMinusOneList.append(value.data)
-
-    CPRESSiMinusOneDictUnSorted = {}
-
-    for secondindex in range(len(CPRESSiMinusOneNodeList)):
-            CPRESSiMinusOneDictUnSorted[CPRESSiMinusOneNodeList[secondindex]] = CPRESSiMinusOneList[secondindex]
-
-    for node in (NodeSetOfSlidingNodes.nodes):
-        if node.label not in CPRESSiMinusOneDictUnSorted.keys():
-            CPRESSiMinusOneDictUnSorted[node.label]=0.0
-
-    CPRESSiMinusOneListofDict=list(CPRESSiMinusOneDictUnSorted.items())
-    CPRESSiMinusOneListofDict.sort()
-
-    for secondindex in range(len(CPRESSiMinusOneListofDict)):
-        CPRESSiMinusOneListFinal.append(CPRESSiMinusOneListofDict[secondindex][1])
-
-    CPRESSAVERAGED=map(lambda x,y: 0.5*(x+y), CPRESSiListFinal,CPRESSiMinusOneListFinal)
-
-    CPRESSAVERAGEDTuple=()
-    for secondindex in range(len(CPRESSAVERAGED)):
-        CPRESSAVERAGEDTuple=CPRESSAVERAGEDTuple+((CPRESSAVERAGED[secondindex],),)
+Profiler.Start('ODB OPEN')
+originalodb=openOdb(path=JobName+'.odb', readOnly=True)
 
-    instance=odb.rootAssembly.instances['PART-1-1']
-    uField = currentFramei.FieldOutput(name='CSLIP1DELTA', description='DIFFERENCE IN CSLIP1 FROM CURRENT FRAME AND PREVIOUS FRAME', type=SCALAR)
-    uField.addData(position=NODAL, instance=instance,    	labels=nodeLabelData,    	data=CSLIP1DELTATuple)
+if WearOutputMode == 'ODB':
+    odb = openOdb(path=JobName+'WithWearCalculation.odb', readOnly=False)
+else:
+    # The ODB is only read, wear results are written to the sidecar
+    odb = originalodb
+Profiler.Stop()
 
-    instance=odb.rootAssembly.instances['PART-1-1']
-    uField = currentFramei.FieldOutput(name='CSLIP2DELTA', description='DIFFERENCE IN CSLIP2 FROM CURRENT FRAME AND PREVIOUS FRAME', type=SCALAR)
-    uField.addData(position=NODAL, instance=instance,    	labels=nodeLabelData,    	data=CSLIP2DELTATuple)
+# JobName.inp is split once at its nodes for the INCLUDE mode, the worn INPs of the frames only write the sliding nodes
+if WornInpMode == 'INCLUDE':
+    SplitInpAtNodes(JobName+'.inp', JobName+'WornMeshHead.inp', JobName+'WornMeshTail.inp')
 
-    instance=odb.rootAssembly.instances['PART-1-1']
-    uField = currentFramei.FieldOutput(name='RESULTANTCSLIPDELTA', description='RESULTANT CSLIP FROM CURRENT FRAME AND PREVIOUS FRAME', type=SCALAR)
-    uField.addData(position=NODAL, instance=instance,    	labels=nodeLabelData,    	data=RESULTANTCSLIPDELTATuple)
+# Worn nodes and worn INPs of the frames (ArchardWearEngine.py), the union of the labels of the node sets is indexed once and every
+# field of every frame is scattered into arrays aligned to these labels
+Session = WornFrameSession(odb, InstanceName, [NodeSetName for NodeSetName, kD in Pairs], WearingStepName, JobName, WornInpMode, NormalSource,
+    Smoothing, SmoothingIterations)
+SlidingNodesIndex = Session.SlidingNodesIndex
 
-    instance=odb.rootAssembly.instances['PART-1-1']
-    uField = currentFramei.FieldOutput(name='CPRESS_AVERAGED', description='AVERAGED CPRESS FROM CURRENT FRAME AND PREVIOUS FRAME', type=SCALAR)
-    uField.addData(position=NODAL, instance=instance,    	labels=nodeLabelData,    	data=CPRESSAVERAGEDTuple)
+# Positions of the nodes of every pair in these arrays, the wear fields of a pair are named FieldName_NodeSetName if there are several pairs
+PairViews = [Session.NodeSetView(NodeSetName) for NodeSetName, kD in Pairs]
+PairLabels = [SlidingNodesIndex.Labels[PairView] for PairView in PairViews]
+PairSuffixes = [('_'+NodeSetName if len(Pairs) > 1 else '') for NodeSetName, kD in Pairs]
 
-for index in range(1,NumberOfFrames):
+# Labels argument of addData of every pair, built once for all fields and frames
+if WearOutputMode == 'ODB':
+    PairLabelData = [tuple(Labels.tolist()) for Labels in PairLabels]
 
-   Currentframe=step.frames[index]
+step=odb.steps[WearingStepName]
+NumberOfFrames=len(step.frames)
 
-   AVERAGED_CONTACT_PRESSURE= step.frames[index].fieldOutputs['CPRESS_AVERAGED'].getSubset(region=NodeSetOfSlidingNodes)
-   RESULANT_SLIPPING_DISTANCE=step.frames[index].fieldOutputs['RESULTANTCSLIPDELTA'].getSubset(region=NodeSetOfSlidingNodes)
-   AVG_CONTACT_PRESSURE_MULTIPLIED_RESULTANT_SLIP_DISTANCE=(AVERAGED_CONTACT_PRESSURE*RESULANT_SLIPPING_DISTANCE)
-   NewFieldOutput = Currentframe.FieldOutput(name='AVG_CONTACT_PRESSURE_MULTIPLIED_RESULTANT_SLIP_DISTANCE', description='Averaged CONTACT PRESSURE multiplied by RESULTANT CSLIP', field=AVG_CONTACT_PRESSURE_MULTIPLIED_RESULTANT_SLIP_DISTANCE)
+instance=odb.rootAssembly.instances[InstanceName]
 
-ARCHARDWEARSUM=0.0
+# Frame values of the step give the time increment of every frame
+FrameValues = [frame.frameValue for frame in step.frames]
 
-for index in range(1,NumberOfFrames):
+# Frames are read once, only the contact fields of the previous frame and the wear sum of every pair are kept in memory
+Integrators = [ArchardWearIntegrator(kD, FrameValues, TimeIntegration) for NodeSetName, kD in Pairs]
 
-   Currentframe=step.frames[index]
+if WriteIntermediateFields:
+    OutputFields = ARCHARD_INTERMEDIATE_FIELDS + ARCHARD_WEAR_FIELDS
+else:
+    OutputFields = ARCHARD_WEAR_FIELDS
 
-   AVG_CONTACT_PRESSURE_MULTIPLIED_RESULTANT_SLIP_DISTANCE=step.frames[index].fieldOutputs['AVG_CONTACT_PRESSURE_MULTIPLIED_RESULTANT_SLIP_DISTANCE'].getSubset(region=NodeSetOfSlidingNodes)
+if WearOutputMode == 'SIDECAR':
+    Sidecars = [WearResultsSidecar(JobName+'WearResults'+PairSuffix, Labels, [FieldName for FieldName, Description in OutputFields])
+        for Labels, PairSuffix in zip(PairLabels, PairSuffixes)]
 
-   #Archard Wear equation = Contact Pressure * Slip Velocity
-   #Slip Velocity = Resultant Slip Distance/ Time of Increment 
-   ARCHARDWEAR=(AVG_CONTACT_PRESSURE_MULTIPLIED_RESULTANT_SLIP_DISTANCE*kD)/IncrementTimeDelta
-   ARCHARDWEARSUM=ARCHARDWEARSUM+ARCHARDWEAR
+# Wear sums of the frames left to the worker processes
+WornFrames = []
 
-   NewFieldOutput = Currentframe.FieldOutput(name='ARCHARDWEAR', description='Archard WEAR calculated from Averaged CPRESS and Resultant CSLIP', field=ARCHARDWEAR)
-   NewFieldOutput = Currentframe.FieldOutput(name='ARCHARDWEARSUM', description='Sum of Archard WEAR', field=ARCHARDWEARSUM)
+for frameindex in range(NumberOfFrames):
 
-if FramesForWhichWearToBeCalculated=='ALL':
+    currentFramei=step.frames[frameindex]
 
-    for frameindex in range(1,NumberOfFrames):
+    Profiler.Start('FIELD EXTRACTION')
 
-        print 'Frame number:' +str(frameindex)
+    CSLIP1i, CSLIP2i, CPRESSi = [SlidingNodesIndex.ScatterField(currentFramei, FieldName) for FieldName in ARCHARD_CONTACT_FIELD_NAMES]
 
-        COORDINATES= step.frames[frameindex].fieldOutputs['COORD'].getSubset(region=NodeSetOfSlidingNodes)
-        WEARSUM= step.frames[frameindex].fieldOutputs['ARCHARDWEARSUM'].getSubset(region=NodeSetOfSlidingNodes)
-        CNORMF= step.frames[frameindex].fieldOutputs['CNORMF'].getSubset(region=NodeSetOfSlidingNodes)
+    Profiler.Stop(frame=frameindex)
 
-        NEWCOORDINATES1DICTIONARY={}
-        NEWCOORDINATES2DICTIONARY={}
-        NEWCOORDINATES3DICTIONARY={}
+    Profiler.Start('COMPUTE')
 
-        for index in range(len(COORDINATES.values)):
+    PairFields = [Integrator.Add(CSLIP1i[PairView], CSLIP2i[PairView], CPRESSi[PairView]) for Integrator, PairView in zip(Integrators, PairViews)]
 
-            NodeLabel = COORDINATES.values[index].nodeLabel
+    if frameindex == 0:
+        Profiler.Stop(frame=frameindex)
+        continue
 
-            NodeOfInterest =  odb.rootAssembly.instances['PART-1-1'].getNodeFromLabel(NodeLabel)
+    # Wear sum of the sliding nodes, nodes shared by several pairs wear by all of them
+    if len(Pairs) == 1:
+        WEARSUM = PairFields[0]['ARCHARDWEARSUM']
+    else:
+        WEARSUM = numpy.zeros(len(SlidingNodesIndex))
+        for PairView, FrameFields in zip(PairViews, PairFields):
+            WEARSUM[PairView] = WEARSUM[PairView] + FrameFields['ARCHARDWEARSUM']
 
-            try:
-                CNORMFX=CNORMF.getSubset(region=NodeOfInterest).values[-1].data[0]
-            except:
-                CNORMFX=0.0
+    Profiler.Stop(frame=frameindex)
 
-            try:
-                CNORMFY=CNORMF.getSubset(region=NodeOfInterest).values[-1].data[1]
-            except:
-                CNORMFY=0.0
+    Profiler.Start('ADDDATA')
 
-            try:
-                CNORMFZ=CNORMF.getSubset(region=NodeOfInterest).values[-1].data[2]
-            except:
-                CNORMFZ=0.0
+    for pairindex in range(len(Pairs)):
+        FrameFields = PairFields[pairindex]
+        if WearOutputMode == 'SIDECAR':
+            Sidecars[pairindex].Add(frameindex, currentFramei.frameValue, FrameFields)
+        else:
+            for FieldName, Description in OutputFields:
+                uField = currentFramei.FieldOutput(name=FieldName+PairSuffixes[pairindex], description=Description, type=SCALAR)
+                uField.addData(position=NODAL, instance=instance,    	labels=PairLabelData[pairindex],    	data=AddDataFromArray(FrameFields[FieldName]))
 
-            try:
-                CNORMFMAGNITUDE=CNORMF.getSubset(region=NodeOfInterest).values[-1].magnitude
-            except:
-                CNORMFMAGNITUDE=0.0
+    Profiler.Stop(frame=frameindex)
 
-            try:
-                CNORMFDirectionXUnitVector=CNORMFX/CNORMFMAGNITUDE
-            except:
-                CNORMFDirectionXUnitVector=0.0
+    # Worn INP of every frame for ALL, of the last frame of the step for LAST
+    if FramesForWhichWearToBeCalculated!='ALL' and frameindex!=NumberOfFrames-1:
+        continue
 
-            NewCOORDINATES1 = COORDINATES.getSubset(region=NodeOfInterest).values[0].data[0] + (WEARSUM.getSubset(region=NodeOfInterest).values[0].data)*(CNORMFDirectionXUnitVector)
-            NEWCOORDINATES1DICTIONARY[NodeLabel] = NewCOORDINATES1
+    # The wear sum of a frame is a new array of the integrator, it is not changed by the later frames
+    if NumberOfProcesses > 1:
+        WornFrames.append((frameindex, WEARSUM))
+        continue
 
-            try:
-                CNORMFDirectionYUnitVector=CNORMFY/CNORMFMAGNITUDE
-            except:
-                CNORMFDirectionYUnitVector=0.0
+    print('Frame number:' +str(frameindex))
 
-            NewCOORDINATES2 = COORDINATES.getSubset(region=NodeOfInterest).values[0].data[1] + (WEARSUM.getSubset(region=NodeOfInterest).values[0].data)*(CNORMFDirectionYUnitVector)
-            NEWCOORDINATES2DICTIONARY[NodeLabel] = NewCOORDINATES2
+    Profiler.Start('COORDINATE UPDATE')
 
-            try:
-                CNORMFDirectionZUnitVector=CNORMFZ/CNORMFMAGNITUDE
-            except:
-                CNORMFDirectionZUnitVector=0.0
+    Worn = Session.WornNodes(frameindex, WEARSUM)
+    RecordWornNodes(frameindex, Worn)
 
-            NewCOORDINATES3 = COORDINATES.getSubset(region=NodeOfInterest).values[0].data[2] + (WEARSUM.getSubset(region=NodeOfInterest).values[0].data)*(CNORMFDirectionZUnitVector)
-            NEWCOORDINATES3DICTIONARY[NodeLabel] = NewCOORDINATES3
+    Profiler.Stop(frame=frameindex)
 
-            StatisticsPrintToFile2()
+    Profiler.Start('INP WRITE')
 
+    if WornInpMode != 'CAE':
+        Session.WriteWornInp(frameindex, Worn)
+    else:
         stepnumber=originalodb.steps[WearingStepName].number - 1
         mdb.Model(name=JobName, modelType=STANDARD_EXPLICIT)
-        p = mdb.models[JobName].PartFromOdb(name='PART-1-1', instance='PART-1-1', odb=originalodb, shape=DEFORMED, step=stepnumber, frame=frameindex)
+        p = mdb.models[JobName].PartFromOdb(name='PART-1-1', instance=InstanceName, odb=originalodb, shape=DEFORMED, step=stepnumber, frame=frameindex)
         a = mdb.models[JobName].rootAssembly
         p = mdb.models[JobName].parts['PART-1-1']
         a.Instance(name='PART-1-1-1', part=p, dependent=ON)
@@ -408,153 +338,26 @@ if FramesForWhichWearToBeCalculated=='ALL':
 
         mdb.jobs[JobName+'Step'+WearingStepName+'AtFrame'+str(frameindex)].writeInput(consistencyChecking=OFF)
 
-        WriteFile = open(JobName+'Step'+WearingStepName+'AtFrame'+str(frameindex)+'WithWear.inp','w+')
-
-        with open (JobName+'Step'+WearingStepName+'AtFrame'+str(frameindex)+'.inp', 'rt',) as InputFile:
-            linecounter=0
-
-            for line in InputFile: # Store each line in a string variable "line"
-
-                line_list =line.split(',') # Split each line in line_list variable
-
-                if line_list[0] == '*Node\n':
-                    linecounter=linecounter+1
-
-                if line_list[0] == '*Element':
-                    linecounter=linecounter+1
-
-                if len(line_list) == 4 and linecounter<2: # For lines under *Node having node data, after split(',') should contain a length of 4
-                    try:
-                        line_list = [float(i) for i in line_list] #By default values after Split is a string, convert to float
-                    except:
-                        print 'pass' #, line_list # Incase line_list contains a list of string previous line will throw an error
-                    # Check if line_list[0], the node is in the NEWCOORDINATESDICTIONARY. If yes make changes.
-                    if line_list[0] in NEWCOORDINATES1DICTIONARY.keys():
-                        line_list[1] = NEWCOORDINATES1DICTIONARY[line_list[0]]
-                        line_list[2] = NEWCOORDINATES2DICTIONARY[line_list[0]]
-                        line_list[3] = NEWCOORDINATES3DICTIONARY[line_list[0]]
-                        StatisticsPrintToFile3()
-                        WriteFile.write('\t\t%s,\t\t%s,\t\t%s,\t\t%s\n'%(int(line_list[0]),line_list[1],line_list[2],line_list[3]))
-                    else: # if not yes , then write the complete line to new INP
-                        WriteFile.write(line)
-                else: # if line_list! = 4 then write complete line to INP
-                    WriteFile.write(line)
-
-    #  After writing close the files
-    InputFile.close()
-    WriteFile.close()
-
-else:
-
-    frameindex=len(step.frames)-1
+        # The node lines of the sliding nodes are replaced in one buffered pass, all other lines are copied unchanged (ArchardWearEngine.py)
+        PatchInpNodes(JobName+'Step'+WearingStepName+'AtFrame'+str(frameindex)+'.inp', JobName+'Step'+WearingStepName+'AtFrame'+str(frameindex)+'WithWear.inp', (), (), Worn[0], Worn[6])
 
-    COORDINATES= step.frames[frameindex].fieldOutputs['COORD'].getSubset(region=NodeSetOfSlidingNodes)
-    WEARSUM= step.frames[frameindex].fieldOutputs['ARCHARDWEARSUM'].getSubset(region=NodeSetOfSlidingNodes)
-    CNORMF= step.frames[frameindex].fieldOutputs['CNORMF'].getSubset(region=NodeSetOfSlidingNodes)
+    Profiler.Stop(frame=frameindex)
 
-    NEWCOORDINATES1DICTIONARY={}
-    NEWCOORDINATES2DICTIONARY={}
-    NEWCOORDINATES3DICTIONARY={}
-
-    for index in range(len(COORDINATES.values)):
-
-        NodeLabel = COORDINATES.values[index].nodeLabel
-
-        NodeOfInterest =  odb.rootAssembly.instances['PART-1-1'].getNodeFromLabel(NodeLabel)
-
-        try:
-            CNORMFX=CNORMF.getSubset(region=NodeOfInterest).values[-1].data[0]
-        except:
-            CNORMFX=0.0
-
-        try:
-            CNORMFY=CNORMF.getSubset(region=NodeOfInterest).values[-1].data[1]
-        except:
-            CNORMFY=0.0
-
-        try:
-            CNORMFZ=CNORMF.getSubset(region=NodeOfInterest).values[-1].data[2]
-        except:
-            CNORMFZ=0.0
-
-        try:
-            CNORMFMAGNITUDE=CNORMF.getSubset(region=NodeOfInterest).values[-1].magnitude
-        except:
-            CNORMFMAGNITUDE=0.0
-
-        try:
-            CNORMFDirectionXUnitVector=CNORMFX/CNORMFMAGNITUDE
-        except:
-            CNORMFDirectionXUnitVector=0.0
-
-        NewCOORDINATES1 = COORDINATES.getSubset(region=NodeOfInterest).values[0].data[0] + (WEARSUM.getSubset(region=NodeOfInterest).values[0].data)*(CNORMFDirectionXUnitVector)
-        NEWCOORDINATES1DICTIONARY[NodeLabel] = NewCOORDINATES1
-
-        try:
-            CNORMFDirectionYUnitVector=CNORMFY/CNORMFMAGNITUDE
-        except:
-            CNORMFDirectionYUnitVector=0.0
-
-        NewCOORDINATES2 = COORDINATES.getSubset(region=NodeOfInterest).values[0].data[1] + (WEARSUM.getSubset(region=NodeOfInterest).values[0].data)*(CNORMFDirectionYUnitVector)
-        NEWCOORDINATES2DICTIONARY[NodeLabel] = NewCOORDINATES2
-
-        try:
-            CNORMFDirectionZUnitVector=CNORMFZ/CNORMFMAGNITUDE
-        except:
-            CNORMFDirectionZUnitVector=0.0
-
-        NewCOORDINATES3 = COORDINATES.getSubset(region=NodeOfInterest).values[0].data[2] + (WEARSUM.getSubset(region=NodeOfInterest).values[0].data)*(CNORMFDirectionZUnitVector)
-        NEWCOORDINATES3DICTIONARY[NodeLabel] = NewCOORDINATES3
-
-        StatisticsPrintToFile2()
-
-    stepnumber=originalodb.steps[WearingStepName].number - 1
-    mdb.Model(name=JobName, modelType=STANDARD_EXPLICIT)
-    p = mdb.models[JobName].PartFromOdb(name='PART-1-1', instance='PART-1-1', odb=originalodb, shape=DEFORMED, step=stepnumber, frame=frameindex)
-    a = mdb.models[JobName].rootAssembly
-    p = mdb.models[JobName].parts['PART-1-1']
-    a.Instance(name='PART-1-1-1', part=p, dependent=ON)
-
-    mdb.Job(name=JobName+'Step'+WearingStepName+'AtFrame'+str(frameindex), model=JobName)
-
-    mdb.jobs[JobName+'Step'+WearingStepName+'AtFrame'+str(frameindex)].writeInput(consistencyChecking=OFF)
-
-    WriteFile = open(JobName+'Step'+WearingStepName+'AtFrame'+str(frameindex)+'WithWear.inp','w+')
-
-    with open (JobName+'Step'+WearingStepName+'AtFrame'+str(frameindex)+'.inp', 'rt',) as InputFile:
-        linecounter=0
-
-        for line in InputFile: # Store each line in a string variable "line"
-
-            line_list =line.split(',') # Split each line in line_list variable
-
-            if line_list[0] == '*Node\n':
-                linecounter=linecounter+1
-
-            if line_list[0] == '*Element':
-                linecounter=linecounter+1
-
-            if len(line_list) == 4 and linecounter<2: # For lines under *Node having node data, after split(',') should contain a length of 4
-                try:
-                    line_list = [float(i) for i in line_list] #By default values after Split is a string, convert to float
-                except:
-                    print 'pass' #, line_list # Incase line_list contains a list of string previous line will throw an error
-                # Check if line_list[0], the node is in the NEWCOORDINATESDICTIONARY. If yes make changes.
-                if line_list[0] in NEWCOORDINATES1DICTIONARY.keys():
-                    line_list[1] = NEWCOORDINATES1DICTIONARY[line_list[0]]
-                    line_list[2] = NEWCOORDINATES2DICTIONARY[line_list[0]]
-                    line_list[3] = NEWCOORDINATES3DICTIONARY[line_list[0]]
-                    StatisticsPrintToFile3()
-                    WriteFile.write('\t\t%s,\t\t%s,\t\t%s,\t\t%s\n'%(int(line_list[0]),line_list[1],line_list[2],line_list[3]))
-                else: # if not yes , then write the complete line to new INP
-                    WriteFile.write(line)
-            else: # if line_list! = 4 then write complete line to INP
-                WriteFile.write(line)
-
-    #  After writing close the files
-    InputFile.close()
-    WriteFile.close()
+# Worn nodes and worn INPs of the frames in NumberOfProcesses worker processes, each with its own read only handle of JobName.odb,
+# the worn nodes come back in frame order and are recorded by this process only
+Profiler.Start('WORKERS')
+for frameindex, Worn in EvaluateFrames(Session, JobName+'.odb', WornFrames, NumberOfProcesses):
+    print('Frame number:' +str(frameindex))
+    RecordWornNodes(frameindex, Worn)
+Profiler.Stop()
 
+Profiler.Start('SAVE')
+StatisticsLog.Close()
 originalodb.close()
-odb.save()
-odb.close()
+if WearOutputMode == 'ODB':
+    odb.save()
+    odb.close()
+else:
+    for Sidecar in Sidecars:
+        Sidecar.Close()
+Profiler.Stop()
@@ -74,6 +74,7 @@ REV-01, 24th April 2018
 : Modified script to take inputs from spreadsheet instead of command line since command line inputs are not possible for all setups (such as PBS Works).
 REV-02, 9th May 2018: Added additional capability in the script to catch errors in DAT & MSG file and terminate the script if caught, so as to release tokens.
 REV-03, 19th June 2018: Added capability for user to specify wait time between job submission.
+REV-04, 18th October 2026: Wall time of each job and wait is recorded with ScriptProfiler.py when SCRIPT_PROFILE_FILE is set.
 """
 
 
@@ -98,6 +99,17 @@ import csv
 
 
 
+from ScriptProfiler import ScriptProfiler
+
+
+
+# Phases are recorded in the file named by environment variable SCRIPT_PROFILE_FILE (see ScriptProfiler.py, keep it in the same folder)
+
+
+Profiler = ScriptProfiler('Automate-Job-Execution-Reading-DAT-MSG.py')
+
+
+
 
 
 # Storing all jobs, jobs with energy requirement!
@@ -689,7 +701,9 @@ for each in range(0,NUMBER_OF_JOBS):
 
 
 
+		Profiler.Start('JOB')
 		return_value=job_with_energy_requirement(each,index)
+		Profiler.Stop(job=JOBS[each])
 
 
 
@@ -699,7 +713,9 @@ for each in range(0,NUMBER_OF_JOBS):
 				myfile.close
 			break
 		#Sleep for some time between job submissions to allow Abaqus to completely close current job
+		Profiler.Start('WAIT')
 		time.sleep(wait_time_between_jobs)
+		Profiler.Stop(job=JOBS[each])
 
 
 
@@ -711,7 +727,9 @@ for each in range(0,NUMBER_OF_JOBS):
 
 
 		return_value = 0
+		Profiler.Start('JOB')
 		return_value=job_without_energy_requirement(each)
+		Profiler.Stop(job=JOBS[each])
 
 
 
@@ -721,7 +739,9 @@ for each in range(0,NUMBER_OF_JOBS):
 				myfile.close
 			break
 		#Sleep for some time between job submissions to allow Abaqus to completely close current job
+		Profiler.Start('WAIT')
 		time.sleep(wait_time_between_jobs)
+		Profiler.Stop(job=JOBS[each])
 
 
 
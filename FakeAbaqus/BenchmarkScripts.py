@@ -0,0 +1,260 @@
+"""
+BenchmarkScripts.py
+
+Benchmark of the fretting, Archard wear and ODB transfer workflows of this repository on synthetic ODBs (FakeAbaqus package),
+to find scaling cliffs and regressions before a production job does.
+
+Workflows:
+RUIZ     : FrettingAssesmentUsingRuizParameter.py, Frames step pairs (one frame per step) of a model with Nodes contact nodes
+ARCHARD  : ArchardWearIterator.py (LAST frame mode and TEMPLATE worn INP mode by default), one step of Frames frames
+TRANSFER : ODBResultsTransferNewerToOlderVersionStore.py then ODBResultsTransferNewerToOlderVersionWrite.py, one step of Frames frames
+
+Every case runs in a new folder below the work folder with the scripts copied from the repository, the synthetic ODBs and the INPUTS.csv
+of the workflow, with FakeAbaqus on PYTHONPATH. ODB generation is not timed. For every case the script wall time, the throughput in
+nodes x frames per second and the peak memory (largest peak RSS recorded by ScriptProfiler.py in the script processes) are reported,
+and written as JSON lines to the results file.
+
+The results are compared with the baselines file (BenchmarkBaselines.json next to this script). A case is a regression when its
+throughput is below the baseline by more than the tolerance or its peak memory is above the baseline by more than the tolerance.
+The exit code is 1 when there is a regression, so the benchmark can be a CI step. With --write-baselines the results are stored as new
+baselines. Cases without a baseline are reported as 'no baseline' and are not compared.
+
+Usage (Linux):
+
+python BenchmarkScripts.py --nodes 10000,100000,1000000 --frames 10,100,500
+python BenchmarkScripts.py --workflows RUIZ,TRANSFER --nodes 10000 --frames 10 --write-baselines
+
+Please note:
+1. Baselines depend on the machine, they are not kept in the repository. Write them with --write-baselines on the machine on which
+   the benchmark is compared (BenchmarkBaselines.json is ignored by git)
+2. Cases running longer than --timeout seconds are stopped and reported as TIMEOUT, they are not compared
+3. Nodes are contact nodes, the synthetic model has twice as many nodes (see SyntheticOdb.py), TRANSFER works on all of them
+
+Revision history:
+REV-00 (18th October 2026): 1st release
+REV-01 (18th October 2026): ARCHARD cases have the orphan mesh INP of the model, worn INP mode with --archard-inp-mode
+REV-02 (18th October 2026): Baselines are written on the benchmark machine with --write-baselines (--save-baseline still works)
+REV-03 (18th October 2026): RUIZ cases have Frames step pairs (Frames + 1 step numbers), --archard-inp-mode accepts INCLUDE
+
+Author:
+Ranjit GOPI
+Solution Consultant, SIMULIA India COE
+ranjit.gopi@3ds.com
+Simulia India Support Frontdesk:+91 44 43443000
+Simulia India Support Email: simulia.in.support@3ds.com
+3DS.COM/SIMULIA
+"""
+import os
+import sys
+import json
+import time
+import shutil
+import argparse
+import subprocess
+
+FAKE_ABAQUS_FOLDER = os.path.dirname(os.path.abspath(__file__))
+REPOSITORY_FOLDER = os.path.dirname(FAKE_ABAQUS_FOLDER)
+BASELINES_FILE = os.path.join(FAKE_ABAQUS_FOLDER, 'BenchmarkBaselines.json')
+
+sys.path.insert(0, FAKE_ABAQUS_FOLDER)
+from SyntheticOdb import CreateSyntheticOdb
+
+# Helper modules copied next to the scripts of every case
+HELPER_MODULES = ('OdbArrayTools.py', 'ScriptProfiler.py', 'RuizParameterEngine.py', 'ArchardWearEngine.py')
+
+WORKFLOWS = ('RUIZ', 'ARCHARD', 'TRANSFER')
+
+def WriteInputs(Folder, Rows):
+	with open(os.path.join(Folder, 'INPUTS.csv'), 'w') as myfile:
+		for Row in Rows:
+			myfile.write(','.join('"' + str(Value) + '"' for Value in Row) + '\n')
+
+def PrepareRuiz(Folder, Nodes, Frames, Options):
+	# Frames step pairs, step i against step i-1 at the last frame of each step, Frames + 1 step numbers give Frames step pairs
+	CreateSyntheticOdb(os.path.join(Folder, 'Synthetic.odb'), Nodes, Frames + 1, 2)
+	CreateSyntheticOdb(os.path.join(Folder, 'SyntheticDataCheck.odb'), Nodes, 0, 2, DataCheck=True)
+	WriteInputs(Folder, [('ODB TO READ', 'Synthetic.odb'),
+		('STEP NUMBERS', ','.join(str(Step) for Step in range(1, Frames + 2))),
+		('FRAME NUMBERS', ','.join('1' for Step in range(Frames + 1))),
+		('ODB TO WRITE', 'SyntheticDataCheck.odb'),
+		('NODE SETS', 'CONTACT-NODES'),
+		('CACHE SIZE IN MB', Options.cache_mb),
+		('NUMBER OF PROCESSES', Options.processes)])
+	return ['FrettingAssesmentUsingRuizParameter.py'], {}
+
+def PrepareArchard(Folder, Nodes, Frames, Options):
+	# Synthetic.inp is the template of the TEMPLATE worn INP mode
+	CreateSyntheticOdb(os.path.join(Folder, 'Synthetic.odb'), Nodes, 1, Frames + 1, InpFileName=os.path.join(Folder, 'Synthetic.inp'))
+	Inputs = ';'.join(['Synthetic', 'Step-1', Options.archard_mode, 'CONTACT-NODES', '1e-5', Options.archard_inp_mode])
+	return ['ArchardWearIterator.py'], {'FAKE_ABAQUS_INPUTS': Inputs}
+
+def PrepareTransfer(Folder, Nodes, Frames, Options):
+	CreateSyntheticOdb(os.path.join(Folder, 'Source.odb'), Nodes, 1, Frames + 1)
+	CreateSyntheticOdb(os.path.join(Folder, 'Target.odb'), Nodes, 1, Frames + 1, DataCheck=True)
+	WriteInputs(Folder, [('ODB TO READ', 'Source'), ('STEP', 'Step-1'), ('ODB TO WRITE', 'Target')])
+	return ['ODBResultsTransferNewerToOlderVersionStore.py', 'ODBResultsTransferNewerToOlderVersionWrite.py'], {}
+
+PREPARE = {'RUIZ': PrepareRuiz, 'ARCHARD': PrepareArchard, 'TRANSFER': PrepareTransfer}
+
+def RunScript(Folder, ScriptName, Environment, Timeout):
+	# Runs one script in Folder, returns the wall time and False if it did not finish within Timeout seconds
+	Start = time.time()
+	with open(os.path.join(Folder, ScriptName + '.log'), 'w') as LogFile:
+		Process = subprocess.Popen([sys.executable, ScriptName], cwd=Folder, env=Environment, stdout=LogFile, stderr=subprocess.STDOUT)
+		while Process.poll() is None:
+			if time.time() - Start > Timeout:
+				Process.kill()
+				Process.wait()
+				return time.time() - Start, 'TIMEOUT'
+			time.sleep(0.05)
+	if Process.returncode != 0:
+		return time.time() - Start, 'FAILED'
+	return time.time() - Start, 'OK'
+
+def PeakRssMegaBytes(ProfileFileName):
+	# Largest peak RSS recorded by ScriptProfiler.py in the profile file
+	PeakRss = None
+	if not os.path.exists(ProfileFileName):
+		return PeakRss
+	with open(ProfileFileName, 'r') as ProfileFile:
+		for line in ProfileFile:
+			Value = json.loads(line).get('peak_rss_mb')
+			if Value is not None and (PeakRss is None or Value > PeakRss):
+				PeakRss = Value
+	return PeakRss
+
+def RunCase(WorkFolder, Workflow, Nodes, Frames, Options):
+	Folder = os.path.join(WorkFolder, Workflow + '-' + str(Nodes) + '-' + str(Frames))
+	if os.path.exists(Folder):
+		shutil.rmtree(Folder)
+	os.makedirs(Folder)
+
+	for ModuleName in HELPER_MODULES:
+		shutil.copy(os.path.join(REPOSITORY_FOLDER, ModuleName), Folder)
+
+	Scripts, ExtraEnvironment = PREPARE[Workflow](Folder, Nodes, Frames, Options)
+	for ScriptName in Scripts:
+		shutil.copy(os.path.join(REPOSITORY_FOLDER, ScriptName), Folder)
+
+	ProfileFileName = os.path.join(Folder, 'Script_Profile.jsonl')
+	Environment = dict(os.environ)
+	Environment.update(ExtraEnvironment)
+	Environment['PYTHONPATH'] = FAKE_ABAQUS_FOLDER + os.pathsep + Environment.get('PYTHONPATH', '')
+	Environment['SCRIPT_PROFILE_FILE'] = ProfileFileName
+
+	WallTime = 0.0
+	Status = 'OK'
+	for ScriptName in Scripts:
+		ScriptTime, Status = RunScript(Folder, ScriptName, Environment, Options.timeout - WallTime)
+		WallTime = WallTime + ScriptTime
+		if Status != 'OK':
+			break
+
+	Result = {'workflow': Workflow, 'nodes': Nodes, 'frames': Frames, 'status': Status, 'wall_s': WallTime,
+		'node_frames_per_s': Nodes*Frames/WallTime if Status == 'OK' and WallTime > 0 else None,
+		'peak_rss_mb': PeakRssMegaBytes(ProfileFileName), 'folder': Folder}
+
+	if Status == 'OK' and not Options.keep:
+		shutil.rmtree(Folder)
+
+	return Result
+
+def CaseKey(Result):
+	return Result['workflow'] + '|' + str(Result['nodes']) + '|' + str(Result['frames'])
+
+def Compare(Result, Baselines, Tolerance):
+	# Regression messages of Result against its baseline, empty if there is no baseline or no regression
+	Baseline = Baselines.get(CaseKey(Result))
+	if Baseline is None or Result['status'] != 'OK':
+		return []
+
+	Messages = []
+	if Baseline.get('node_frames_per_s') and Result['node_frames_per_s'] < Baseline['node_frames_per_s']*(1.0 - Tolerance):
+		Messages.append('throughput %.4g < baseline %.4g' % (Result['node_frames_per_s'], Baseline['node_frames_per_s']))
+	if Baseline.get('peak_rss_mb') and Result['peak_rss_mb'] and Result['peak_rss_mb'] > Baseline['peak_rss_mb']*(1.0 + Tolerance):
+		Messages.append('peak memory %.4g MB > baseline %.4g MB' % (Result['peak_rss_mb'], Baseline['peak_rss_mb']))
+	return Messages
+
+def LoadBaselines(FileName):
+	if not os.path.exists(FileName):
+		return {}
+	with open(FileName, 'r') as BaselinesFile:
+		return json.load(BaselinesFile)
+
+def SaveBaselines(FileName, Baselines):
+	with open(FileName, 'w') as BaselinesFile:
+		json.dump(Baselines, BaselinesFile, indent=1, sort_keys=True)
+		BaselinesFile.write('\n')
+
+def FormatNumber(Value, Format):
+	if Value is None:
+		return '-'
+	return Format % Value
+
+def IntegerList(Text):
+	return [int(Value) for Value in Text.split(',') if Value.strip()]
+
+if __name__ == '__main__':
+
+	Parser = argparse.ArgumentParser(description='Benchmark of the fretting, Archard wear and ODB transfer workflows on synthetic ODBs')
+	Parser.add_argument('--workflows', default=','.join(WORKFLOWS), help='Workflows separated by comma, ' + ', '.join(WORKFLOWS))
+	Parser.add_argument('--nodes', type=IntegerList, default=[10000, 100000, 1000000], help='Contact nodes separated by comma')
+	Parser.add_argument('--frames', type=IntegerList, default=[10, 100, 500], help='Frames separated by comma')
+	Parser.add_argument('--work-folder', default='BenchmarkRuns')
+	Parser.add_argument('--results', default='BenchmarkResults.jsonl', help='JSON lines file to which results are appended')
+	Parser.add_argument('--baselines', default=BASELINES_FILE)
+	Parser.add_argument('--write-baselines', '--save-baseline', dest='write_baselines', action='store_true',
+		help='Store the results of the finished cases as baselines of this machine')
+	Parser.add_argument('--tolerance', type=float, default=0.25, help='Allowed relative loss of throughput or growth of memory')
+	Parser.add_argument('--timeout', type=float, default=3600.0, help='Seconds after which a case is stopped')
+	Parser.add_argument('--archard-mode', default='LAST', choices=('ALL', 'LAST'))
+	Parser.add_argument('--archard-inp-mode', default='TEMPLATE', choices=('TEMPLATE', 'CAE', 'INCLUDE'))
+	Parser.add_argument('--cache-mb', type=float, default=1024.0)
+	Parser.add_argument('--processes', type=int, default=1)
+	Parser.add_argument('--keep', action='store_true', help='Keep the case folders')
+	Options = Parser.parse_args()
+
+	Workflows = [Workflow.strip().upper() for Workflow in Options.workflows.split(',')]
+	for Workflow in Workflows:
+		if Workflow not in PREPARE:
+			Parser.error('unknown workflow ' + Workflow)
+
+	Baselines = LoadBaselines(Options.baselines)
+	Regressions = []
+
+	print('%-9s %9s %7s %8s %10s %16s %12s  %s' % ('WORKFLOW', 'NODES', 'FRAMES', 'STATUS', 'WALL (s)', 'NODESxFRAMES/s', 'PEAK MB', 'COMPARISON'))
+
+	for Workflow in Workflows:
+		for Nodes in Options.nodes:
+			for Frames in Options.frames:
+				Result = RunCase(os.path.abspath(Options.work_folder), Workflow, Nodes, Frames, Options)
+				Messages = Compare(Result, Baselines, Options.tolerance)
+				if Messages:
+					Regressions.append(CaseKey(Result))
+				Result['regression'] = Messages
+				Result['timestamp'] = time.time()
+
+				with open(Options.results, 'a') as ResultsFile:
+					ResultsFile.write(json.dumps(Result, sort_keys=True) + '\n')
+
+				if Messages:
+					Comparison = 'REGRESSION: ' + '; '.join(Messages)
+				elif CaseKey(Result) in Baselines:
+					Comparison = 'ok'
+				else:
+					Comparison = 'no baseline'
+
+				print('%-9s %9d %7d %8s %10s %16s %12s  %s' % (Workflow, Nodes, Frames, Result['status'], FormatNumber(Result['wall_s'], '%.2f'),
+					FormatNumber(Result['node_frames_per_s'], '%.4g'), FormatNumber(Result['peak_rss_mb'], '%.1f'), Comparison))
+				sys.stdout.flush()
+
+				if Options.write_baselines and Result['status'] == 'OK':
+					Baselines[CaseKey(Result)] = {'wall_s': Result['wall_s'], 'node_frames_per_s': Result['node_frames_per_s'],
+						'peak_rss_mb': Result['peak_rss_mb']}
+
+	if Options.write_baselines:
+		SaveBaselines(Options.baselines, Baselines)
+
+	if Regressions:
+		print('Regressions: ' + ', '.join(Regressions))
+		sys.exit(1)
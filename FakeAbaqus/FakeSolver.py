@@ -0,0 +1,127 @@
+"""
+FakeSolver.py
+
+Stand-in for the Abaqus analysis command (abaqus job=... input=... interactive) of the FakeAbaqus package (see odbAccess.py),
+to run the closed loop wear iteration of ArchardWearCycleDriver.py without an Abaqus license.
+
+The INP is read like a datacheck run (nodes, elements, node and element sets, steps, see DataCheckOdbFromInp in abaqus.py) and
+every step is solved as one load cycle over a step time of 1.0 with frames=N frames. The frames have the field outputs
+
+CSLIP1, CSLIP2, CPRESS : scalar, nodes of the contact node set (contact=NAME, default CONTACT-NODES)
+CNORMF                 : vector, nodes of the contact node set, along -Z (the contact surface is the top face of the mesh)
+COORD, U               : vector, all nodes, U is zero (the worn shape is the mesh of the INP)
+
+The normal load and the slip oscillate over the cycle. The load is shared by the contact nodes in proportion to the height of
+each node above the lowest contact node plus relief=DEPTH (default 0.01), so worn nodes carry less pressure as in a real worn surface.
+
+Usage (Linux):
+
+python FakeSolver.py job=Blocks-CYCLE-1 input=Blocks-CYCLE-1.inp interactive frames=10
+
+Options abaqus accepts but the fake ignores (cpus=, interactive, ask_delete=) can be given. The command of ArchardWearCycleDriver.py
+is then 'python /path/to/FakeAbaqus/FakeSolver.py frames=10'.
+
+Please note:
+1. Only the top face contact of an orphan mesh model is solved (for example the INP written by SyntheticOdb.py --inp)
+2. The values do not come from an equilibrium solution, they are smooth functions of time and node height for tests of scripts
+
+Revision history:
+REV-00 (18th October 2026): 1st release
+
+Author:
+Ranjit GOPI
+Solution Consultant, SIMULIA India COE
+ranjit.gopi@3ds.com
+Simulia India Support Frontdesk:+91 44 43443000
+Simulia India Support Email: simulia.in.support@3ds.com
+3DS.COM/SIMULIA
+"""
+import os
+import sys
+import math
+import numpy
+from abaqusConstants import *
+from odbAccess import openOdb
+from abaqus import DataCheckOdbFromInp
+
+DEFAULT_OPTIONS = {'frames': '10', 'contact': 'CONTACT-NODES', 'relief': '0.01', 'pressure': '100', 'slip': '0.01'}
+
+def ParseArguments(Arguments):
+	# key=value arguments of the command line like the abaqus command, flags without value are True
+	Options = dict(DEFAULT_OPTIONS)
+	for Argument in Arguments:
+		if '=' in Argument:
+			Key, Value = Argument.split('=', 1)
+			Options[Key.strip().lower()] = Value.strip()
+		else:
+			Options[Argument.strip().lower()] = True
+	return Options
+
+def ContactPressure(Heights, Load, ReliefDepth):
+	# Pressure of each contact node, nodes higher above the lowest node carry more of the load (mean pressure = Load)
+	Share = Heights - Heights.min() + ReliefDepth
+	return Load*Share/Share.mean()
+
+def Solve(JobName, InputFileName, NumberOfFrames=10, ContactSetName='CONTACT-NODES', ReliefDepth=0.01, Pressure=100.0, SlipAmplitude=0.01):
+	# Writes JobName.odb with the mesh of the INP and NumberOfFrames frames per step
+	DataCheckOdbFromInp(InputFileName, JobName)
+
+	odb = openOdb(path=JobName + '.odb', readOnly=False)
+	instance = odb.rootAssembly.instances.values()[0]
+
+	NodeLabels = instance.NodeLabels
+	Coordinates = instance.NodeCoordinates.astype(numpy.float64)
+
+	ContactLabels = instance.nodeSets[ContactSetName.upper()].NodeLabels()
+	ContactPositions = instance.NodePositions(ContactLabels)
+	Heights = Coordinates[ContactPositions, 2]
+
+	for step in odb.steps.values():
+
+		for FrameIndex in range(NumberOfFrames + 1):
+
+			Time = float(FrameIndex)/NumberOfFrames
+			Phase = 2.0*math.pi*Time
+
+			Load = Pressure*(0.6 + 0.4*math.sin(0.5*Phase))
+			CPRESS = ContactPressure(Heights, Load, ReliefDepth)
+
+			frame = step.Frame(incrementNumber=FrameIndex, frameValue=Time, description='Step Time = ' + str(Time))
+
+			Fields = [('CSLIP1', 'Relative tangential motion direction 1', SCALAR, SlipAmplitude*math.sin(Phase)*numpy.ones(len(ContactLabels))),
+				('CSLIP2', 'Relative tangential motion direction 2', SCALAR, 0.3*SlipAmplitude*math.sin(Phase)*numpy.ones(len(ContactLabels))),
+				('CPRESS', 'Contact pressure', SCALAR, CPRESS),
+				('CNORMF', 'Contact normal force', VECTOR, numpy.column_stack([0.0*CPRESS, 0.0*CPRESS, -CPRESS]))]
+
+			for Name, Description, Type, Data in Fields:
+				frame.FieldOutput(name=Name, description=Description, type=Type).addData(position=NODAL, instance=instance,
+					labels=ContactLabels, data=Data)
+
+			frame.FieldOutput(name='U', description='Spatial displacement', type=VECTOR).addData(position=NODAL, instance=instance,
+				labels=NodeLabels, data=numpy.zeros((len(NodeLabels), 3)))
+			frame.FieldOutput(name='COORD', description='Coordinates of nodes', type=VECTOR).addData(position=NODAL, instance=instance,
+				labels=NodeLabels, data=Coordinates)
+
+	odb.save()
+	odb.close()
+
+	# Files of a datacheck run are not written by an analysis
+	for Extension in ('.stt', '.res', '.mdl', '.prt'):
+		if os.path.exists(JobName + Extension):
+			os.remove(JobName + Extension)
+
+if __name__ == '__main__':
+
+	Options = ParseArguments(sys.argv[1:])
+
+	if 'job' not in Options:
+		sys.exit('FakeSolver.py: job=NAME is required')
+
+	JobName = Options['job']
+	InputFileName = Options.get('input', JobName)
+	if not InputFileName.lower().endswith('.inp'):
+		InputFileName = InputFileName + '.inp'
+
+	Solve(JobName, InputFileName, int(Options['frames']), Options['contact'], float(Options['relief']), float(Options['pressure']), float(Options['slip']))
+
+	print('FakeSolver.py: ' + JobName + '.odb written')
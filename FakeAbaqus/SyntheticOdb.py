@@ -0,0 +1,280 @@
+"""
+SyntheticOdb.py
+
+Generates synthetic fake ODBs of configurable size for the FakeAbaqus package (see odbAccess.py), to run and benchmark the
+fretting, Archard wear and ODB transfer scripts of this folder without an Abaqus license.
+
+The model is one orphan mesh instance (default PART-1-1) of C3D8R bricks, one layer thick. The top face nodes are the contact
+(slave) nodes, ContactNodes of them in a square grid of unit spacing. Every step has FramesPerStep frames over a step time of 1.0.
+The frames have the field outputs
+
+CSHEAR1, CSHEAR2, CSLIP1, CSLIP2, CPRESS  : scalar, contact nodes (nodes with open contact have no CSHEAR, CPRESS, CNORMF value)
+CNORMF                                    : vector, contact nodes with closed contact
+COORD, U, A                               : vector, all nodes
+S                                         : tensor, one integration point per element
+
+generated from smooth functions of the node position and time plus seeded noise. The same recipe and seed always give the same values.
+Every step has the history region 'Assembly ASSEMBLY' with ALLIE and ALLSE.
+
+The contact nodes are split into the node sets NodeSetNames in label order, with Overlap (fraction of a set) shared by neighbouring sets.
+Element sets of the same names hold the elements having a node in the node set.
+
+With DataCheck the ODB holds the mesh, sets and empty steps like an ODB from a datacheck run, to write results into.
+With InpFileName (--inp) the orphan mesh INP of the model is written as well, for example as template of the worn INP of ArchardWearIterator.py.
+
+Usage (Linux):
+
+export PYTHONPATH=/path/to/FakeAbaqus
+python SyntheticOdb.py boltedFlange.odb --contact-nodes 100000 --steps 4 --frames 12 --node-sets TOPFLANGE_ALL,BOTFLANGE_ALL --overlap 0.1
+python SyntheticOdb.py boltedFlangeDataCheck.odb --contact-nodes 100000 --steps 4 --node-sets TOPFLANGE_ALL,BOTFLANGE_ALL --overlap 0.1 --datacheck
+
+OR from python:
+
+from SyntheticOdb import CreateSyntheticOdb
+CreateSyntheticOdb('boltedFlange.odb', ContactNodes=100000, NumberOfSteps=4, FramesPerStep=12)
+
+Revision history:
+REV-00 (18th October 2026): 1st release
+REV-01 (18th October 2026): Optional orphan mesh INP of the model
+
+Author:
+Ranjit GOPI
+Solution Consultant, SIMULIA India COE
+ranjit.gopi@3ds.com
+Simulia India Support Frontdesk:+91 44 43443000
+Simulia India Support Email: simulia.in.support@3ds.com
+3DS.COM/SIMULIA
+"""
+import math
+import zlib
+import argparse
+import numpy
+from abaqusConstants import *
+from odbAccess import Odb, DataBlock
+
+CONTACT_FIELD_NAMES = ('CSHEAR1', 'CSHEAR2', 'CSLIP1', 'CSLIP2', 'CPRESS')
+VECTOR_FIELD_NAMES = ('CNORMF', 'COORD', 'U', 'A')
+FIELD_DESCRIPTIONS = {'CSHEAR1': 'Frictional shear stress', 'CSHEAR2': 'Frictional shear stress',
+	'CSLIP1': 'Relative tangential motion direction 1', 'CSLIP2': 'Relative tangential motion direction 2',
+	'CPRESS': 'Contact pressure', 'CNORMF': 'Contact normal force', 'COORD': 'Coordinates of nodes',
+	'U': 'Spatial displacement', 'A': 'Spatial acceleration', 'S': 'Stress components'}
+
+class SyntheticOdbRecipe:
+	# Mesh and field output recipe of a synthetic ODB, stored in the ODB file in place of the field data
+
+	def __init__(self, ContactNodes=10000, NumberOfSteps=4, FramesPerStep=12, Seed=0, InstanceName='PART-1-1',
+			OpenFraction=0.05, SlipAmplitude=0.01, Pressure=100.0, FrictionCoefficient=0.3):
+
+		self.NodesX = int(math.ceil(math.sqrt(ContactNodes)))
+		self.NodesY = max(int(math.ceil(float(ContactNodes)/self.NodesX)), 2)
+		self.NodesX = max(self.NodesX, 2)
+		self.NumberOfSteps = NumberOfSteps
+		self.FramesPerStep = FramesPerStep
+		self.Seed = Seed
+		self.InstanceName = InstanceName
+		self.OpenFraction = OpenFraction
+		self.SlipAmplitude = SlipAmplitude
+		self.Pressure = Pressure
+		self.FrictionCoefficient = FrictionCoefficient
+		self.MeshArrays = None
+
+	def __getstate__(self):
+		State = self.__dict__.copy()
+		State['MeshArrays'] = None
+		return State
+
+	def ContactNodeCount(self):
+		return self.NodesX*self.NodesY
+
+	def Mesh(self):
+		# Node labels, coordinates, element labels and connectivity, the top layer nodes come first
+		if self.MeshArrays is not None:
+			return self.MeshArrays
+
+		NX, NY = self.NodesX, self.NodesY
+		GridX, GridY = numpy.meshgrid(numpy.arange(NX, dtype=numpy.float64), numpy.arange(NY, dtype=numpy.float64))
+		GridX = GridX.reshape(-1)
+		GridY = GridY.reshape(-1)
+		Top = numpy.column_stack([GridX, GridY, numpy.zeros(NX*NY)])
+		Bottom = numpy.column_stack([GridX, GridY, -numpy.ones(NX*NY)])
+
+		NodeLabels = numpy.arange(1, 2*NX*NY + 1, dtype=numpy.int64)
+		NodeCoordinates = numpy.vstack([Top, Bottom])
+
+		I, J = numpy.meshgrid(numpy.arange(NX - 1), numpy.arange(NY - 1))
+		I = I.reshape(-1)
+		J = J.reshape(-1)
+		TopCorner = 1 + J*NX + I
+		BottomCorner = TopCorner + NX*NY
+		# C3D8 node order, bottom face 1-4 then top face 5-8
+		ElementConnectivity = numpy.column_stack([BottomCorner, BottomCorner + 1, BottomCorner + 1 + NX, BottomCorner + NX,
+			TopCorner, TopCorner + 1, TopCorner + 1 + NX, TopCorner + NX]).astype(numpy.int64)
+		ElementLabels = numpy.arange(1, len(ElementConnectivity) + 1, dtype=numpy.int64)
+
+		self.MeshArrays = (NodeLabels, NodeCoordinates, ElementLabels, ElementConnectivity)
+		return self.MeshArrays
+
+	def FrameTime(self, FrameIndex):
+		return FrameIndex/float(max(self.FramesPerStep - 1, 1))
+
+	def RandomState(self, StepIndex, FrameIndex, Name):
+		Seed = (self.Seed*1000003 + StepIndex*100003 + FrameIndex*7919 + zlib.crc32(Name.encode('ascii'))) % (2**32)
+		return numpy.random.RandomState(Seed)
+
+	def FieldBlocks(self, StepIndex, FrameIndex, Name):
+		# Data blocks of the field Name of a frame, see the module description
+		NodeLabels, NodeCoordinates, ElementLabels, ElementConnectivity = self.Mesh()
+		ContactCount = self.ContactNodeCount()
+
+		Time = StepIndex + self.FrameTime(FrameIndex)
+		Phase = 2.0*math.pi*Time
+		Noise = self.RandomState(StepIndex, FrameIndex, Name)
+
+		X = NodeCoordinates[:ContactCount, 0]/max(self.NodesX - 1, 1)
+		Y = NodeCoordinates[:ContactCount, 1]/max(self.NodesY - 1, 1)
+		RadiusSquared = (X - 0.5)**2 + (Y - 0.5)**2
+		Pressure = self.Pressure*(1.0 - RadiusSquared)*(1.0 + 0.2*math.sin(Phase))
+		Closed = self.RandomState(StepIndex, FrameIndex, 'OPEN').random_sample(ContactCount) >= self.OpenFraction
+
+		if Name in CONTACT_FIELD_NAMES or Name == 'CNORMF':
+			Labels = NodeLabels[:ContactCount]
+			if Name == 'CSLIP1':
+				Data = self.SlipAmplitude*((0.5 + X)*math.sin(Phase) + 0.1*Time)
+			elif Name == 'CSLIP2':
+				Data = 0.5*self.SlipAmplitude*(0.5 + Y)*math.cos(Phase)
+			elif Name == 'CPRESS':
+				Data = Pressure
+			elif Name == 'CSHEAR1':
+				Data = self.FrictionCoefficient*Pressure*math.cos(Phase)
+			elif Name == 'CSHEAR2':
+				Data = 0.5*self.FrictionCoefficient*Pressure*math.sin(Phase)
+			else:
+				Data = numpy.column_stack([0.01*(X - 0.5)*Pressure, 0.01*(Y - 0.5)*Pressure, -Pressure])
+			Data = Data*(1.0 + 0.01*Noise.standard_normal(ContactCount).reshape(-1, *([1]*(numpy.ndim(Data) - 1))))
+			if Name != 'CSLIP1' and Name != 'CSLIP2':
+				Labels = Labels[Closed]
+				Data = Data[Closed]
+			return [DataBlock(self.InstanceName, NODAL, Labels, Data)]
+
+		AllX = NodeCoordinates[:, 0]/max(self.NodesX - 1, 1)
+		AllY = NodeCoordinates[:, 1]/max(self.NodesY - 1, 1)
+		Displacement = numpy.column_stack([self.SlipAmplitude*AllX*math.sin(Phase), self.SlipAmplitude*AllY*math.cos(Phase),
+			-0.001*(1.0 + NodeCoordinates[:, 2])*(1.0 + 0.2*math.sin(Phase))])
+
+		if Name == 'U':
+			return [DataBlock(self.InstanceName, NODAL, NodeLabels, Displacement)]
+		if Name == 'COORD':
+			return [DataBlock(self.InstanceName, NODAL, NodeLabels, NodeCoordinates + Displacement)]
+		if Name == 'A':
+			return [DataBlock(self.InstanceName, NODAL, NodeLabels, -(2.0*math.pi)**2*Displacement)]
+		if Name == 'S':
+			Data = self.Pressure*Noise.standard_normal((len(ElementLabels), 6))
+			return [DataBlock(self.InstanceName, INTEGRATION_POINT, ElementLabels, Data)]
+
+		raise KeyError(Name)
+
+def SplitIntoSets(Labels, NodeSetNames, Overlap):
+	# Consecutive chunks of Labels, each extended by Overlap (fraction of a chunk) into the next chunk
+	ChunkSize = int(math.ceil(float(len(Labels))/len(NodeSetNames)))
+	Extension = int(round(Overlap*ChunkSize))
+	Sets = []
+	for index, NodeSetName in enumerate(NodeSetNames):
+		Sets.append((NodeSetName, Labels[index*ChunkSize:(index + 1)*ChunkSize + Extension]))
+	return Sets
+
+def WriteSyntheticInp(InpFileName, Recipe, NodeSets, NumberOfSteps):
+	# Orphan mesh INP of the synthetic model like ANSA or Hypermesh write it, used as template of the worn INP and for datacheck jobs
+	NodeLabels, NodeCoordinates, ElementLabels, ElementConnectivity = Recipe.Mesh()
+
+	with open(InpFileName, 'w') as myfile:
+		myfile.write('*HEADING\nSynthetic orphan mesh model\n')
+		myfile.write('*NODE\n')
+		for Label, Coordinates in zip(NodeLabels.tolist(), NodeCoordinates.tolist()):
+			myfile.write('%d, %.12g, %.12g, %.12g\n' % (Label, Coordinates[0], Coordinates[1], Coordinates[2]))
+		myfile.write('*ELEMENT, TYPE=C3D8R, ELSET=ALL-ELEMENTS\n')
+		for Label, Connectivity in zip(ElementLabels.tolist(), ElementConnectivity.tolist()):
+			myfile.write(', '.join(str(value) for value in [Label] + Connectivity) + '\n')
+		for NodeSetName, Labels in NodeSets:
+			myfile.write('*NSET, NSET=' + NodeSetName + '\n')
+			Labels = numpy.asarray(Labels).tolist()
+			for Start in range(0, len(Labels), 16):
+				myfile.write(', '.join(str(Label) for Label in Labels[Start:Start + 16]) + '\n')
+		myfile.write('*SOLID SECTION, ELSET=ALL-ELEMENTS, MATERIAL=STEEL\n')
+		myfile.write('*MATERIAL, NAME=STEEL\n*ELASTIC\n210000., 0.3\n')
+		for StepIndex in range(NumberOfSteps):
+			myfile.write('*STEP, NAME=Step-' + str(StepIndex + 1) + '\n*STATIC\n0.1, 1.0\n')
+			myfile.write('*OUTPUT, FIELD\n*NODE OUTPUT\nU, COORD\n*CONTACT OUTPUT\nCSTRESS, CDISP, CFORCE\n*END STEP\n')
+
+def CreateSyntheticOdb(FileName, ContactNodes=10000, NumberOfSteps=4, FramesPerStep=12, NodeSetNames=('CONTACT-NODES',),
+		Overlap=0.0, Seed=0, DataCheck=False, InstanceName='PART-1-1', InpFileName=None):
+	# Writes a synthetic fake ODB to FileName and returns its recipe, with InpFileName also the orphan mesh INP of the model
+
+	Recipe = SyntheticOdbRecipe(ContactNodes, NumberOfSteps, FramesPerStep, Seed, InstanceName)
+	NodeLabels, NodeCoordinates, ElementLabels, ElementConnectivity = Recipe.Mesh()
+
+	SyntheticOdb = Odb(name=FileName, analysisTitle='Synthetic ODB', path=FileName)
+	Part = SyntheticOdb.Part(name=InstanceName, embeddedSpace=THREE_D, type=DEFORMABLE_BODY)
+	Part.addNodes(labels=NodeLabels, coordinates=NodeCoordinates)
+	Part.addElements(labels=ElementLabels, connectivity=ElementConnectivity, type='C3D8R')
+	Instance = SyntheticOdb.rootAssembly.Instance(name=InstanceName, object=Part)
+
+	ContactLabels = NodeLabels[:Recipe.ContactNodeCount()]
+	NodeSets = SplitIntoSets(ContactLabels, list(NodeSetNames), Overlap)
+	for NodeSetName, Labels in NodeSets:
+		Instance.NodeSetFromLabels(NodeSetName, Labels)
+		InSet = numpy.isin(ElementConnectivity, Labels).any(axis=1)
+		Instance.ElementSetFromLabels(NodeSetName, ElementLabels[InSet])
+
+	if InpFileName:
+		WriteSyntheticInp(InpFileName, Recipe, NodeSets, NumberOfSteps)
+
+	for StepIndex in range(NumberOfSteps):
+		Step = SyntheticOdb.Step(name='Step-' + str(StepIndex + 1), description='Synthetic step', domain=TIME, timePeriod=1.0)
+		if DataCheck:
+			continue
+
+		Energy = Step.HistoryRegion(name='Assembly ASSEMBLY', description='Energies of the whole model')
+		InternalEnergy = Energy.HistoryOutput(name='ALLIE', description='Internal energy', type=SCALAR)
+		StrainEnergy = Energy.HistoryOutput(name='ALLSE', description='Strain energy', type=SCALAR)
+
+		for FrameIndex in range(FramesPerStep):
+			FrameTime = Recipe.FrameTime(FrameIndex)
+			Frame = Step.Frame(incrementNumber=FrameIndex, frameValue=FrameTime, description='Increment ' + str(FrameIndex) + ': Step Time = ' + str(FrameTime))
+			for Name in CONTACT_FIELD_NAMES:
+				Frame.GeneratedFieldOutput(Recipe, Name, FIELD_DESCRIPTIONS[Name], SCALAR, ())
+			for Name in VECTOR_FIELD_NAMES:
+				Frame.GeneratedFieldOutput(Recipe, Name, FIELD_DESCRIPTIONS[Name], VECTOR, (Name + '1', Name + '2', Name + '3'))
+			Frame.GeneratedFieldOutput(Recipe, 'S', FIELD_DESCRIPTIONS['S'], TENSOR_3D_FULL, ('S11', 'S22', 'S33', 'S12', 'S13', 'S23'), (MISES,))
+
+			Time = StepIndex + FrameTime
+			InternalEnergy.addData(frame=Time, value=Recipe.Pressure*len(ElementLabels)*Time)
+			StrainEnergy.addData(frame=Time, value=0.9*Recipe.Pressure*len(ElementLabels)*Time)
+
+	SyntheticOdb.save()
+	SyntheticOdb.close()
+
+	return Recipe
+
+if __name__ == '__main__':
+
+	Parser = argparse.ArgumentParser(description='Writes a synthetic fake ODB')
+	Parser.add_argument('FileName')
+	Parser.add_argument('--contact-nodes', type=int, default=10000)
+	Parser.add_argument('--steps', type=int, default=4)
+	Parser.add_argument('--frames', type=int, default=12)
+	Parser.add_argument('--node-sets', default='CONTACT-NODES', help='Node set names separated by comma')
+	Parser.add_argument('--overlap', type=float, default=0.0)
+	Parser.add_argument('--seed', type=int, default=0)
+	Parser.add_argument('--instance', default='PART-1-1')
+	Parser.add_argument('--datacheck', action='store_true')
+	Parser.add_argument('--inp', default=None, help='Also write the orphan mesh INP of the model to this file')
+	Arguments = Parser.parse_args()
+
+	# The recipe is pickled in the ODB, it has to be the class of module SyntheticOdb and not of __main__
+	import SyntheticOdb
+
+	NodeSetNames = [NodeSetName.strip() for NodeSetName in Arguments.node_sets.split(',')]
+	Recipe = SyntheticOdb.CreateSyntheticOdb(Arguments.FileName, Arguments.contact_nodes, Arguments.steps, Arguments.frames, NodeSetNames,
+		Arguments.overlap, Arguments.seed, Arguments.datacheck, Arguments.instance, Arguments.inp)
+
+	print('Written ' + Arguments.FileName + ' with ' + str(Recipe.ContactNodeCount()) + ' contact nodes')
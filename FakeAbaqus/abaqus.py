@@ -0,0 +1,235 @@
+"""
+abaqus.py
+
+Stand-in for the Abaqus abaqus module of the CAE kernel (FakeAbaqus package, see odbAccess.py).
+
+getInputs returns the values of the environment variable FAKE_ABAQUS_INPUTS, separated by semicolon, in place of the input dialog.
+Missing values are the default values of the dialog. For example:
+
+export FAKE_ABAQUS_INPUTS='Synthetic;Step-1;ALL;CONTACT-NODES;1e-5'
+python ArchardWearIterator.py
+
+mdb models the calls used by the scripts of this folder:
+mdb.Model, Model.PartFromOdb (UNDEFORMED or DEFORMED mesh of an ODB frame), rootAssembly.Instance, mdb.Job and Job.writeInput,
+which writes the part mesh as an INP file like Abaqus CAE, and mdb.JobFromInputFile with Job.submit(datacheckJob=True),
+which writes a fake ODB with the mesh, sets and empty steps of the INP file like a datacheck run.
+
+Please note:
+1. Jobs other than datacheck jobs cannot be run by this module, submit raises AbaqusException
+2. The INP reader of datacheck jobs reads *Node, *Element, *Nset, *Elset and *Step, element data lines continued on the next line are not supported
+
+Revision history:
+REV-00 (18th October 2026): 1st release
+
+Author:
+Ranjit GOPI
+Solution Consultant, SIMULIA India COE
+ranjit.gopi@3ds.com
+Simulia India Support Frontdesk:+91 44 43443000
+Simulia India Support Email: simulia.in.support@3ds.com
+3DS.COM/SIMULIA
+"""
+import os
+import numpy
+from abaqusConstants import *
+from odbAccess import Odb, Repository
+
+class AbaqusException(Exception):
+	pass
+
+def getInputs(fields, label='', dialogTitle=''):
+	# Values of FAKE_ABAQUS_INPUTS separated by semicolon, the default value of a field when it has no value
+	Values = os.environ.get('FAKE_ABAQUS_INPUTS', '').split(';')
+	Inputs = []
+	for index, field in enumerate(fields):
+		if index < len(Values) and Values[index].strip():
+			Inputs.append(Values[index].strip())
+		else:
+			Inputs.append(field[1])
+	return Inputs
+
+class Part:
+	# Orphan mesh part, arrays of node labels, coordinates, element labels, types and connectivity
+
+	def __init__(self, name, NodeLabels, NodeCoordinates, ElementLabels, ElementTypes, ElementConnectivity):
+		self.name = name
+		self.NodeLabels = NodeLabels
+		self.NodeCoordinates = NodeCoordinates
+		self.ElementLabels = ElementLabels
+		self.ElementTypes = ElementTypes
+		self.ElementConnectivity = ElementConnectivity
+
+class PartInstance:
+
+	def __init__(self, name, part, dependent=ON):
+		self.name = name
+		self.part = part
+		self.dependent = dependent
+
+class Assembly:
+
+	def __init__(self):
+		self.instances = Repository()
+
+	def Instance(self, name, part, dependent=ON):
+		self.instances[name] = PartInstance(name, part, dependent)
+		return self.instances[name]
+
+class Model:
+
+	def __init__(self, name, modelType=STANDARD_EXPLICIT):
+		self.name = name
+		self.modelType = modelType
+		self.parts = Repository()
+		self.rootAssembly = Assembly()
+
+	def PartFromOdb(self, name, odb, instance=None, shape=UNDEFORMED, step=None, frame=None):
+		# Mesh of the instance of odb, with shape=DEFORMED the nodes are moved by U of frame of step (step index from 0)
+		if instance is None:
+			instance = odb.rootAssembly.instances.keys()[0]
+		OdbInstance = odb.rootAssembly.instances[instance]
+
+		NodeCoordinates = OdbInstance.NodeCoordinates.copy()
+		if shape == DEFORMED:
+			if step is None:
+				step = len(odb.steps) - 1
+			Frame = odb.steps.values()[step].frames[-1 if frame is None else frame]
+			for block in Frame.fieldOutputs['U'].getSubset(region=OdbInstance).DataBlocks():
+				Positions = OdbInstance.NodePositions(block.Labels)
+				NodeCoordinates[Positions] = NodeCoordinates[Positions] + block.Data[:, :3]
+
+		self.parts[name] = Part(name, OdbInstance.NodeLabels.copy(), NodeCoordinates, OdbInstance.ElementLabels.copy(),
+			list(OdbInstance.ElementTypes), OdbInstance.ElementConnectivity.copy())
+		return self.parts[name]
+
+class Job:
+
+	def __init__(self, name, model=None, inputFileName=None, **Options):
+		self.name = name
+		self.model = model
+		self.inputFileName = inputFileName
+		self.status = None
+
+	def writeInput(self, consistencyChecking=ON):
+		# Writes the part mesh of the model as name.inp, nodes and elements inside *Part like Abaqus CAE
+		Model = mdb.models[self.model]
+		with open(self.name + '.inp', 'w') as myfile:
+			myfile.write('*Heading\n')
+			myfile.write('** Job name: ' + self.name + ' Model name: ' + Model.name + '\n')
+			myfile.write('*Preprint, echo=NO, model=NO, history=NO, contact=NO\n')
+			myfile.write('**\n** PARTS\n**\n')
+			for part in Model.parts.values():
+				myfile.write('*Part, name=' + part.name + '\n')
+				myfile.write('*Node\n')
+				for Label, Coordinates in zip(part.NodeLabels.tolist(), part.NodeCoordinates.tolist()):
+					myfile.write('%7d, %13.7g, %13.7g, %13.7g\n' % (Label, Coordinates[0], Coordinates[1], Coordinates[2]))
+				ElementType = None
+				for Label, Type, Connectivity in zip(part.ElementLabels.tolist(), part.ElementTypes, part.ElementConnectivity.tolist()):
+					if Type != ElementType:
+						myfile.write('*Element, type=' + Type + '\n')
+						ElementType = Type
+					myfile.write(', '.join(str(value) for value in [Label] + [node for node in Connectivity if node > 0]) + '\n')
+				myfile.write('*End Part\n')
+			myfile.write('**\n** ASSEMBLY\n**\n*Assembly, name=Assembly\n**\n')
+			for instance in Model.rootAssembly.instances.values():
+				myfile.write('*Instance, name=' + instance.name + ', part=' + instance.part.name + '\n*End Instance\n**\n')
+			myfile.write('*End Assembly\n')
+
+	def submit(self, datacheckJob=False, consistencyChecking=ON, **Options):
+		if not datacheckJob:
+			raise AbaqusException('The fake abaqus module can only run datacheck jobs, job ' + self.name)
+		DataCheckOdbFromInp(self.inputFileName or self.name + '.inp', self.name)
+		self.status = 'COMPLETED'
+
+	def waitForCompletion(self):
+		pass
+
+	def kill(self):
+		pass
+
+class Mdb:
+
+	def __init__(self):
+		self.models = Repository()
+		self.jobs = Repository()
+
+	def Model(self, name, modelType=STANDARD_EXPLICIT, **Options):
+		self.models[name] = Model(name, modelType)
+		return self.models[name]
+
+	def Job(self, name, model, **Options):
+		self.jobs[name] = Job(name, model=model)
+		return self.jobs[name]
+
+	def JobFromInputFile(self, name, inputFileName, **Options):
+		self.jobs[name] = Job(name, inputFileName=inputFileName)
+		return self.jobs[name]
+
+mdb = Mdb()
+
+def KeywordOptions(line):
+	# Keyword and options of an INP keyword line, *Nset, nset=TOP, generate -> ('*NSET', {'NSET': 'TOP', 'GENERATE': ''})
+	Parts = [part.strip() for part in line.split(',')]
+	Options = {}
+	for part in Parts[1:]:
+		if '=' in part:
+			Key, Value = part.split('=', 1)
+			Options[Key.strip().upper()] = Value.strip()
+		elif part:
+			Options[part.upper()] = ''
+	return Parts[0].upper(), Options
+
+def DataCheckOdbFromInp(InputFileName, JobName):
+	# Writes JobName.odb with the nodes, elements, node and element sets and empty steps of the INP file
+	NodeData = []
+	Elements = []
+	NodeSets = {}
+	ElementSets = {}
+	StepNames = []
+	InstanceName = 'PART-1-1'
+
+	Keyword, Options = None, {}
+	with open(InputFileName, 'r') as InputFile:
+		for line in InputFile:
+			line = line.strip()
+			if not line or line.startswith('**'):
+				continue
+			if line.startswith('*'):
+				Keyword, Options = KeywordOptions(line)
+				if Keyword == '*INSTANCE':
+					InstanceName = Options.get('NAME', InstanceName)
+				elif Keyword == '*STEP':
+					StepNames.append(Options.get('NAME', 'Step-' + str(len(StepNames) + 1)))
+				continue
+
+			Values = [value.strip() for value in line.split(',') if value.strip()]
+			if Keyword == '*NODE':
+				NodeData.append([float(value) for value in Values[:4]] + [0.0]*(4 - len(Values[:4])))
+			elif Keyword == '*ELEMENT':
+				Elements.append((Options.get('TYPE', 'C3D8R'), [int(value) for value in Values]))
+			elif Keyword in ('*NSET', '*ELSET'):
+				Sets, Name = (NodeSets, Options.get('NSET')) if Keyword == '*NSET' else (ElementSets, Options.get('ELSET'))
+				Labels = [int(value) for value in Values]
+				if 'GENERATE' in Options:
+					Labels = list(range(Labels[0], Labels[1] + 1, Labels[2] if len(Labels) > 2 else 1))
+				Sets.setdefault(Name, []).extend(Labels)
+
+	DataCheckOdb = Odb(name=JobName + '.odb', analysisTitle=JobName, path=JobName + '.odb')
+	Part = DataCheckOdb.Part(name=InstanceName, embeddedSpace=THREE_D, type=DEFORMABLE_BODY)
+	Part.addNodes(nodeData=NodeData)
+	for Type in sorted(set(Type for Type, Connectivity in Elements)):
+		Data = [Connectivity for ElementType, Connectivity in Elements if ElementType == Type]
+		Part.addElements(elementData=Data, type=Type)
+	Instance = DataCheckOdb.rootAssembly.Instance(name=InstanceName, object=Part)
+	for Name, Labels in NodeSets.items():
+		Instance.NodeSetFromLabels(Name.upper(), numpy.unique(Labels))
+	for Name, Labels in ElementSets.items():
+		Instance.ElementSetFromLabels(Name.upper(), numpy.unique(Labels))
+	for StepName in StepNames:
+		DataCheckOdb.Step(name=StepName, description='', domain=TIME, timePeriod=1.0)
+	DataCheckOdb.save()
+	DataCheckOdb.close()
+
+	# Files of a datacheck run which the scripts remove afterwards
+	for Extension in ('.stt', '.res', '.mdl', '.prt'):
+		open(JobName + Extension, 'w').close()
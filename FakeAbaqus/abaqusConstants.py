@@ -0,0 +1,49 @@
+"""
+abaqusConstants.py
+
+Stand-in for the Abaqus abaqusConstants module, part of the FakeAbaqus package (see FakeAbaqus/odbAccess.py).
+
+The constants are symbolic constants which print and compare by name like the Abaqus ones.
+
+Revision history:
+REV-00 (18th October 2026): 1st release
+
+Author:
+Ranjit GOPI
+Solution Consultant, SIMULIA India COE
+ranjit.gopi@3ds.com
+Simulia India Support Frontdesk:+91 44 43443000
+Simulia India Support Email: simulia.in.support@3ds.com
+3DS.COM/SIMULIA
+"""
+
+class SymbolicConstant(str):
+	# Symbolic constant, a string which prints its name
+
+	def __repr__(self):
+		return str(self)
+
+	def getText(self):
+		return str(self)
+
+CONSTANT_NAMES = (
+	# Boolean like
+	'ON', 'OFF', 'TRUE', 'FALSE',
+	# Step domains and procedures
+	'TIME', 'FREQUENCY', 'MODAL', 'ARC_LENGTH', 'STANDARD_EXPLICIT',
+	# Field output positions
+	'NODAL', 'INTEGRATION_POINT', 'ELEMENT_NODAL', 'CENTROID', 'WHOLE_ELEMENT',
+	# Field output types
+	'SCALAR', 'VECTOR', 'TENSOR_3D_FULL', 'TENSOR_3D_PLANAR', 'TENSOR_2D_PLANAR',
+	# Invariants
+	'MISES', 'MAGNITUDE', 'TRESCA', 'PRESS', 'MAX_PRINCIPAL', 'MIN_PRINCIPAL',
+	# Parts and shapes
+	'THREE_D', 'TWO_D_PLANAR', 'AXISYMMETRIC', 'DEFORMABLE_BODY', 'DEFORMED', 'UNDEFORMED',
+	# Precision
+	'SINGLE_PRECISION', 'DOUBLE_PRECISION',
+	)
+
+for ConstantName in CONSTANT_NAMES:
+	globals()[ConstantName] = SymbolicConstant(ConstantName)
+
+del ConstantName
@@ -0,0 +1,17 @@
+"""
+job.py
+
+Stand-in for the Abaqus job module (FakeAbaqus package, see odbAccess.py). The job objects are in abaqus.py (mdb.Job, mdb.JobFromInputFile).
+
+Revision history:
+REV-00 (18th October 2026): 1st release
+
+Author:
+Ranjit GOPI
+Solution Consultant, SIMULIA India COE
+ranjit.gopi@3ds.com
+Simulia India Support Frontdesk:+91 44 43443000
+Simulia India Support Email: simulia.in.support@3ds.com
+3DS.COM/SIMULIA
+"""
+from abaqus import Job, AbaqusException
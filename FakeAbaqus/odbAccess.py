@@ -0,0 +1,736 @@
+"""
+odbAccess.py
+
+Pure python stand-in for the Abaqus odbAccess module (FakeAbaqus package), to run and profile the scripts of this folder
+(fretting, Archard wear and ODB transfer scripts) on any machine with python and numpy, without an Abaqus license.
+
+Only the part of the ODB API used by the scripts is modelled:
+openOdb, Odb, steps, frames, fieldOutputs with getSubset, values and bulkDataBlocks, field arithmetic, FieldOutput and addData,
+instances with nodes, elements, node sets and element sets, history regions with history outputs, Step, Frame, save and close.
+
+A fake ODB file is a pickle of the Odb object. Field outputs of synthetic ODBs (see SyntheticOdb.py) are not stored in the file,
+they are generated from the recipe of the ODB every time they are read, so ODBs with millions of nodes and hundreds of frames
+are only a few MB on disk and memory. Fields added with addData or FieldOutput are stored.
+
+Usage (Linux):
+
+export PYTHONPATH=/path/to/FakeAbaqus
+python /path/to/FakeAbaqus/SyntheticOdb.py boltedFlange.odb --contact-nodes 10000 --steps 4 --frames 12
+python FrettingAssesmentUsingRuizParameter.py
+
+The modules abaqus.py (getInputs, mdb) and job.py of this folder stand in for the CAE kernel modules used by ArchardWearIterator.py
+and Transfer-results-from-one-ODB-to-another. FakeSolver.py stands in for the abaqus analysis command run by ArchardWearCycleDriver.py.
+The unit tests of the engines of the repository (test_*.py of this folder) run on small synthetic inputs: python -m pytest FakeAbaqus
+
+Please note:
+1. This is a test and benchmark tool, results written to a fake ODB can only be read back with this module
+2. FIELD_READS counts the field outputs read per field name, scripts reading the same field several times can be found with it
+3. Element fields store one row per integration point, values and bulkDataBlocks have the element label repeated for every point
+
+Revision history:
+REV-00 (18th October 2026): 1st release
+REV-01 (18th October 2026): values is built on access (FieldValueArray), field data is stored in single precision like in an ODB
+REV-02 (18th October 2026): Unit tests of the engines in test_*.py
+
+Author:
+Ranjit GOPI
+Solution Consultant, SIMULIA India COE
+ranjit.gopi@3ds.com
+Simulia India Support Frontdesk:+91 44 43443000
+Simulia India Support Email: simulia.in.support@3ds.com
+3DS.COM/SIMULIA
+"""
+import os
+import pickle
+import collections
+import numpy
+from abaqusConstants import *
+
+PICKLE_PROTOCOL = 2
+
+# Number of field output reads (values or bulkDataBlocks) per field name
+FIELD_READS = collections.defaultdict(int)
+
+class OdbError(Exception):
+	pass
+
+class Repository(collections.OrderedDict):
+	# Abaqus repository, keys() is a list in insertion order like in Abaqus python 2
+
+	def keys(self):
+		return list(collections.OrderedDict.keys(self))
+
+	def values(self):
+		return list(collections.OrderedDict.values(self))
+
+	def items(self):
+		return list(collections.OrderedDict.items(self))
+
+class OdbMeshNode:
+
+	def __init__(self, label, coordinates, instanceName=None):
+		self.label = int(label)
+		self.coordinates = numpy.asarray(coordinates, dtype=numpy.float32)
+		self.instanceName = instanceName
+
+	def __repr__(self):
+		return 'OdbMeshNode(label=%d)' % self.label
+
+class OdbMeshElement:
+
+	def __init__(self, label, type, connectivity, instanceName=None):
+		self.label = int(label)
+		self.type = type
+		self.connectivity = tuple(int(node) for node in connectivity)
+		self.instanceName = instanceName
+
+	def __repr__(self):
+		return 'OdbMeshElement(label=%d)' % self.label
+
+class MeshNodeArray:
+	# Sequence of OdbMeshNode built on access from the label and coordinate arrays of an instance or set
+
+	def __init__(self, Instance, Positions=None):
+		self.Instance = Instance
+		self.Positions = Positions
+
+	def __len__(self):
+		if self.Positions is None:
+			return len(self.Instance.NodeLabels)
+		return len(self.Positions)
+
+	def __getitem__(self, Index):
+		if isinstance(Index, slice):
+			return [self[i] for i in range(*Index.indices(len(self)))]
+		if Index < 0:
+			Index = Index + len(self)
+		if Index < 0 or Index >= len(self):
+			raise IndexError('Sequence index out of range')
+		Position = Index if self.Positions is None else self.Positions[Index]
+		return OdbMeshNode(self.Instance.NodeLabels[Position], self.Instance.NodeCoordinates[Position], self.Instance.name)
+
+	def __iter__(self):
+		for Index in range(len(self)):
+			yield self[Index]
+
+	def Labels(self):
+		if self.Positions is None:
+			return self.Instance.NodeLabels
+		return self.Instance.NodeLabels[self.Positions]
+
+class MeshElementArray:
+	# Sequence of OdbMeshElement built on access from the label and connectivity arrays of an instance or set
+
+	def __init__(self, Instance, Positions=None):
+		self.Instance = Instance
+		self.Positions = Positions
+
+	def __len__(self):
+		if self.Positions is None:
+			return len(self.Instance.ElementLabels)
+		return len(self.Positions)
+
+	def __getitem__(self, Index):
+		if isinstance(Index, slice):
+			return [self[i] for i in range(*Index.indices(len(self)))]
+		if Index < 0:
+			Index = Index + len(self)
+		if Index < 0 or Index >= len(self):
+			raise IndexError('Sequence index out of range')
+		Position = Index if self.Positions is None else self.Positions[Index]
+		Connectivity = self.Instance.ElementConnectivity[Position]
+		return OdbMeshElement(self.Instance.ElementLabels[Position], self.Instance.ElementTypes[Position], Connectivity[Connectivity > 0], self.Instance.name)
+
+	def __iter__(self):
+		for Index in range(len(self)):
+			yield self[Index]
+
+	def Labels(self):
+		if self.Positions is None:
+			return self.Instance.ElementLabels
+		return self.Instance.ElementLabels[self.Positions]
+
+class OdbSet:
+	# Node set or element set of an instance, holds positions into the mesh arrays of the instance
+
+	def __init__(self, name, Instance, NodePositions=None, ElementPositions=None):
+		self.name = name
+		self.Instance = Instance
+		self.instanceNames = (Instance.name,)
+		self.NodePositions = NodePositions
+		self.ElementPositions = ElementPositions
+
+	@property
+	def nodes(self):
+		if self.NodePositions is None:
+			return MeshNodeArray(self.Instance, numpy.zeros(0, dtype=numpy.int64))
+		return MeshNodeArray(self.Instance, self.NodePositions)
+
+	@property
+	def elements(self):
+		if self.ElementPositions is None:
+			return MeshElementArray(self.Instance, numpy.zeros(0, dtype=numpy.int64))
+		return MeshElementArray(self.Instance, self.ElementPositions)
+
+	def NodeLabels(self):
+		return self.nodes.Labels()
+
+	def ElementLabels(self):
+		return self.elements.Labels()
+
+class OdbInstance:
+	# Part instance, nodes and elements are kept as numpy arrays
+
+	def __init__(self, name, NodeLabels=(), NodeCoordinates=(), ElementLabels=(), ElementTypes=(), ElementConnectivity=()):
+		self.name = name
+		self.NodeLabels = numpy.asarray(NodeLabels, dtype=numpy.int32).reshape(-1)
+		self.NodeCoordinates = numpy.asarray(NodeCoordinates, dtype=numpy.float32).reshape(len(self.NodeLabels), 3)
+		self.ElementLabels = numpy.asarray(ElementLabels, dtype=numpy.int32).reshape(-1)
+		self.ElementTypes = list(ElementTypes)
+		self.ElementConnectivity = numpy.asarray(ElementConnectivity, dtype=numpy.int32).reshape(len(self.ElementLabels), -1) if len(self.ElementLabels) else numpy.zeros((0, 0), dtype=numpy.int32)
+		self.nodeSets = Repository()
+		self.elementSets = Repository()
+		self.surfaces = Repository()
+		self.BuildLookup()
+
+	def BuildLookup(self):
+		self.NodeOrder = numpy.argsort(self.NodeLabels)
+		self.ElementOrder = numpy.argsort(self.ElementLabels)
+
+	def __getstate__(self):
+		State = self.__dict__.copy()
+		del State['NodeOrder']
+		del State['ElementOrder']
+		return State
+
+	def __setstate__(self, State):
+		self.__dict__.update(State)
+		self.BuildLookup()
+
+	@property
+	def nodes(self):
+		return MeshNodeArray(self)
+
+	@property
+	def elements(self):
+		return MeshElementArray(self)
+
+	def NodePositions(self, Labels):
+		# Positions of node labels in the mesh arrays, OdbError for labels not in the instance
+		return LookupPositions(self.NodeLabels, self.NodeOrder, Labels, 'Node', self.name)
+
+	def ElementPositions(self, Labels):
+		return LookupPositions(self.ElementLabels, self.ElementOrder, Labels, 'Element', self.name)
+
+	def getNodeFromLabel(self, label):
+		Position = self.NodePositions([label])[0]
+		return OdbMeshNode(self.NodeLabels[Position], self.NodeCoordinates[Position], self.name)
+
+	def getElementFromLabel(self, label):
+		return MeshElementArray(self, self.ElementPositions([label]))[0]
+
+	def NodeSetFromLabels(self, name, Labels):
+		self.nodeSets[name] = OdbSet(name, self, NodePositions=self.NodePositions(Labels))
+		return self.nodeSets[name]
+
+	def ElementSetFromLabels(self, name, Labels):
+		self.elementSets[name] = OdbSet(name, self, ElementPositions=self.ElementPositions(Labels))
+		return self.elementSets[name]
+
+def LookupPositions(SetLabels, Order, Labels, Kind, InstanceName):
+	Labels = numpy.asarray(Labels, dtype=numpy.int64).reshape(-1)
+	if len(SetLabels) == 0:
+		if len(Labels):
+			raise OdbError('%s label %d not found in instance %s' % (Kind, Labels[0], InstanceName))
+		return numpy.zeros(0, dtype=numpy.int64)
+	SortedPositions = numpy.searchsorted(SetLabels[Order], Labels)
+	SortedPositions[SortedPositions == len(SetLabels)] = 0
+	Positions = Order[SortedPositions]
+	Missing = SetLabels[Positions] != Labels
+	if Missing.any():
+		raise OdbError('%s label %d not found in instance %s' % (Kind, Labels[Missing][0], InstanceName))
+	return Positions
+
+class OdbPart:
+	# Part of a new ODB, turned into an instance by rootAssembly.Instance
+
+	def __init__(self, name, embeddedSpace=THREE_D, type=DEFORMABLE_BODY):
+		self.name = name
+		self.embeddedSpace = embeddedSpace
+		self.type = type
+		self.Mesh = OdbInstance(name)
+		self.NodeSetLabels = Repository()
+		self.ElementSetLabels = Repository()
+
+	def addNodes(self, labels=None, coordinates=None, nodeData=None, nodeSetName=None):
+		if nodeData is not None:
+			nodeData = numpy.asarray(nodeData, dtype=numpy.float64).reshape(-1, 4)
+			labels = nodeData[:, 0]
+			coordinates = nodeData[:, 1:]
+		labels = numpy.asarray(labels, dtype=numpy.int64).reshape(-1)
+		coordinates = numpy.asarray(coordinates, dtype=numpy.float64).reshape(len(labels), -1)
+		if coordinates.shape[1] < 3:
+			coordinates = numpy.hstack([coordinates, numpy.zeros((len(labels), 3 - coordinates.shape[1]))])
+
+		Mesh = self.Mesh
+		Mesh.NodeLabels = numpy.concatenate([Mesh.NodeLabels, labels])
+		Mesh.NodeCoordinates = numpy.vstack([Mesh.NodeCoordinates, coordinates])
+		Mesh.BuildLookup()
+		if nodeSetName:
+			self.NodeSetLabels[nodeSetName] = labels
+
+	def addElements(self, labels=None, connectivity=None, type='C3D8R', elementSetName=None, elementData=None):
+		if elementData is not None:
+			elementData = numpy.asarray(elementData, dtype=numpy.int64)
+			labels = elementData[:, 0]
+			connectivity = elementData[:, 1:]
+		labels = numpy.asarray(labels, dtype=numpy.int64).reshape(-1)
+		connectivity = numpy.asarray(connectivity, dtype=numpy.int64).reshape(len(labels), -1)
+
+		Mesh = self.Mesh
+		if len(Mesh.ElementLabels) and Mesh.ElementConnectivity.shape[1] != connectivity.shape[1]:
+			Width = max(Mesh.ElementConnectivity.shape[1], connectivity.shape[1])
+			Mesh.ElementConnectivity = PadColumns(Mesh.ElementConnectivity, Width)
+			connectivity = PadColumns(connectivity, Width)
+		Mesh.ElementLabels = numpy.concatenate([Mesh.ElementLabels, labels])
+		Mesh.ElementTypes = Mesh.ElementTypes + [type]*len(labels)
+		if len(Mesh.ElementConnectivity):
+			Mesh.ElementConnectivity = numpy.vstack([Mesh.ElementConnectivity, connectivity])
+		else:
+			Mesh.ElementConnectivity = connectivity
+		Mesh.BuildLookup()
+		if elementSetName:
+			self.ElementSetLabels[elementSetName] = labels
+
+def PadColumns(Array, Width):
+	Padded = numpy.zeros((Array.shape[0], Width), dtype=Array.dtype)
+	Padded[:, :Array.shape[1]] = Array
+	return Padded
+
+class OdbAssembly:
+
+	def __init__(self):
+		self.name = 'ASSEMBLY'
+		self.instances = Repository()
+		self.nodeSets = Repository()
+		self.elementSets = Repository()
+		self.surfaces = Repository()
+
+	def Instance(self, name, object):
+		Mesh = object.Mesh
+		NewInstance = OdbInstance(name, Mesh.NodeLabels, Mesh.NodeCoordinates, Mesh.ElementLabels, Mesh.ElementTypes, Mesh.ElementConnectivity)
+		for SetName, Labels in object.NodeSetLabels.items():
+			NewInstance.NodeSetFromLabels(SetName, Labels)
+		for SetName, Labels in object.ElementSetLabels.items():
+			NewInstance.ElementSetFromLabels(SetName, Labels)
+		self.instances[name] = NewInstance
+		return NewInstance
+
+class FieldValue:
+
+	def __init__(self, Label, Data, Position, InstanceName, IsElementField, ComponentCount):
+		if IsElementField:
+			self.elementLabel = int(Label)
+			self.nodeLabel = None
+		else:
+			self.nodeLabel = int(Label)
+			self.elementLabel = None
+		self.position = Position
+		self.instanceName = InstanceName
+		if ComponentCount == 1:
+			self.data = float(Data[0])
+			self.magnitude = None
+		else:
+			self.data = numpy.array(Data, dtype=numpy.float32)
+			self.magnitude = float(numpy.sqrt(numpy.dot(self.data[:3], self.data[:3])))
+		self.mises = None
+
+	@property
+	def instance(self):
+		return InstanceProxy(self.instanceName)
+
+class FieldValueArray:
+	# Sequence of FieldValue built on access from the data blocks of a field output, like the FieldValueArray of Abaqus
+
+	def __init__(self, Blocks):
+		self.Blocks = Blocks
+		self.Offsets = numpy.cumsum([0] + [len(block.Labels) for block in Blocks])
+
+	def __len__(self):
+		return int(self.Offsets[-1])
+
+	def __getitem__(self, Index):
+		if isinstance(Index, slice):
+			return [self[i] for i in range(*Index.indices(len(self)))]
+		if Index < 0:
+			Index = Index + len(self)
+		if Index < 0 or Index >= len(self):
+			raise IndexError('Sequence index out of range')
+		BlockIndex = int(numpy.searchsorted(self.Offsets, Index, side='right')) - 1
+		block = self.Blocks[BlockIndex]
+		Row = Index - self.Offsets[BlockIndex]
+		return FieldValue(block.Labels[Row], block.Data[Row], block.Position, block.InstanceName, block.Position != NODAL, block.Data.shape[1])
+
+	def __iter__(self):
+		for block in self.Blocks:
+			IsElementField = block.Position != NODAL
+			ComponentCount = block.Data.shape[1]
+			for Label, Data in zip(block.Labels.tolist(), block.Data.tolist()):
+				yield FieldValue(Label, Data, block.Position, block.InstanceName, IsElementField, ComponentCount)
+
+class InstanceProxy:
+
+	def __init__(self, name):
+		self.name = name
+
+class FieldBulkData:
+
+	def __init__(self, Block, IsElementField, ComponentLabels):
+		self.instance = InstanceProxy(Block.InstanceName)
+		self.position = Block.Position
+		self.componentLabels = ComponentLabels
+		self.data = Block.Data
+		if IsElementField:
+			self.elementLabels = Block.Labels.copy()
+			self.nodeLabels = None
+		else:
+			self.nodeLabels = Block.Labels.copy()
+			self.elementLabels = None
+
+class DataBlock:
+	# One (instance, position) block of a field output, Labels has one entry per row of Data
+	# Data is single precision and labels are 32 bit like in an Abaqus ODB
+
+	def __init__(self, InstanceName, Position, Labels, Data):
+		self.InstanceName = InstanceName
+		self.Position = Position
+		self.Labels = numpy.asarray(Labels, dtype=numpy.int32).reshape(-1)
+		self.Data = numpy.asarray(Data, dtype=numpy.float32).reshape(len(self.Labels), -1)
+
+	def Take(self, Mask):
+		return DataBlock(self.InstanceName, self.Position, self.Labels[Mask], self.Data[Mask])
+
+NUMBER_OF_COMPONENTS = {SCALAR: 1, VECTOR: 3, TENSOR_3D_FULL: 6}
+
+class FieldOutput:
+	# Field output of a frame, a list of DataBlock
+
+	def __init__(self, name, description='', type=SCALAR, componentLabels=(), validInvariants=(), Blocks=None, Generator=None):
+		self.name = name
+		self.description = description
+		self.type = type
+		self.componentLabels = tuple(componentLabels)
+		self.validInvariants = tuple(validInvariants)
+		self.Blocks = Blocks
+		self.Generator = Generator
+		if Blocks is None and Generator is None:
+			self.Blocks = []
+
+	def DataBlocks(self):
+		# Generated fields are generated again on every read like a field read again from an ODB file, they are never stored
+		if self.Generator is not None:
+			return self.Generator()
+		return self.Blocks
+
+	@property
+	def locations(self):
+		return [InstanceProxy(block.Position) for block in self.DataBlocks()]
+
+	def IsElementField(self):
+		return any(block.Position != NODAL for block in self.DataBlocks())
+
+	def ComponentCount(self):
+		for block in self.DataBlocks():
+			return block.Data.shape[1]
+		return NUMBER_OF_COMPONENTS.get(self.type, 1)
+
+	@property
+	def values(self):
+		FIELD_READS[self.name] = FIELD_READS[self.name] + 1
+		return FieldValueArray(self.DataBlocks())
+
+	@property
+	def bulkDataBlocks(self):
+		FIELD_READS[self.name] = FIELD_READS[self.name] + 1
+		return [FieldBulkData(block, block.Position != NODAL, self.componentLabels) for block in self.DataBlocks()]
+
+	def getSubset(self, region=None, position=None, elementType=None, sectionPoint=None):
+		Blocks = self.DataBlocks()
+
+		if position is not None:
+			Blocks = [block for block in Blocks if block.Position == position]
+
+		if region is not None:
+			Blocks = [SubsetBlock(block, region) for block in Blocks]
+			Blocks = [block for block in Blocks if block is not None]
+
+		return FieldOutput(self.name, self.description, self.type, self.componentLabels, self.validInvariants, Blocks=Blocks)
+
+	def addData(self, position=NODAL, instance=None, labels=(), data=(), field=None):
+		if field is not None:
+			self.Blocks = self.DataBlocks() + [DataBlock(block.InstanceName, block.Position, block.Labels, block.Data) for block in field.DataBlocks()]
+			return
+
+		labels = numpy.asarray(labels, dtype=numpy.int64).reshape(-1)
+		data = numpy.asarray(data, dtype=numpy.float64)
+		data = data.reshape(len(data), -1) if len(data) else data.reshape(0, NUMBER_OF_COMPONENTS.get(self.type, 1))
+
+		if len(labels) == 0:
+			raise OdbError('addData: no labels given')
+		if len(data) % len(labels):
+			raise OdbError('addData: %d data rows do not match %d labels' % (len(data), len(labels)))
+		if data.shape[1] != NUMBER_OF_COMPONENTS.get(self.type, data.shape[1]):
+			raise OdbError('addData: %d components given for a field of type %s' % (data.shape[1], self.type))
+		if len(labels) != len(numpy.unique(labels)):
+			raise OdbError('addData: duplicate labels')
+
+		if position == NODAL:
+			instance.NodePositions(labels)
+		else:
+			instance.ElementPositions(labels)
+			labels = numpy.repeat(labels, len(data)//len(labels))
+
+		self.DataBlocks().append(DataBlock(instance.name, position, labels, data))
+
+	def ValueArrays(self):
+		# All labels and data of the field as two arrays
+		Blocks = self.DataBlocks()
+		if not Blocks:
+			return numpy.zeros(0, dtype=numpy.int64), numpy.zeros((0, self.ComponentCount()))
+		return numpy.concatenate([block.Labels for block in Blocks]), numpy.vstack([block.Data for block in Blocks])
+
+	def Combine(self, Other, Operation):
+		# Field arithmetic, Other is a float or a field on the same nodes
+		Blocks = []
+		for block in self.DataBlocks():
+			if isinstance(Other, FieldOutput):
+				OtherData = AlignedData(block, Other)
+			else:
+				OtherData = float(Other)
+			Blocks.append(DataBlock(block.InstanceName, block.Position, block.Labels, Operation(block.Data, OtherData)))
+		return FieldOutput(self.name, self.description, self.type, self.componentLabels, self.validInvariants, Blocks=Blocks)
+
+	def __add__(self, Other):
+		return self.Combine(Other, lambda A, B: A + B)
+
+	__radd__ = __add__
+
+	def __sub__(self, Other):
+		return self.Combine(Other, lambda A, B: A - B)
+
+	def __rsub__(self, Other):
+		return self.Combine(Other, lambda A, B: B - A)
+
+	def __mul__(self, Other):
+		return self.Combine(Other, lambda A, B: A*B)
+
+	__rmul__ = __mul__
+
+	def __truediv__(self, Other):
+		return self.Combine(Other, lambda A, B: A/B)
+
+	__div__ = __truediv__
+
+	def __neg__(self):
+		return self.Combine(-1.0, lambda A, B: A*B)
+
+def SubsetBlock(Block, Region):
+	# Rows of Block which belong to Region (instance, node set, element set, node or element), None if there are none
+	if isinstance(Region, OdbInstance):
+		if Block.InstanceName != Region.name:
+			return None
+		return Block
+
+	if isinstance(Region, OdbMeshNode):
+		Mask = Block.Labels == Region.label if Block.Position == NODAL else numpy.zeros(len(Block.Labels), dtype=bool)
+	elif isinstance(Region, OdbMeshElement):
+		Mask = Block.Labels == Region.label if Block.Position != NODAL else numpy.isin(Block.Labels, Region.connectivity)
+	elif isinstance(Region, OdbSet):
+		if Block.InstanceName != Region.Instance.name:
+			return None
+		if Block.Position == NODAL:
+			if Region.NodePositions is None:
+				return None
+			Mask = numpy.isin(Block.Labels, Region.NodeLabels())
+		else:
+			if Region.ElementPositions is None:
+				return None
+			Mask = numpy.isin(Block.Labels, Region.ElementLabels())
+	else:
+		raise OdbError('getSubset: unsupported region %r' % (Region,))
+
+	if not Mask.any():
+		return None
+	return Block.Take(Mask)
+
+def AlignedData(Block, Other):
+	# Data of the field Other in the row order of Block
+	OtherLabels, OtherData = Other.ValueArrays()
+	if len(OtherLabels) == len(Block.Labels) and (OtherLabels == Block.Labels).all():
+		return OtherData
+	Order = numpy.argsort(OtherLabels, kind='mergesort')
+	Positions = numpy.searchsorted(OtherLabels[Order], Block.Labels)
+	Positions[Positions == len(OtherLabels)] = 0
+	if len(OtherLabels) == 0 or (OtherLabels[Order][Positions] != Block.Labels).any():
+		raise OdbError('Field arithmetic: the fields are not defined on the same nodes or elements')
+	return OtherData[Order][Positions]
+
+class FieldGenerator:
+	# Picklable callable giving the data blocks of one generated field, Recipe.FieldBlocks(StepIndex, FrameIndex, Name)
+
+	def __init__(self, Recipe, StepIndex, FrameIndex, Name):
+		self.Recipe = Recipe
+		self.StepIndex = StepIndex
+		self.FrameIndex = FrameIndex
+		self.Name = Name
+
+	def __call__(self):
+		return self.Recipe.FieldBlocks(self.StepIndex, self.FrameIndex, self.Name)
+
+class OdbFrame:
+
+	def __init__(self, Step, frameId, incrementNumber=0, frameValue=0.0, description=''):
+		self.Step = Step
+		self.frameId = frameId
+		self.incrementNumber = incrementNumber
+		self.frameValue = frameValue
+		self.description = description
+		self.domain = TIME
+		self.fieldOutputs = Repository()
+
+	def GeneratedFieldOutput(self, Recipe, name, description, type, componentLabels, validInvariants=()):
+		# Field output generated by Recipe on every read, see SyntheticOdb.py
+		Generator = FieldGenerator(Recipe, self.Step.number - 1, self.frameId, name)
+		self.fieldOutputs[name] = FieldOutput(name, description, type, componentLabels, validInvariants, Generator=Generator)
+		return self.fieldOutputs[name]
+
+	def FieldOutput(self, name=None, description='', type=SCALAR, componentLabels=(), validInvariants=(), field=None):
+		if self.Step.Odb.isReadOnly:
+			raise OdbError('The ODB %s is opened read only' % self.Step.Odb.name)
+		if field is not None:
+			Blocks = [DataBlock(block.InstanceName, block.Position, block.Labels, block.Data) for block in field.DataBlocks()]
+			NewField = FieldOutput(name or field.name, description or field.description, field.type, field.componentLabels, field.validInvariants, Blocks=Blocks)
+		else:
+			NewField = FieldOutput(name, description, type, componentLabels, validInvariants)
+		self.fieldOutputs[NewField.name] = NewField
+		return NewField
+
+class HistoryOutput:
+
+	def __init__(self, name, description='', type=SCALAR, data=()):
+		self.name = name
+		self.description = description
+		self.type = type
+		self.data = tuple(data)
+
+	def addData(self, frame=None, value=None, data=None):
+		if data is not None:
+			self.data = self.data + tuple(data)
+		else:
+			self.data = self.data + ((frame, value),)
+
+class HistoryRegion:
+
+	def __init__(self, name, description=''):
+		self.name = name
+		self.description = description
+		self.historyOutputs = Repository()
+
+	def HistoryOutput(self, name, description='', type=SCALAR):
+		self.historyOutputs[name] = HistoryOutput(name, description, type)
+		return self.historyOutputs[name]
+
+class OdbStep:
+
+	def __init__(self, Odb, name, description='', domain=TIME, timePeriod=1.0, number=1, totalTime=0.0):
+		self.Odb = Odb
+		self.name = name
+		self.description = description
+		self.domain = domain
+		self.timePeriod = timePeriod
+		self.totalTime = totalTime
+		self.number = number
+		self.procedure = '*STATIC'
+		self.frames = []
+		self.historyRegions = Repository()
+
+	def Frame(self, incrementNumber=0, frameValue=0.0, description=''):
+		if self.Odb.isReadOnly:
+			raise OdbError('The ODB %s is opened read only' % self.Odb.name)
+		NewFrame = OdbFrame(self, len(self.frames), incrementNumber, frameValue, description)
+		self.frames.append(NewFrame)
+		return NewFrame
+
+	def HistoryRegion(self, name, description='', point=None):
+		self.historyRegions[name] = HistoryRegion(name, description)
+		return self.historyRegions[name]
+
+	def getFrame(self, frameValue):
+		return min(self.frames, key=lambda frame: abs(frame.frameValue - frameValue))
+
+class Odb:
+
+	def __init__(self, name, analysisTitle='', description='', path=''):
+		self.name = name
+		self.analysisTitle = analysisTitle
+		self.description = description
+		self.path = path or name
+		self.isReadOnly = False
+		self.rootAssembly = OdbAssembly()
+		self.parts = Repository()
+		self.steps = Repository()
+		self.Closed = False
+
+	def __getstate__(self):
+		State = self.__dict__.copy()
+		State['isReadOnly'] = False
+		State['Closed'] = False
+		return State
+
+	def Part(self, name, embeddedSpace=THREE_D, type=DEFORMABLE_BODY):
+		self.parts[name] = OdbPart(name, embeddedSpace, type)
+		return self.parts[name]
+
+	def Step(self, name, description='', domain=TIME, timePeriod=1.0, previousStepName=None, procedure='*STATIC', totalTime=None):
+		if self.isReadOnly:
+			raise OdbError('The ODB %s is opened read only' % self.name)
+		if name in self.steps:
+			raise OdbError('Step %s already exists in %s' % (name, self.name))
+		if totalTime is None:
+			totalTime = sum(step.timePeriod for step in self.steps.values())
+		self.steps[name] = OdbStep(self, name, description, domain, timePeriod, len(self.steps) + 1, totalTime)
+		self.steps[name].procedure = procedure
+		return self.steps[name]
+
+	def save(self):
+		if self.isReadOnly:
+			raise OdbError('The ODB %s is opened read only and cannot be saved' % self.name)
+		if self.Closed:
+			raise OdbError('The ODB %s is closed' % self.name)
+		TemporaryName = self.path + '.tmp'
+		with open(TemporaryName, 'wb') as myfile:
+			pickle.dump(self, myfile, PICKLE_PROTOCOL)
+		if os.path.exists(self.path):
+			os.remove(self.path)
+		os.rename(TemporaryName, self.path)
+
+	def close(self):
+		self.Closed = True
+
+	def update(self):
+		pass
+
+def openOdb(path, readOnly=False, readInternalSets=False):
+	if not os.path.exists(path):
+		raise OdbError('File %s does not exist' % path)
+	with open(path, 'rb') as myfile:
+		OpenedOdb = pickle.load(myfile)
+	if not isinstance(OpenedOdb, Odb):
+		raise OdbError('File %s is not a fake ODB' % path)
+	OpenedOdb.path = path
+	OpenedOdb.name = path
+	OpenedOdb.isReadOnly = bool(readOnly)
+	return OpenedOdb
+
+def isUpgradeRequiredForOdb(upgradeRequiredOdbPath):
+	return False
@@ -0,0 +1,140 @@
+"""
+test_ArchardWearEngine.py
+
+Unit tests of the Archard wear kernel, the wear integrator and the streamed rewrite of the INP node blocks (ArchardWearEngine.py).
+
+Usage (Linux):
+
+cd /path/to/Abaqus-Python-Scripts
+python -m pytest FakeAbaqus
+OR
+python -m unittest discover -s FakeAbaqus -p "test_*.py"
+
+Revision history:
+REV-00 (18th October 2026): 1st release
+
+Author:
+Ranjit GOPI
+Solution Consultant, SIMULIA India COE
+ranjit.gopi@3ds.com
+Simulia India Support Frontdesk:+91 44 43443000
+Simulia India Support Email: simulia.in.support@3ds.com
+3DS.COM/SIMULIA
+"""
+import os
+import sys
+import shutil
+import tempfile
+import unittest
+import numpy
+
+FAKE_ABAQUS_FOLDER = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, FAKE_ABAQUS_FOLDER)
+sys.path.insert(0, os.path.dirname(FAKE_ABAQUS_FOLDER))
+
+from ArchardWearEngine import ArchardKernel, ArchardWearIntegrator, RewriteInpNodeBlocks, IncrementTimes
+
+class ArchardKernelTest(unittest.TestCase):
+
+	def Fields(self, IncrementTime, TimeIntegration='TRAPEZOIDAL', LegacyIncrementTime=None):
+		# Two nodes, the first slips by (0.3, 0.4) under a pressure going from 1.0 to 3.0, the second does not slip
+		return ArchardKernel(numpy.array([0.3, 0.0]), numpy.array([0.4, 0.0]), numpy.array([3.0, 5.0]),
+			numpy.zeros(2), numpy.zeros(2), numpy.array([1.0, 5.0]), 0.01, IncrementTime, TimeIntegration, LegacyIncrementTime)
+
+	def testTrapezoidalWearIsPressureTimesSlip(self):
+		Fields = self.Fields(0.25)
+		numpy.testing.assert_allclose(Fields['RESULTANTCSLIPDELTA'], [0.5, 0.0])
+		numpy.testing.assert_allclose(Fields['CPRESS_AVERAGED'], [2.0, 5.0])
+		numpy.testing.assert_allclose(Fields['ARCHARDWEAR'], [0.01*2.0*0.5, 0.0])
+		numpy.testing.assert_allclose(Fields['RESULTANTCSLIPRATE'], [2.0, 0.0])
+
+	def testTrapezoidalWearDoesNotDependOnTimeIncrement(self):
+		numpy.testing.assert_allclose(self.Fields(0.25)['ARCHARDWEAR'], self.Fields(4.0)['ARCHARDWEAR'])
+
+	def testFrameAtRepeatedTimeWears(self):
+		Fields = self.Fields(0.0)
+		numpy.testing.assert_allclose(Fields['ARCHARDWEAR'], [0.01*2.0*0.5, 0.0])
+		numpy.testing.assert_allclose(Fields['RESULTANTCSLIPRATE'], [0.0, 0.0])
+
+	def testLegacyWearIsDividedByLastTimeIncrement(self):
+		Fields = self.Fields(0.25, 'LEGACY', 0.5)
+		numpy.testing.assert_allclose(Fields['ARCHARDWEAR'], [0.01*2.0*0.5/0.5, 0.0])
+
+class ArchardWearIntegratorTest(unittest.TestCase):
+
+	def testIncrementTimes(self):
+		numpy.testing.assert_allclose(IncrementTimes([0.0, 0.5, 0.5, 1.0]), [0.0, 0.5, 0.0, 0.5])
+		self.assertEqual(len(IncrementTimes([])), 0)
+
+	def testWearSumOverFrames(self):
+		Integrator = ArchardWearIntegrator(2.0, [0.0, 0.5, 0.5, 1.0])
+		Pressure = numpy.ones(2)
+		Slips = [numpy.array([0.0, 0.0]), numpy.array([0.1, 0.0]), numpy.array([0.3, 0.0]), numpy.array([0.2, 0.0])]
+
+		self.assertTrue(Integrator.Add(Slips[0], numpy.zeros(2), Pressure) is None)
+		for Slip in Slips[1:]:
+			Fields = Integrator.Add(Slip, numpy.zeros(2), Pressure)
+
+		# |0.1| + |0.2| + |-0.1| of slip at unit pressure, the frame at the repeated time 0.5 included
+		numpy.testing.assert_allclose(Integrator.WearSum, [2.0*0.4, 0.0])
+		numpy.testing.assert_allclose(Fields['ARCHARDWEARSUM'], Integrator.WearSum)
+
+	def testUnknownTimeIntegration(self):
+		self.assertRaises(ValueError, ArchardWearIntegrator, 1.0, [0.0, 1.0], 'TRAPEZ')
+
+TEMPLATE_INP = (b'*Heading\r\n'
+	b'** *Node in a comment is not a keyword\r\n'
+	b'*Node\r\n'
+	b'1, 0.0, 0.0, 0.0\r\n'
+	b'  2 ,\t1.0, 0.0, 0.0\r\n'
+	b'3, 2.0, 0.0, 0.0\r\n'
+	b'*Element, type=C3D8R\r\n'
+	b'2, 1, 2, 3, 4, 5, 6, 7, 8\r\n'
+	b'*NODE, NSET=EXTRA\n'
+	b'5, 4.0, 0.0, 0.0\n'
+	b'6, 5.0, 0.0, 0.0\n'
+	b'*Node Output\n'
+	b'2, U\n'
+	b'*End Step\n')
+
+class RewriteInpNodeBlocksTest(unittest.TestCase):
+
+	def setUp(self):
+		self.Folder = tempfile.mkdtemp()
+		self.SourceInpName = os.path.join(self.Folder, 'Template.inp')
+		self.RewrittenInpName = os.path.join(self.Folder, 'Rewritten.inp')
+		with open(self.SourceInpName, 'wb') as InpFile:
+			InpFile.write(TEMPLATE_INP)
+
+	def tearDown(self):
+		shutil.rmtree(self.Folder)
+
+	def Rewrite(self, Labels, BufferSize):
+		Calls = []
+
+		def NodeLine(Label, Values):
+			Calls.append((Label, [Value.strip() for Value in Values]))
+			return str(Label) + ', 9.0, 9.0, 9.0'
+
+		Patched = RewriteInpNodeBlocks(self.SourceInpName, self.RewrittenInpName, Labels, NodeLine, BufferSize)
+		with open(self.RewrittenInpName, 'rb') as InpFile:
+			return Patched, Calls, InpFile.read()
+
+	def testOnlyNodeLinesOfLabelsArePatched(self):
+		Expected = (TEMPLATE_INP.replace(b'  2 ,\t1.0, 0.0, 0.0\r\n', b'2, 9.0, 9.0, 9.0\r\n')
+			.replace(b'6, 5.0, 0.0, 0.0\n', b'6, 9.0, 9.0, 9.0\n'))
+
+		# Buffers smaller than a line and larger than the file give the same bytes
+		for BufferSize in (7, 23, 1 << 20):
+			Patched, Calls, Rewritten = self.Rewrite(set([2, 6, 99]), BufferSize)
+			self.assertEqual(Patched, 2)
+			self.assertEqual(Calls, [(2, ['1.0', '0.0', '0.0']), (6, ['5.0', '0.0', '0.0'])])
+			self.assertEqual(Rewritten, Expected)
+
+	def testNoLabelsCopiesByteForByte(self):
+		Patched, Calls, Rewritten = self.Rewrite(set(), 1 << 20)
+		self.assertEqual(Patched, 0)
+		self.assertEqual(Rewritten, TEMPLATE_INP)
+
+if __name__ == '__main__':
+	unittest.main()
@@ -0,0 +1,177 @@
+"""
+test_OdbArrayTools.py
+
+Unit tests of the binary field container (FieldContainerWriter and FieldContainerReader), of NodeSetLabelIndex and of the addData
+payload helpers (OdbArrayTools.py).
+
+Usage (Linux):
+
+cd /path/to/Abaqus-Python-Scripts
+python -m pytest FakeAbaqus
+OR
+python -m unittest discover -s FakeAbaqus -p "test_*.py"
+
+Revision history:
+REV-00 (18th October 2026): 1st release
+
+Author:
+Ranjit GOPI
+Solution Consultant, SIMULIA India COE
+ranjit.gopi@3ds.com
+Simulia India Support Frontdesk:+91 44 43443000
+Simulia India Support Email: simulia.in.support@3ds.com
+3DS.COM/SIMULIA
+"""
+import os
+import sys
+import shutil
+import tempfile
+import unittest
+import numpy
+
+FAKE_ABAQUS_FOLDER = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, FAKE_ABAQUS_FOLDER)
+sys.path.insert(0, os.path.dirname(FAKE_ABAQUS_FOLDER))
+
+from OdbArrayTools import FieldContainerWriter, FieldContainerReader, NodeSetLabelIndex, AddDataPayloadFromArrays, AddDataFromArray
+
+class FieldContainerTest(unittest.TestCase):
+
+	def setUp(self):
+		self.Folder = tempfile.mkdtemp()
+		self.Name = os.path.join(self.Folder, 'Results.fields')
+
+	def tearDown(self):
+		shutil.rmtree(self.Folder)
+
+	def WriteContainer(self):
+		Writer = FieldContainerWriter(self.Name, [7, 3, 11])
+		Writer.AddFrame(0, 0.0, [('U', numpy.zeros((3, 3), dtype=numpy.float32)), ('A', numpy.ones((3, 3)))])
+		Writer.AddFrame(4, 0.75, [('U', numpy.arange(9, dtype=numpy.float32).reshape(3, 3)), ('A', numpy.arange(3))])
+		Writer.Close()
+
+	def testRoundTrip(self):
+		self.WriteContainer()
+		self.assertFalse(os.path.exists(self.Name+'.tmp'))
+
+		Reader = FieldContainerReader(self.Name)
+		self.assertEqual(Reader.Labels.tolist(), [7, 3, 11])
+		self.assertEqual(Reader.FrameNumbers, [0, 4])
+		self.assertEqual(Reader.FrameValues, [0.0, 0.75])
+		self.assertEqual(sorted(Reader.FieldNames(1)), ['A', 'U'])
+
+		U = Reader.Field(1, 'U')
+		A = Reader.Field(1, 'A')
+		# float32 blocks stay in single precision, other arrays are written as float64
+		self.assertEqual(U.dtype, numpy.float32)
+		self.assertEqual(A.dtype, numpy.float64)
+		numpy.testing.assert_array_equal(U, numpy.arange(9).reshape(3, 3))
+		numpy.testing.assert_array_equal(A, [0.0, 1.0, 2.0])
+
+		del U, A
+		Reader.Close()
+
+	def testCloseReleasesMemoryMaps(self):
+		self.WriteContainer()
+
+		Reader = FieldContainerReader(self.Name)
+		U = Reader.Field(0, 'U')[1:]
+		self.assertRaises(ValueError, Reader.Close)
+
+		Reader = FieldContainerReader(self.Name)
+		U = Reader.Field(0, 'U')
+		del U
+		Reader.Close()
+		os.remove(self.Name)
+
+	def testRowsMustMatchLabels(self):
+		Writer = FieldContainerWriter(self.Name, [1, 2])
+		self.assertRaises(ValueError, Writer.AddFrame, 0, 0.0, [('U', numpy.zeros((3, 3)))])
+		Writer.Close()
+
+	def testIncompleteFileIsRejected(self):
+		self.WriteContainer()
+		with open(self.Name, 'rb') as ContainerFile:
+			Contents = ContainerFile.read()
+		with open(self.Name, 'wb') as ContainerFile:
+			ContainerFile.write(Contents[:-5])
+		self.assertRaises(ValueError, FieldContainerReader, self.Name)
+
+	def testEmptyLabels(self):
+		Writer = FieldContainerWriter(self.Name, [])
+		Writer.AddFrame(1, 1.0, [('U', numpy.zeros((0, 3)))])
+		Writer.Close()
+
+		Reader = FieldContainerReader(self.Name)
+		self.assertEqual(Reader.Field(0, 'U').shape, (0, 3))
+		Reader.Close()
+
+class NodeSetStub:
+	# Node set with a nodes member as read by NodeSetLabelIndex
+
+	class Node:
+		def __init__(self, label):
+			self.label = label
+
+	def __init__(self, Labels):
+		self.nodes = [self.Node(Label) for Label in Labels]
+
+class FieldStub:
+	# Field output of a frame with one bulk data block per region, getSubset records the regions read
+
+	class Block:
+		def __init__(self, Labels, Data):
+			self.nodeLabels = Labels
+			self.data = Data
+
+	def __init__(self, Values):
+		self.Values = Values
+		self.Regions = []
+
+	def getSubset(self, region):
+		self.Regions.append(region)
+		Labels = [node.label for node in region.nodes if node.label in self.Values]
+		Subset = FieldStub(self.Values)
+		Subset.bulkDataBlocks = [self.Block(Labels, [self.Values[Label] for Label in Labels])]
+		return Subset
+
+class FrameStub:
+	def __init__(self, **Fields):
+		self.fieldOutputs = Fields
+
+class NodeSetLabelIndexTest(unittest.TestCase):
+
+	def testUnionOfNodeSets(self):
+		First = NodeSetStub([5, 1, 3])
+		Second = NodeSetStub([3, 9])
+		Index = NodeSetLabelIndex([First, Second])
+
+		self.assertEqual(Index.Labels.tolist(), [1, 3, 5, 9])
+		self.assertEqual(Index.View(Second).tolist(), [1, 3])
+
+		Positions, InSet = Index.Positions([9, 2, 1, 10])
+		self.assertEqual(InSet.tolist(), [True, False, True, False])
+		self.assertEqual(Positions[InSet].tolist(), [3, 0])
+
+	def testUnionIsReadOneNodeSetAtATime(self):
+		First = NodeSetStub([5, 1, 3])
+		Second = NodeSetStub([3, 9])
+		Index = NodeSetLabelIndex([First, Second])
+
+		Field = FieldStub({1: 1.5, 3: 3.5, 9: 9.5, 20: 20.5})
+		Values, HasValue = Index.ScatterFieldWithMask(FrameStub(CPRESS=Field), 'CPRESS')
+
+		# Only the node sets are read, never a larger region, node 5 has no value
+		self.assertEqual(Field.Regions, [First, Second])
+		self.assertEqual(Values.tolist(), [1.5, 3.5, 0.0, 9.5])
+		self.assertEqual(HasValue.tolist(), [True, True, False, True])
+
+class AddDataTest(unittest.TestCase):
+
+	def testDataFromArrayMatchesPayload(self):
+		for Data in (numpy.array([1.5, 2.0, 3.0]), numpy.arange(6, dtype=numpy.float32).reshape(3, 2)):
+			self.assertEqual(AddDataFromArray(Data), AddDataPayloadFromArrays([4, 5, 6], Data)[1])
+		self.assertEqual(AddDataFromArray(numpy.array([1.5, 2.0])), ((1.5,), (2.0,)))
+
+if __name__ == '__main__':
+	unittest.main()
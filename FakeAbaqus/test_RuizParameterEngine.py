@@ -0,0 +1,198 @@
+"""
+test_RuizParameterEngine.py
+
+Unit tests of the RUIZ kernel, the checkpoint and resume of RuizAccumulator and the serial and parallel evaluation of step pairs on a
+small synthetic ODB (RuizParameterEngine.py, SyntheticOdb.py).
+
+Usage (Linux):
+
+cd /path/to/Abaqus-Python-Scripts
+python -m pytest FakeAbaqus
+OR
+python -m unittest discover -s FakeAbaqus -p "test_*.py"
+
+Revision history:
+REV-00 (18th October 2026): 1st release
+
+Author:
+Ranjit GOPI
+Solution Consultant, SIMULIA India COE
+ranjit.gopi@3ds.com
+Simulia India Support Frontdesk:+91 44 43443000
+Simulia India Support Email: simulia.in.support@3ds.com
+3DS.COM/SIMULIA
+"""
+import os
+import sys
+import shutil
+import tempfile
+import unittest
+import numpy
+
+FAKE_ABAQUS_FOLDER = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, FAKE_ABAQUS_FOLDER)
+sys.path.insert(0, os.path.dirname(FAKE_ABAQUS_FOLDER))
+
+from SyntheticOdb import CreateSyntheticOdb
+import RuizParameterEngine
+from RuizParameterEngine import RuizKernel, RuizAccumulator, FrettingOdbSession, EvaluateStepPairs, StepPairRuns
+
+class RuizKernelTest(unittest.TestCase):
+
+	def testRuizParameterAndRelativeSlip(self):
+		RuizParameter, RelativeSlip = RuizKernel(numpy.array([2.0]), numpy.array([1.0]), numpy.array([0.4]), numpy.array([0.5]),
+			numpy.array([0.1]), numpy.array([0.1]))
+		numpy.testing.assert_allclose(RelativeSlip, [0.5])
+		numpy.testing.assert_allclose(RuizParameter, [numpy.sqrt((2.0*0.3)**2 + (1.0*0.4)**2)])
+
+class RuizAccumulatorTest(unittest.TestCase):
+
+	StepPairs = [(2, 1, 1), (3, 1, 1), (4, 1, 1)]
+
+	def setUp(self):
+		self.Folder = tempfile.mkdtemp()
+		self.CheckpointName = os.path.join(self.Folder, 'Output.odb.ruizcheckpoint')
+		self.OdbToReadName = os.path.join(self.Folder, 'Input.odb')
+		with open(self.OdbToReadName, 'w') as OdbFile:
+			OdbFile.write('input')
+
+	def tearDown(self):
+		shutil.rmtree(self.Folder)
+
+	def Accumulator(self, StepPairs=None, OdbToReadName=None):
+		return RuizAccumulator(self.CheckpointName, StepPairs or self.StepPairs, ['SET-1', 'SET-2'], OdbToReadName or self.OdbToReadName)
+
+	def AddTwoPairs(self):
+		Accumulator = self.Accumulator()
+		Accumulator.Add(numpy.array([1, 2]), numpy.array([1.0, 2.0]), numpy.array([0.5, 0.25]))
+		Accumulator.Add(numpy.array([1, 2]), numpy.array([3.0, 4.0]), numpy.array([0.5, 0.75]))
+		return Accumulator
+
+	def testResumeAfterCompletedPairs(self):
+		self.AddTwoPairs()
+
+		Resumed = self.Accumulator()
+		self.assertEqual(Resumed.Completed, 2)
+		self.assertEqual(Resumed.Labels.tolist(), [1, 2])
+		numpy.testing.assert_allclose(Resumed.RuizSum, [4.0, 6.0])
+		numpy.testing.assert_allclose(Resumed.SlipSum, [1.0, 1.0])
+
+		Pairs = list(Resumed.CompletedPairs())
+		self.assertEqual([Pair[0] for Pair in Pairs], [0, 1])
+		numpy.testing.assert_allclose(Pairs[1][2], [3.0, 4.0])
+		numpy.testing.assert_allclose(Pairs[1][3], [0.5, 0.75])
+
+		Resumed.Add(numpy.array([1, 2]), numpy.array([1.0, 1.0]), numpy.array([1.0, 1.0]))
+		numpy.testing.assert_allclose(Resumed.RuizSum, [5.0, 7.0])
+		self.assertEqual(os.path.getsize(Resumed.PairsName), 3*Resumed.RecordSize())
+
+		Resumed.Remove()
+		self.assertFalse(os.path.exists(self.CheckpointName))
+		self.assertFalse(os.path.exists(Resumed.PairsName))
+
+	def testRecordsAfterLastCheckpointAreDropped(self):
+		Accumulator = self.AddTwoPairs()
+
+		# Record of a third step pair written before a crash, without its checkpoint
+		with open(Accumulator.PairsName, 'ab') as PairsFile:
+			numpy.ones(4, dtype=numpy.float32).tofile(PairsFile)
+
+		Resumed = self.Accumulator()
+		self.assertEqual(Resumed.Completed, 2)
+		Resumed.Add(numpy.array([1, 2]), numpy.array([1.0, 1.0]), numpy.array([1.0, 1.0]))
+		self.assertEqual(os.path.getsize(Resumed.PairsName), 3*Resumed.RecordSize())
+
+	def testResumeFromTemporaryCheckpoint(self):
+		self.AddTwoPairs()
+
+		# Crash between removing the old checkpoint and renaming the new one
+		os.rename(self.CheckpointName, self.CheckpointName+'.tmp')
+		Resumed = self.Accumulator()
+		self.assertEqual(Resumed.Completed, 2)
+		numpy.testing.assert_allclose(Resumed.RuizSum, [4.0, 6.0])
+
+		Resumed.Add(numpy.array([1, 2]), numpy.array([1.0, 1.0]), numpy.array([1.0, 1.0]))
+		self.assertTrue(os.path.exists(self.CheckpointName))
+		self.assertFalse(os.path.exists(self.CheckpointName+'.tmp'))
+
+	def testIncompleteTemporaryCheckpointIsNotResumed(self):
+		with open(self.CheckpointName+'.tmp', 'wb') as CheckpointFile:
+			CheckpointFile.write(b'PK')
+		self.assertEqual(self.Accumulator().Completed, 0)
+
+	def testOtherStepPairsAreNotResumed(self):
+		self.AddTwoPairs()
+		self.assertEqual(self.Accumulator(StepPairs=self.StepPairs[:2]).Completed, 0)
+
+	def testOtherOdbToReadIsNotResumed(self):
+		self.AddTwoPairs()
+
+		OtherOdbName = os.path.join(self.Folder, 'Other.odb')
+		shutil.copy(self.OdbToReadName, OtherOdbName)
+		self.assertEqual(self.Accumulator(OdbToReadName=OtherOdbName).Completed, 0)
+
+	def testChangedOdbToReadIsNotResumed(self):
+		self.AddTwoPairs()
+
+		os.utime(self.OdbToReadName, (1.0, 1.0))
+		self.assertEqual(self.Accumulator().Completed, 0)
+
+class EvaluateStepPairsTest(unittest.TestCase):
+
+	@classmethod
+	def setUpClass(cls):
+		cls.Folder = tempfile.mkdtemp()
+		cls.OdbToReadName = os.path.join(cls.Folder, 'Synthetic.odb')
+		CreateSyntheticOdb(cls.OdbToReadName, ContactNodes=400, NumberOfSteps=7, FramesPerStep=3, NodeSetNames=('SET-1', 'SET-2'), Overlap=0.2)
+		# Step i against step i-1 at the last frame of both steps
+		cls.StepPairs = [(StepNumber, 2, 2) for StepNumber in range(1, 7)]
+
+	@classmethod
+	def tearDownClass(cls):
+		shutil.rmtree(cls.Folder)
+
+	def Evaluate(self, NumberOfProcesses):
+		Session = FrettingOdbSession(self.OdbToReadName, None)
+		Results = list(EvaluateStepPairs(Session, self.StepPairs, ['SET-1', 'SET-2'], NumberOfProcesses))
+		FrameReads = Session.FrameReads()
+		Session.Close()
+		return Results, FrameReads
+
+	def testStepPairRuns(self):
+		Runs = StepPairRuns(list(range(9)), 4)
+		self.assertEqual(Runs, [[0, 1], [2, 3], [4, 5], [6, 7, 8]])
+		self.assertEqual(StepPairRuns([0, 1], 2), [[0], [1]])
+
+	def testSerialRunReadsSharedFramesOnce(self):
+		Results, FrameReads = self.Evaluate(1)
+		self.assertEqual(len(Results), 6)
+		self.assertEqual(FrameReads, 6 + 1)
+
+	def testParallelRunGivesSerialResults(self):
+		SerialResults = self.Evaluate(1)[0]
+		ParallelResults, FrameReads = self.Evaluate(3)
+
+		# One contiguous run of two step pairs per worker, the frames at the two run boundaries are read twice
+		self.assertEqual(FrameReads, 6 + 3)
+		for SerialResult, ParallelResult in zip(SerialResults, ParallelResults):
+			for SerialArray, ParallelArray in zip(SerialResult, ParallelResult):
+				numpy.testing.assert_array_equal(SerialArray, ParallelArray)
+
+	def testRunsAreLimitedToStepPairsPerRun(self):
+		SerialResults = self.Evaluate(1)[0]
+		StepPairsPerRun = RuizParameterEngine.STEP_PAIRS_PER_RUN
+		RuizParameterEngine.STEP_PAIRS_PER_RUN = 2
+		try:
+			ParallelResults, FrameReads = self.Evaluate(2)
+		finally:
+			RuizParameterEngine.STEP_PAIRS_PER_RUN = StepPairsPerRun
+
+		# Three runs of two step pairs on two workers, a frame at a run boundary is read twice unless the worker that read it takes the
+		# next run
+		self.assertTrue(6 + 2 <= FrameReads <= 6 + 3)
+		for SerialResult, ParallelResult in zip(SerialResults, ParallelResults):
+			for SerialArray, ParallelArray in zip(SerialResult, ParallelResult):
+				numpy.testing.assert_array_equal(SerialArray, ParallelArray)
+
+if __name__ == '__main__':
+	unittest.main()
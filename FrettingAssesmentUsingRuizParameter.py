@@ -18,10 +18,25 @@ Go to command prompt > Go to working directory > write command > abq2018 python
 
 Please note:
 1. Example model (boltedFlange.inp) is provided to test script
+2. RuizParameterEngine.py, OdbArrayTools.py and ScriptProfiler.py should be in the same folder as this script
+3. For parallel evaluation of step pairs enter the number of processes in INPUTS.csv and run with abq2018 python (Linux)
+4. If a run stops before the end, run the script again with the same inputs, it continues from the checkpoint files
+   <ODB to write>.ruizcheckpoint and <ODB to write>.ruizcheckpoint.pairs. Delete these files to start from the first step pair.
 
 Revision history:
 REV-00 (18th May 2020): 1st release
 REV-01 (19th May 2020): Fixed a bug
+REV-02 (18th October 2026): Array based RUIZ calculation (see RuizParameterEngine.py), each contact field is extracted once per node set
+REV-03 (18th October 2026): ODBs are opened once per run and saved once at the end (see FrettingOdbSession)
+REV-04 (18th October 2026): Extracted contact fields are cached so each frame is read only once (size limit in INPUTS.csv)
+REV-05 (18th October 2026): Step pairs can be evaluated in parallel worker processes (number of processes in INPUTS.csv)
+REV-06 (18th October 2026): Cumulative sums are checkpointed after each step pair, a crashed run continues from the last completed step pair
+REV-07 (18th October 2026): Node sets are merged into one set of unique nodes, summary per node set in RUIZ_PARAMETER_NODE_SET_SUMMARY.csv
+REV-08 (18th October 2026): Per-phase wall time, CPU time and peak memory with ScriptProfiler.py (set SCRIPT_PROFILE_FILE)
+REV-09 (18th October 2026): Runs with python 3 and without a license with the FakeAbaqus package, script time is wall clock time (time.clock is not in python 3)
+REV-10 (18th October 2026): Only the frame shared by consecutive step pairs is cached (the cache size is an upper bound), frames read by worker processes are counted
+REV-11 (18th October 2026): A checkpoint is resumed only if the ODB to read is the same file with the same size and modification time
+REV-12 (18th October 2026): Fewer than two STEP NUMBERS (no step pair) are rejected before the ODBs are opened
 
 Author:
 Ranjit GOPI
@@ -34,12 +49,15 @@ Simulia India Support Email: simulia.in.support@3ds.com
 from odbAccess import *
 from abaqusConstants import *
 import time
-import math
 import csv
+from RuizParameterEngine import EvaluateStepPairs, FrettingOdbSession, RuizAccumulator
+from ScriptProfiler import ScriptProfiler
 
 STEP_NUMBERS=[]
 FRAME_NUMBERS=[]
 NODE_SET_NAMES=[]
+CACHE_SIZE_IN_MB=1024.0
+NUMBER_OF_PROCESSES=1
 
 # Reading all the input values from a csv file
 with open('INPUTS.csv', 'r') as f:
@@ -59,404 +77,77 @@ with open('INPUTS.csv', 'r') as f:
 		if count == 4:
 			for each in row[1].split(','):
 				NODE_SET_NAMES.append(each.strip())
+		if count == 5 and row[1].strip():
+			CACHE_SIZE_IN_MB=float(row[1])
+		if count == 6 and row[1].strip():
+			NUMBER_OF_PROCESSES=int(row[1])
 		count =count + 1
 
-start = time.clock()
+# Every step number after the first is paired with the step before it, at least two steps give a step pair to write
+if len(STEP_NUMBERS) < 2 or len(FRAME_NUMBERS) < len(STEP_NUMBERS):
+	raise ValueError('Enter at least two STEP NUMBERS and one FRAME NUMBER per step number, got '+str(len(STEP_NUMBERS))+' step numbers and '+str(len(FRAME_NUMBERS))+' frame numbers')
 
-CalculatedData1Sum=[]
-CalculatedData1SumTuple=()
+start = time.time()
 
-CalculatedData2Sum=[]
-CalculatedData2SumTuple=()
+# Phases are recorded in the file named by environment variable SCRIPT_PROFILE_FILE (see ScriptProfiler.py)
+Profiler=ScriptProfiler('FrettingAssesmentUsingRuizParameter.py')
 
-for zerothindex in range(len(STEP_NUMBERS)-1):
+# Both ODBs are opened once for the whole run, steps are written with a single save at the end
+Session=FrettingOdbSession(OdbToReadName, OdbToWriteName, CacheMegaBytes=CACHE_SIZE_IN_MB, Profiler=Profiler)
 
-	OdbToRead = openOdb(path=OdbToReadName, readOnly=True)
+# Step pairs as (step number i, frame number i, frame number i-1)
+STEP_PAIRS=[(int(STEP_NUMBERS[zerothindex]), int(FRAME_NUMBERS[zerothindex+1]), int(FRAME_NUMBERS[zerothindex])) for zerothindex in range(len(STEP_NUMBERS)-1)]
 
-	StepNamei=OdbToRead.steps.keys()[int(STEP_NUMBERS[zerothindex])]
-	currentFramei = OdbToRead.steps[StepNamei].frames[int(FRAME_NUMBERS[zerothindex+1])]
+# Cumulative sums are checkpointed after each step pair, a restarted run with the same inputs and the same, unchanged ODB to read
+# continues after the last completed step pair
+Accumulator=RuizAccumulator(OdbToWriteName+'.ruizcheckpoint', STEP_PAIRS, NODE_SET_NAMES, OdbToReadName)
 
-	StepNameiMinusOne=OdbToRead.steps.keys()[int(STEP_NUMBERS[zerothindex])-1]
-	currentFrameiMinusOne=OdbToRead.steps[StepNameiMinusOne].frames[int(FRAME_NUMBERS[zerothindex])]
+# Steps of step pairs completed before a restart are written from the checkpoint, their frames are not read again
+for zerothindex, nodeLabelArray, CalculatedData1Array, CalculatedData2Array in Accumulator.CompletedPairs():
 
-	nodeLabelData=()
-	CalculatedData1Zero=()
-	CalculatedData2Zero=()
-	CalculatedData1currentFrame=()
-	CalculatedData2currentFrame=()
+	Session.WriteStep(Session.StepName(STEP_PAIRS[zerothindex][0])+"-"+Session.StepName(STEP_PAIRS[zerothindex][0]-1), nodeLabelArray,
+		[('RUIZ PARAMETER', CalculatedData1Array),
+		('RELATIVE SLIP', CalculatedData2Array)])
 
-	for firstindex in range(len(NODE_SET_NAMES)):
+# Contact fields are extracted once per frame for the union of the node sets into label aligned arrays (cached), RUIZ parameter and relative slip are array operations
+# Step pairs are evaluated in NUMBER_OF_PROCESSES worker processes, results come back in order and are written by this process only
+for zerothindex, (nodeLabelArray, CalculatedData1Array, CalculatedData2Array) in enumerate(EvaluateStepPairs(Session, STEP_PAIRS[Accumulator.Completed:], NODE_SET_NAMES, NUMBER_OF_PROCESSES), Accumulator.Completed):
 
-		NodeSetOfInterest=OdbToRead.rootAssembly.instances['PART-1-1'].nodeSets[NODE_SET_NAMES[firstindex]] #ANY ORPHAN INPUT FILE CREATED BY ANSA OR HYPERMESH WILL HAVE DEFAULT INSTANCE NAME PART-1-1 IN ABAQUS
+	StepNamei=Session.StepName(STEP_PAIRS[zerothindex][0])
+	StepNameiMinusOne=Session.StepName(STEP_PAIRS[zerothindex][0]-1)
 
-		for node in (NodeSetOfInterest.nodes):
+	with Profiler.Phase('CHECKPOINT'):
+		Accumulator.Add(nodeLabelArray, CalculatedData1Array, CalculatedData2Array)
 
-			nodeLabelData=nodeLabelData+(node.label,)
+	# addData payloads are built from the arrays in one step (see AddDataPayload in OdbArrayTools.py)
+	Session.WriteStep(StepNamei+"-"+StepNameiMinusOne, nodeLabelArray,
+		[('RUIZ PARAMETER', CalculatedData1Array),
+		('RELATIVE SLIP', CalculatedData2Array)])
 
-		for firstindex in range(len(NodeSetOfInterest.nodes)):
-			CalculatedData1Zero=CalculatedData1Zero+((0.0,),)
+Session.WriteStep('Total Results', Accumulator.Labels,
+	[('RUIZ PARAMETER SUM', Accumulator.RuizSum),
+	('RELATIVE SLIP SUM', Accumulator.SlipSum)])
 
-		for firstindex in range(len(NodeSetOfInterest.nodes)):
-			CalculatedData2Zero=CalculatedData2Zero+((0.0,),)
+# Node sets share one set of unique labels, each node set is reported through its view of the arrays
+with open('RUIZ_PARAMETER_NODE_SET_SUMMARY.csv', 'w') as myfile:
+	myfile.write('NODE SET,NUMBER OF NODES,MAXIMUM RUIZ PARAMETER SUM,MAXIMUM RELATIVE SLIP SUM\n')
+	for NodeSetName in NODE_SET_NAMES:
+		NodeSetView=Session.NodeSetView(NODE_SET_NAMES, NodeSetName)
+		if len(NodeSetView) == 0:
+			myfile.write(NodeSetName+',0,,\n')
+			continue
+		myfile.write(NodeSetName+','+str(len(NodeSetView))+','+str(Accumulator.RuizSum[NodeSetView].max())+','+str(Accumulator.SlipSum[NodeSetView].max())+'\n')
 
-		CSHEAR1iNodeList=[]
-		CSHEAR1iList=[]
-		CSHEAR1iListFinal=[]
+Session.Close()
 
-		CSHEAR2iNodeList=[]
-		CSHEAR2iList=[]
-		CSHEAR2iListFinal=[]
+Accumulator.Remove()
 
-		CSLIP1iNodeList=[]
-		CSLIP1iList=[]
-		CSLIP1iListFinal=[]
-
-		CSLIP2iNodeList=[]
-		CSLIP2iList=[]
-		CSLIP2iListFinal=[]
-
-		CSHEAR1iMinusOneNodeList=[]
-		CSHEAR1iMinusOneList=[]
-		CSHEAR1iMinusOneListFinal=[]
-
-		CSHEAR2iMinusOneNodeList=[]
-		CSHEAR2iMinusOneList=[]
-		CSHEAR2iMinusOneListFinal=[]
-
-		CSLIP1iMinusOneNodeList=[]
-		CSLIP1iMinusOneList=[]
-		CSLIP1iMinusOneListFinal=[]
-
-		CSLIP2iMinusOneNodeList=[]
-		CSLIP2iMinusOneList=[]
-		CSLIP2iMinusOneListFinal=[]
-
-		CSHEAR1i =   currentFramei.fieldOutputs['CSHEAR1'].getSubset(region=NodeSetOfInterest)
-
-		for value in (CSHEAR1i.values):
-			CSHEAR1iNodeList.append(value.nodeLabel)
-			CSHEAR1iList.append(value.data)
-
-		CSHEAR1iDictUnSorted = {}
-
-		for secondindex in range(len(CSHEAR1iNodeList)):
-		        CSHEAR1iDictUnSorted[CSHEAR1iNodeList[secondindex]] = CSHEAR1iList[secondindex]
-
-		for node in (NodeSetOfInterest.nodes):
-			if node.label not in CSHEAR1iDictUnSorted.keys():
-				CSHEAR1iDictUnSorted[node.label]=0.0
-
-		CSHEAR1iListofDict=list(CSHEAR1iDictUnSorted.items())
-		CSHEAR1iListofDict.sort()
-
-		for secondindex in range(len(CSHEAR1iListofDict)):
-			CSHEAR1iListFinal.append(CSHEAR1iListofDict[secondindex][1])
-
-		CSHEAR2i =   currentFramei.fieldOutputs['CSHEAR2'].getSubset(region=NodeSetOfInterest)
-
-		for value in (CSHEAR2i.values):
-			CSHEAR2iNodeList.append(value.nodeLabel)
-			CSHEAR2iList.append(value.data)
-
-		CSHEAR2iDictUnSorted = {}
-
-		for secondindex in range(len(CSHEAR2iNodeList)):
-		        CSHEAR2iDictUnSorted[CSHEAR2iNodeList[secondindex]] = CSHEAR2iList[secondindex]
-
-		for node in (NodeSetOfInterest.nodes):
-			if node.label not in CSHEAR2iDictUnSorted.keys():
-				CSHEAR2iDictUnSorted[node.label]=0.0
-
-		CSHEAR2iListofDict=list(CSHEAR2iDictUnSorted.items())
-		CSHEAR2iListofDict.sort()
-
-		for secondindex in range(len(CSHEAR2iListofDict)):
-			CSHEAR2iListFinal.append(CSHEAR2iListofDict[secondindex][1])
-
-		CSLIP1i =   currentFramei.fieldOutputs['CSLIP1'].getSubset(region=NodeSetOfInterest)
-
-		for value in (CSLIP1i.values):
-			CSLIP1iNodeList.append(value.nodeLabel)
-			CSLIP1iList.append(value.data)
-
-		CSLIP1iDictUnSorted = {}
-
-		for secondindex in range(len(CSLIP1iNodeList)):
-		        CSLIP1iDictUnSorted[CSLIP1iNodeList[secondindex]] = CSLIP1iList[secondindex]
-
-		for node in (NodeSetOfInterest.nodes):
-			if node.label not in CSLIP1iDictUnSorted.keys():
-				CSLIP1iDictUnSorted[node.label]=0.0
-
-		CSLIP1iListofDict=list(CSLIP1iDictUnSorted.items())
-		CSLIP1iListofDict.sort()
-
-		for secondindex in range(len(CSLIP1iListofDict)):
-			CSLIP1iListFinal.append(CSLIP1iListofDict[secondindex][1])
-
-		CSLIP2i =   currentFramei.fieldOutputs['CSLIP2'].getSubset(region=NodeSetOfInterest)
-
-		for value in (CSLIP2i.values):
-			CSLIP2iNodeList.append(value.nodeLabel)
-			CSLIP2iList.append(value.data)
-
-		CSLIP2iDictUnSorted = {}
-
-		for secondindex in range(len(CSLIP2iNodeList)):
-		        CSLIP2iDictUnSorted[CSLIP2iNodeList[secondindex]] = CSLIP2iList[secondindex]
-
-		for node in (NodeSetOfInterest.nodes):
-			if node.label not in CSLIP2iDictUnSorted.keys():
-				CSLIP2iDictUnSorted[node.label]=0.0
-
-		CSLIP2iListofDict=list(CSLIP2iDictUnSorted.items())
-		CSLIP2iListofDict.sort()
-
-		for secondindex in range(len(CSLIP2iListofDict)):
-			CSLIP2iListFinal.append(CSLIP2iListofDict[secondindex][1])
-
-		CSHEAR1iMinusOne =   currentFrameiMinusOne.fieldOutputs['CSHEAR1'].getSubset(region=NodeSetOfInterest)
-
-		for value in (CSHEAR1iMinusOne.values):
-			CSHEAR1iMinusOneNodeList.append(value.nodeLabel)
-			CSHEAR1iMinusOneList.append(value.data)
-
-		CSHEAR1iMinusOneDictUnSorted = {}
-
-		for secondindex in range(len(CSHEAR1iMinusOneNodeList)):
-		        CSHEAR1iMinusOneDictUnSorted[CSHEAR1iMinusOneNodeList[secondindex]] = CSHEAR1iMinusOneList[secondindex]
-
-		for node in (NodeSetOfInterest.nodes):
-			if node.label not in CSHEAR1iMinusOneDictUnSorted.keys():
-				CSHEAR1iMinusOneDictUnSorted[node.label]=0.0
-
-		CSHEAR1iMinusOneListofDict=list(CSHEAR1iMinusOneDictUnSorted.items())
-		CSHEAR1iMinusOneListofDict.sort()
-
-		for secondindex in range(len(CSHEAR1iMinusOneListofDict)):
-			CSHEAR1iMinusOneListFinal.append(CSHEAR1iMinusOneListofDict[secondindex][1])
-
-		CSHEAR2iMinusOne =   currentFrameiMinusOne.fieldOutputs['CSHEAR2'].getSubset(region=NodeSetOfInterest)
-
-		for value in (CSHEAR2iMinusOne.values):
-			CSHEAR2iMinusOneNodeList.append(value.nodeLabel)
-			CSHEAR2iMinusOneList.append(value.data)
-
-		CSHEAR2iMinusOneDictUnSorted = {}
-
-		for secondindex in range(len(CSHEAR2iMinusOneNodeList)):
-		        CSHEAR2iMinusOneDictUnSorted[CSHEAR2iMinusOneNodeList[secondindex]] = CSHEAR2iMinusOneList[secondindex]
-
-		for node in (NodeSetOfInterest.nodes):
-			if node.label not in CSHEAR2iMinusOneDictUnSorted.keys():
-				CSHEAR2iMinusOneDictUnSorted[node.label]=0.0
-
-		CSHEAR2iMinusOneListofDict=list(CSHEAR2iMinusOneDictUnSorted.items())
-		CSHEAR2iMinusOneListofDict.sort()
-
-		for secondindex in range(len(CSHEAR2iMinusOneListofDict)):
-			CSHEAR2iMinusOneListFinal.append(CSHEAR2iMinusOneListofDict[secondindex][1])
-
-		CSLIP1iMinusOne =   currentFrameiMinusOne.fieldOutputs['CSLIP1'].getSubset(region=NodeSetOfInterest)
-
-		for value in (CSLIP1iMinusOne.values):
-			CSLIP1iMinusOneNodeList.append(value.nodeLabel)
-			CSLIP1iMinusOneList.append(value.data)
-
-		CSLIP1iMinusOneDictUnSorted = {}
-
-		for secondindex in range(len(CSLIP1iMinusOneNodeList)):
-				CSLIP1iMinusOneDictUnSorted[CSLIP1iMinusOneNodeList[secondindex]] = CSLIP1iMinusOneList[secondindex]
-
-		for node in (NodeSetOfInterest.nodes):
-			if node.label not in CSLIP1iMinusOneDictUnSorted.keys():
-				CSLIP1iMinusOneDictUnSorted[node.label]=0.0
-
-		CSLIP1iMinusOneListofDict=list(CSLIP1iMinusOneDictUnSorted.items())
-		CSLIP1iMinusOneListofDict.sort()
-
-		for secondindex in range(len(CSLIP1iMinusOneListofDict)):
-			CSLIP1iMinusOneListFinal.append(CSLIP1iMinusOneListofDict[secondindex][1])
-
-		CSLIP2iMinusOne =   currentFrameiMinusOne.fieldOutputs['CSLIP2'].getSubset(region=NodeSetOfInterest)
-
-		for value in (CSLIP2iMinusOne.values):
-			CSLIP2iMinusOneNodeList.append(value.nodeLabel)
-			CSLIP2iMinusOneList.append(value.data)
-
-		CSLIP2iMinusOneDictUnSorted = {}
-
-		for secondindex in range(len(CSLIP2iMinusOneNodeList)):
-				CSLIP2iMinusOneDictUnSorted[CSLIP2iMinusOneNodeList[secondindex]] = CSLIP2iMinusOneList[secondindex]
-
-		for node in (NodeSetOfInterest.nodes):
-			if node.label not in CSLIP2iMinusOneDictUnSorted.keys():
-				CSLIP2iMinusOneDictUnSorted[node.label]=0.0
-
-		CSLIP2iMinusOneListofDict=list(CSLIP2iMinusOneDictUnSorted.items())
-		CSLIP2iMinusOneListofDict.sort()
-
-		for secondindex in range(len(CSLIP2iMinusOneListofDict)):
-			CSLIP2iMinusOneListFinal.append(CSLIP2iMinusOneListofDict[secondindex][1])
-
-		A=map(lambda x,y: x-y, CSLIP1iListFinal,CSLIP1iMinusOneListFinal)
-		B=map(lambda x,y: x-y, CSLIP2iListFinal,CSLIP2iMinusOneListFinal)
-
-		CalculatedData1=map(lambda w,x,y,z: math.sqrt((w*y)**2+(x*z)**2), CSHEAR1iListFinal, CSHEAR2iListFinal, A, B)
-
-		for secondindex in range(len(CalculatedData1)):
-
-			CalculatedData1currentFrame=CalculatedData1currentFrame+((CalculatedData1[secondindex],),)
-
-		CalculatedData2=map(lambda x,y: math.sqrt(x**2+y**2), A,B)
-
-		for secondindex in range(len(CalculatedData2)):
-
-			CalculatedData2currentFrame=CalculatedData2currentFrame+((CalculatedData2[secondindex],),)
-
-	if 	zerothindex==0:
-
-		for thirdindex in range(0,len(CalculatedData1currentFrame)):
-
-		    CalculatedData1Sum.append(CalculatedData1currentFrame[thirdindex][0])
-
-	else:
-
-		for thirdindex in range(0,len(CalculatedData1currentFrame)):
-
-		    CalculatedData1Sum[thirdindex]=CalculatedData1Sum[thirdindex]+CalculatedData1currentFrame[thirdindex][0]
-
-	if 	zerothindex==0:
-
-		for thirdindex in range(0,len(CalculatedData2currentFrame)):
-
-		    CalculatedData2Sum.append(CalculatedData2currentFrame[thirdindex][0])
-
-	else:
-
-		for thirdindex in range(0,len(CalculatedData2currentFrame)):
-
-		    CalculatedData2Sum[thirdindex]=CalculatedData2Sum[thirdindex]+CalculatedData2currentFrame[thirdindex][0]
-
-	OdbToWrite= openOdb(path=OdbToWriteName, readOnly=False)
-
-	instance1=OdbToWrite.rootAssembly.instances['PART-1-1']
-
-	OdbToWriteStepName=StepNamei+"-"+StepNameiMinusOne
-
-	#  Create a step and a frame.
-	step1 = OdbToWrite.Step(name=OdbToWriteStepName,
-		description=OdbToWriteStepName,
-		domain=TIME, timePeriod=1.0)
-
-	analysisTime=0.0
-
-	frameFinal = step1.Frame(incrementNumber=0,
-		frameValue=analysisTime,
-		description='Step Time= '+str(analysisTime))
-
-	#  Write nodal calculated Data 1
-	uField = frameFinal.FieldOutput(name='RUIZ PARAMETER',
-		description='RUIZ PARAMETER', type=SCALAR)
-
-	uField.addData(position=NODAL, instance=instance1,
-		labels=nodeLabelData,
-		data=CalculatedData1Zero)
-
-	#  Write nodal calculated Data 2
-	uField = frameFinal.FieldOutput(name='RELATIVE SLIP',
-		description='RELATIVE SLIP', type=SCALAR)
-
-	uField.addData(position=NODAL, instance=instance1,
-		labels=nodeLabelData,
-		data=CalculatedData2Zero)
-
-	analysisTime=1.0
-
-	frameFinal = step1.Frame(incrementNumber=1,
-		frameValue=analysisTime,
-		description='Step Time= '+str(analysisTime))
-
-	#  Write nodal calculated Data 1
-	uField = frameFinal.FieldOutput(name='RUIZ PARAMETER',
-		description='RUIZ PARAMETER', type=SCALAR)
-
-	uField.addData(position=NODAL, instance=instance1,
-		labels=nodeLabelData,
-		data=CalculatedData1currentFrame)
-
-	#  Write nodal calculated Data 2
-	uField = frameFinal.FieldOutput(name='RELATIVE SLIP',
-		description='RELATIVE SLIP', type=SCALAR)
-
-	uField.addData(position=NODAL, instance=instance1,
-		labels=nodeLabelData,
-		data=CalculatedData2currentFrame)
-
-for fourthindex in range(0,len(CalculatedData1Sum)):
-	CalculatedData1SumTuple=CalculatedData1SumTuple+((CalculatedData1Sum[fourthindex],),)
-
-for fourthindex in range(0,len(CalculatedData2Sum)):
-	CalculatedData2SumTuple=CalculatedData2SumTuple+((CalculatedData2Sum[fourthindex],),)
-
-#  Create a step and a frame
-step1 = OdbToWrite.Step(name='Total Results',
-	description='Total Results',
-	domain=TIME, timePeriod=1.0)
-
-analysisTime=0.0
-
-frameFinal = step1.Frame(incrementNumber=0,
-	frameValue=analysisTime,
-	description='Step Time= '+str(analysisTime))
-
-#  Write nodal calculated Data 1
-uField = frameFinal.FieldOutput(name='RUIZ PARAMETER SUM',
-	description='RUIZ PARAMETER SUM', type=SCALAR)
-
-uField.addData(position=NODAL, instance=instance1,
-	labels=nodeLabelData,
-	data=CalculatedData1Zero)
-
-#  Write nodal calculated Data 2
-uField = frameFinal.FieldOutput(name='RELATIVE SLIP SUM',
-	description='RELATIVE SLIP SUM', type=SCALAR)
-
-uField.addData(position=NODAL, instance=instance1,
-	labels=nodeLabelData,
-	data=CalculatedData2Zero)
-
-analysisTime=1.0
-
-frameFinal = step1.Frame(incrementNumber=1,
-	frameValue=analysisTime,
-	description='Step Time= '+str(analysisTime))
-
-#  Write nodal calculated Data 1
-uField = frameFinal.FieldOutput(name='RUIZ PARAMETER SUM',
-	description='RUIZ PARAMETER SUM', type=SCALAR)
-
-uField.addData(position=NODAL, instance=instance1,
-	labels=nodeLabelData,
-	data=CalculatedData1SumTuple)
-
-#  Write nodal calculated Data 2
-uField = frameFinal.FieldOutput(name='RELATIVE SLIP SUM',
-	description='RELATIVE SLIP SUM', type=SCALAR)
-
-uField.addData(position=NODAL, instance=instance1,
-	labels=nodeLabelData,
-	data=CalculatedData2SumTuple)
-
-OdbToWrite.save()
-OdbToWrite.close()
-
-OdbToRead.close()
-
-end = time.clock()
+end = time.time()
 
 TimeTaken=end - start
 
 with open('Time_Taken_By_Script_In_Seconds.txt', 'a') as myfile:
 	myfile.write('Time taken by script in seconds is: '+str(TimeTaken) +'\n')
+	myfile.write('Time taken to open ODBs once in seconds is: '+str(Session.OpenTime)+' (re-opening per step pair would add about '+str(Session.OpenTime*(len(STEP_NUMBERS)-2))+')\n')
+	myfile.write('Frames read from ODB: '+str(Session.FrameReads())+'\n')
 	myfile.close
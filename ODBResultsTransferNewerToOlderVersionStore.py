@@ -10,6 +10,11 @@ REV-02 (18th August 2019): (1) Improved efficiency
 						   (2) Added capability to handle multiple frames
 REV-03 (22nd August 2019): (1) Improved efficiency
 						   (2) Removed un-necessary fields of storage
+REV-04 (18th October 2026): Labels and data are collected with AddDataPayload (OdbArrayTools.py, keep it in the same folder)
+REV-05 (18th October 2026): Per-phase profiling with ScriptProfiler.py (set SCRIPT_PROFILE_FILE, keep it in the same folder)
+REV-06 (18th October 2026): Runs with python 3 and without a license with the FakeAbaqus package, script time is wall clock time (time.clock is not in python 3)
+REV-07 (18th October 2026): Labels and the U and A fields of all frames are written to one binary container file (ODBResultsTransfer.fields,
+						   see FieldContainerWriter in OdbArrayTools.py) instead of one pickle file per frame and quantity
 Author:
 Ranjit GOPI
 Solution Consultant, SIMULIA India COE
@@ -23,9 +28,14 @@ from odbAccess import *
 from abaqusConstants import *
 import time
 import csv
-import pickle
+import numpy
+from OdbArrayTools import AddDataPayload, FieldContainerWriter
+from ScriptProfiler import ScriptProfiler
 
-start = time.clock()
+start = time.time()
+
+# Phases are recorded in the file named by environment variable SCRIPT_PROFILE_FILE (see ScriptProfiler.py)
+Profiler = ScriptProfiler('ODBResultsTransferNewerToOlderVersionStore.py')
 
 # Reading all the input values from a csv file
 with open('INPUTS.csv', 'r') as f:
@@ -41,29 +51,29 @@ with open('INPUTS.csv', 'r') as f:
 			OdbToWriteName=row[1]+'.odb'
 		count =count + 1
 
+# Single file read by ODBResultsTransferNewerToOlderVersionWrite.py, keep it in the folder of both scripts
+ResultsContainerName='ODBResultsTransfer.fields'
+
+Profiler.Start('ODB OPEN')
 OdbToRead = openOdb(path=OdbToReadName, readOnly=True)
+Profiler.Stop()
 
 StepOfInterest = OdbToRead.steps[OdbToReadStepName]
 
 NumberofFrames=len(OdbToRead.steps[OdbToReadStepName].frames)
 
-fileObject = open('NumberofFrames','wb')
-pickle.dump(NumberofFrames,fileObject)
-fileObject.close()
-
 NodeSetOfInterest=OdbToRead.rootAssembly.instances['PART-1-1'] #ANY ORPHAN INPUT FILE CREATED BY ANSA OR HYPERMESH WILL HAVE DEFAULT INSTANCE NAME PART-1-1 IN ABAQUS
 
-nodeLabelData=()
+nodeLabelPayload=AddDataPayload(len(NodeSetOfInterest.nodes),0)
 
 for node in (NodeSetOfInterest.nodes):
 
-	currentnodelabel=node.label
+	nodeLabelPayload.Append(node.label)
 
-	nodeLabelData=nodeLabelData+(currentnodelabel,)
+nodeLabelData=nodeLabelPayload.Labels()
 
-fileObject = open('nodeLabelData','wb')
-pickle.dump(nodeLabelData,fileObject)
-fileObject.close()
+# Labels are written once, the frames are added to the container as they are read
+Container=FieldContainerWriter(ResultsContainerName, nodeLabelData)
 
 for frame in range(1,NumberofFrames):
 
@@ -71,36 +81,38 @@ for frame in range(1,NumberofFrames):
 
 	frameTime= currentFrame.frameValue
 
-	fileObject = open('frameTimeData'+str(frame),'wb')
-	pickle.dump(frameTime,fileObject)
-	fileObject.close()
+	Profiler.Start('FIELD EXTRACTION')
+
+	# Data is collected block by block into preallocated buffers (see AddDataPayload in OdbArrayTools.py)
+	dispPayload=AddDataPayload(len(nodeLabelData),3)
+
+	accPayload=AddDataPayload(len(nodeLabelData),3)
+
+	# Precision of the ODB (float32 for single precision) is kept in the container
+	DataType=numpy.float32
 
-	U= currentFrame.fieldOutputs['U'].values
-	A= currentFrame.fieldOutputs['A'].values
+	for block in (currentFrame.fieldOutputs['U'].bulkDataBlocks):
 
-	dispDatacurrentFrame=()
+		dispPayload.Extend(block.nodeLabels,block.data[:,0:3])
+		DataType=numpy.asarray(block.data).dtype
 
-	accDatacurrentFrame=()
+	for block in (currentFrame.fieldOutputs['A'].bulkDataBlocks):
 
-	for value in (U):
+		accPayload.Extend(block.nodeLabels,block.data[:,0:3])
 
-		dispDatacurrentFrame=dispDatacurrentFrame+((value.data[0],value.data[1],value.data[2]),)
+	Profiler.Stop(frame=frame)
 
-	for value in (A):
+	Profiler.Start('CONTAINER WRITE')
 
-		accDatacurrentFrame=accDatacurrentFrame+((value.data[0],value.data[1],value.data[2]),)
+	Container.AddFrame(frame, frameTime, [('U', dispPayload.DataArray().astype(DataType)), ('A', accPayload.DataArray().astype(DataType))])
 
-	fileObject = open('dispDatacurrentFrame'+str(frame),'wb')
-	pickle.dump(dispDatacurrentFrame,fileObject)
-	fileObject.close()
+	Profiler.Stop(frame=frame)
 
-	fileObject = open('accDatacurrentFrame'+str(frame),'wb')
-	pickle.dump(accDatacurrentFrame,fileObject)
-	fileObject.close()
+Container.Close()
 
 OdbToRead.close()
 
-end = time.clock()
+end = time.time()
 
 TimeTaken=end - start
 
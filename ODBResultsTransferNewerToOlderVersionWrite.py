@@ -10,6 +10,10 @@ REV-02 (18th August 2019): (1) Improved efficiency
 						   (2) Added capability to handle multiple frames
 REV-03 (22nd August 2019): (1) Improved efficiency
 						   (2) Removed un-necessary fields of storage
+REV-04 (18th October 2026): Per-phase profiling with ScriptProfiler.py (set SCRIPT_PROFILE_FILE, keep it in the same folder)
+REV-05 (18th October 2026): Runs with python 3 and without a license with the FakeAbaqus package, script time is wall clock time (time.clock is not in python 3)
+REV-06 (18th October 2026): Labels and fields are read from the binary container file of the store script with memory maps (FieldContainerReader
+						   in OdbArrayTools.py, keep it in the same folder), no pickle files, the arrays are given to addData as they are (AddNodalData)
 
 Author:
 Ranjit GOPI
@@ -25,10 +29,14 @@ from abaqusConstants import *
 
 import csv
 import time
-import pickle
 import os
+from OdbArrayTools import FieldContainerReader
+from ScriptProfiler import ScriptProfiler
 
-start = time.clock()
+start = time.time()
+
+# Phases are recorded in the file named by environment variable SCRIPT_PROFILE_FILE (see ScriptProfiler.py)
+Profiler = ScriptProfiler('ODBResultsTransferNewerToOlderVersionWrite.py')
 
 # Reading all the input values from a csv file
 with open('INPUTS.csv', 'r') as f:
@@ -44,7 +52,27 @@ with open('INPUTS.csv', 'r') as f:
 			OdbToWriteName=row[1]+'.odb'
 		count =count + 1
 
+# True until addData rejects a numpy array, the remaining frames are then given tuples without trying the array again
+AddDataTakesArrays = True
+
+def AddNodalData(Field, Instance, Labels, Data):
+	# The numpy array is given to addData as it is, versions of Abaqus whose addData only takes sequences of sequences raise
+	# TypeError, ValueError or OdbError for the array and get tuples
+	global AddDataTakesArrays
+	if AddDataTakesArrays:
+		try:
+			Field.addData(position=NODAL, instance=Instance, labels=Labels, data=Data)
+			return
+		except (TypeError, ValueError, OdbError):
+			AddDataTakesArrays = False
+	Field.addData(position=NODAL, instance=Instance, labels=Labels, data=tuple(map(tuple, Data.tolist())))
+
+# Single file written by ODBResultsTransferNewerToOlderVersionStore.py
+ResultsContainerName='ODBResultsTransfer.fields'
+
+Profiler.Start('ODB OPEN')
 OdbToWrite= openOdb(path=OdbToWriteName, readOnly=False)
+Profiler.Stop()
 
 instance1=OdbToWrite.rootAssembly.instances['PART-1-1']
 
@@ -52,27 +80,29 @@ OdbToWriteStepName=OdbToReadStepName
 
 step1=OdbToWrite.steps[OdbToWriteStepName]
 
-fileObject = open('NumberofFrames','r')
-NumberofFrames = pickle.load(fileObject)
-fileObject.close()
+# Frames are read from memory maps of the blocks of the container, each block is read from disk when it is used
+Container = FieldContainerReader(ResultsContainerName)
+
+nodeLabelData = tuple(Container.Labels.tolist())
+
+dispDatacurrentFrame = accDatacurrentFrame = None
+
+for FramePosition in range(len(Container.FrameNumbers)):
 
-fileObject = open('nodeLabelData','r')
-nodeLabelData = pickle.load(fileObject)
-fileObject.close()
+	frame = Container.FrameNumbers[FramePosition]
 
-for frame in range(1,NumberofFrames):
+	Profiler.Start('CONTAINER READ')
 
-	fileObject = open('frameTimeData'+str(frame),'r')
-	frameTimeData= pickle.load(fileObject)
-	fileObject.close()
+	frameTimeData = Container.FrameValues[FramePosition]
 
-	fileObject = open('dispDatacurrentFrame'+str(frame),'r')
-	dispDatacurrentFrame = pickle.load(fileObject)
-	fileObject.close()
+	# Memory maps of the blocks, the values are read from disk by addData
+	dispDatacurrentFrame = Container.Field(FramePosition, 'U')
 
-	fileObject = open('accDatacurrentFrame'+str(frame),'r')
-	accDatacurrentFrame = pickle.load(fileObject)
-	fileObject.close()
+	accDatacurrentFrame = Container.Field(FramePosition, 'A')
+
+	Profiler.Stop(frame=frame)
+
+	Profiler.Start('ADDDATA')
 
 	analysisTime=frameTimeData
 
@@ -84,30 +114,29 @@ for frame in range(1,NumberofFrames):
 	uField = frameFinal.FieldOutput(name='U',
 		description='Displacement', type=VECTOR)
 
-	uField.addData(position=NODAL, instance=instance1,
-		labels=nodeLabelData,
-		data=dispDatacurrentFrame)
+	AddNodalData(uField, instance1, nodeLabelData, dispDatacurrentFrame)
 
 	#  Write nodal acceleration vector components A1, A2 and A3
 	uField = frameFinal.FieldOutput(name='A',
 		description='Acceleration', type=VECTOR)
 
-	uField.addData(position=NODAL, instance=instance1,
-		labels=nodeLabelData,
-		data=accDatacurrentFrame)
+	AddNodalData(uField, instance1, nodeLabelData, accDatacurrentFrame)
 
+	Profiler.Stop(frame=frame)
+
+Profiler.Start('SAVE')
 OdbToWrite.save()
 OdbToWrite.close()
+Profiler.Stop()
+
+# The memory maps of the last frame are released before the file is removed (an open map keeps the file in use on Windows)
+del dispDatacurrentFrame, accDatacurrentFrame
 
-os.remove('NumberofFrames')
-os.remove('nodeLabelData')
+Container.Close()
 
-for frame in range(1,NumberofFrames):
-	os.remove('frameTimeData'+str(frame))
-	os.remove('dispDatacurrentFrame'+str(frame))
-	os.remove('accDatacurrentFrame'+str(frame))
+os.remove(ResultsContainerName)
 
-end = time.clock()
+end = time.time()
 
 TimeTaken=end - start
 
@@ -0,0 +1,310 @@
+"""
+OdbArrayTools.py
+
+Array helpers shared by the ODB post processing scripts (FrettingAssesmentUsingRuizParameter.py, ArchardWearIterator.py).
+
+NodeSetLabelIndex is built once per node set. It holds the sorted unique node labels of the set, positions of labels in them are found
+by binary search (numpy.searchsorted). Any field output (or field output subset) is scattered into a zero filled dense array aligned to
+these labels in one pass over its bulkDataBlocks, so no per-node dictionaries, padding or sorting are needed for every field and frame.
+Overlapping node sets can be indexed together, nodes shared by several sets are then extracted and written only once. Each node set is
+read as its own region and scattered into the union, so no field is read on a larger region (such as the whole instance).
+
+AddDataPayload collects node or element labels and component data into preallocated numpy buffers and gives the labels and
+data arguments of FieldOutput.addData in one step. It replaces building the payload by tuple concatenation
+(labels=labels+(label,)), which copies the whole tuple for every appended value.
+
+FieldContainerWriter writes label aligned field arrays of many frames to one binary file, for example the results carried from a newer
+to an older Abaqus version (ODBResultsTransferNewerToOlderVersionStore.py and ...Write.py). The labels are written once, every (frame, field)
+is one contiguous float32 or float64 block and a JSON header index with the frame numbers, frame values and block offsets is written at
+the end of the file. FieldContainerReader reads the index and maps the blocks with numpy.memmap, no python objects are unpickled and only
+the blocks used are read from disk.
+
+Please note:
+1. Keep this file in the same folder as the scripts using it (FrettingAssesmentUsingRuizParameter.py, ArchardWearIterator.py,
+   ODBResultsTransferNewerToOlderVersionStore.py, Transfer-results-from-one-ODB-to-another)
+2. numpy is shipped with Abaqus python, no extra installation is needed
+
+Revision history:
+REV-00 (18th October 2026): 1st release
+REV-01 (18th October 2026): Added AddDataPayload
+REV-02 (18th October 2026): NodeSetLabelIndex can index the union of several node sets
+REV-03 (18th October 2026): ScatterWithMask gives the mask of the nodes having a value
+REV-04 (18th October 2026): Added FieldContainerWriter and FieldContainerReader, AddDataPayload.DataArray
+REV-05 (18th October 2026): FieldContainerReader.Close releases the memory maps and reports arrays still in use
+REV-06 (18th October 2026): NodeSetLabelIndex builds no label to position dictionary, all lookups use the sorted labels
+REV-07 (18th October 2026): The node sets of a NodeSetLabelIndex union are read one region per node set
+REV-08 (18th October 2026): Added AddDataFromArray, the data argument of addData without the labels
+
+Author:
+Ranjit GOPI
+Solution Consultant, SIMULIA India COE
+ranjit.gopi@3ds.com
+Simulia India Support Frontdesk:+91 44 43443000
+Simulia India Support Email: simulia.in.support@3ds.com
+3DS.COM/SIMULIA
+"""
+import os
+import json
+import struct
+import weakref
+import numpy
+
+class NodeSetLabelIndex:
+	# Sorted labels of a node set, dense field arrays of the set are aligned to Labels and positions are found by binary search
+	# NodeSetOfInterest can also be a list of node sets of one instance, the union of their nodes is indexed once and
+	# fields are read on each node set in turn and scattered to the union (shared nodes are written again with the same values)
+
+	def __init__(self, NodeSetOfInterest):
+
+		if isinstance(NodeSetOfInterest, (list, tuple)):
+			self.NodeSets = list(NodeSetOfInterest)
+		else:
+			self.NodeSets = [NodeSetOfInterest]
+
+		self.Labels = numpy.unique(numpy.concatenate([self.NodeSetLabels(NodeSet) for NodeSet in self.NodeSets]))
+
+	def NodeSetLabels(self, NodeSetOfInterest):
+		return numpy.array([node.label for node in NodeSetOfInterest.nodes], dtype=numpy.int64)
+
+	def View(self, NodeSetOfInterest):
+		# Positions of the nodes of one of the indexed node sets, Array[View] gives the values of that set
+		return numpy.unique(self.Positions(self.NodeSetLabels(NodeSetOfInterest))[0])
+
+	def __len__(self):
+		return len(self.Labels)
+
+	def Positions(self, Labels):
+		# Positions of Labels in the index and a mask of the labels which belong to the node set
+		Labels = numpy.asarray(Labels, dtype=numpy.int64)
+
+		Positions = numpy.searchsorted(self.Labels, Labels)
+		Positions[Positions == len(self.Labels)] = 0
+		InSet = self.Labels[Positions] == Labels
+
+		return Positions, InSet
+
+	def Scatter(self, FieldOutput, NumberOfComponents=None):
+		# Dense float array of FieldOutput on the node set, zero for nodes with no value
+		# Scalar fields give shape (nodes,), vector fields give shape (nodes, components)
+		return self.ScatterWithMask(FieldOutput, NumberOfComponents)[0]
+
+	def ScatterWithMask(self, FieldOutput, NumberOfComponents=None):
+		# Scatter and a boolean mask of the nodes which have a value
+		# FieldOutput can also be an iterable of field outputs (for example one subset per node set), scattered in turn
+		if hasattr(FieldOutput, 'bulkDataBlocks'):
+			FieldOutputs = [FieldOutput]
+		else:
+			FieldOutputs = FieldOutput
+
+		DenseData = None
+		HasValue = numpy.zeros(len(self.Labels), dtype=bool)
+
+		for block in (block for FieldOutput in FieldOutputs for block in FieldOutput.bulkDataBlocks):
+
+			BlockLabels = numpy.asarray(block.nodeLabels, dtype=numpy.int64)
+			BlockData = numpy.asarray(block.data, dtype=numpy.float64).reshape(len(BlockLabels), -1)
+
+			if DenseData is None:
+				DenseData = numpy.zeros((len(self.Labels), BlockData.shape[1]), dtype=numpy.float64)
+
+			Positions, InSet = self.Positions(BlockLabels)
+
+			DenseData[Positions[InSet]] = BlockData[InSet, :DenseData.shape[1]]
+			HasValue[Positions[InSet]] = True
+
+		if DenseData is None:
+			DenseData = numpy.zeros((len(self.Labels), NumberOfComponents or 1), dtype=numpy.float64)
+
+		if DenseData.shape[1] == 1 and not NumberOfComponents:
+			return DenseData[:, 0], HasValue
+
+		return DenseData, HasValue
+
+	def FieldSubsets(self, Frame, FieldName):
+		# Subsets of a field of Frame on each indexed node set, read one at a time
+		FieldOutput = Frame.fieldOutputs[FieldName]
+		return (FieldOutput.getSubset(region=NodeSet) for NodeSet in self.NodeSets)
+
+	def ScatterField(self, Frame, FieldName, NumberOfComponents=None):
+		# Dense array of a field of Frame on the node set, see Scatter
+		return self.Scatter(self.FieldSubsets(Frame, FieldName), NumberOfComponents)
+
+	def ScatterFieldWithMask(self, Frame, FieldName, NumberOfComponents=None):
+		# Dense array of a field of Frame on the node set and the mask of the nodes which have a value, see ScatterWithMask
+		return self.ScatterWithMask(self.FieldSubsets(Frame, FieldName), NumberOfComponents)
+
+class AddDataPayload:
+	# Labels and component data for FieldOutput.addData, NumberOfComponents=0 collects labels only
+	# Buffers are preallocated for Size rows and doubled if more rows are appended
+
+	def __init__(self, Size=0, NumberOfComponents=1):
+
+		self.LabelBuffer = numpy.zeros(max(int(Size), 1), dtype=numpy.int64)
+		self.DataBuffer = numpy.zeros((max(int(Size), 1), NumberOfComponents), dtype=numpy.float64)
+		self.Count = 0
+
+	def Reserve(self, Rows):
+		# Grow the buffers so that Rows more rows fit
+		Needed = self.Count + Rows
+		if Needed <= len(self.LabelBuffer):
+			return
+
+		NewSize = max(Needed, 2*len(self.LabelBuffer))
+
+		LabelBuffer = numpy.zeros(NewSize, dtype=numpy.int64)
+		LabelBuffer[:self.Count] = self.LabelBuffer[:self.Count]
+		self.LabelBuffer = LabelBuffer
+
+		DataBuffer = numpy.zeros((NewSize, self.DataBuffer.shape[1]), dtype=numpy.float64)
+		DataBuffer[:self.Count] = self.DataBuffer[:self.Count]
+		self.DataBuffer = DataBuffer
+
+	def Append(self, Label, Data=None):
+		# One row, Data is a float or a sequence of NumberOfComponents floats
+		self.Reserve(1)
+		self.LabelBuffer[self.Count] = Label
+		if Data is not None:
+			self.DataBuffer[self.Count] = Data
+		self.Count = self.Count + 1
+
+	def Extend(self, Labels, Data=None):
+		# Many rows at once, for example the nodeLabels and data of a bulkDataBlock
+		Labels = numpy.asarray(Labels, dtype=numpy.int64).reshape(-1)
+		self.Reserve(len(Labels))
+		self.LabelBuffer[self.Count:self.Count+len(Labels)] = Labels
+		if Data is not None:
+			self.DataBuffer[self.Count:self.Count+len(Labels)] = numpy.asarray(Data, dtype=numpy.float64).reshape(len(Labels), -1)
+		self.Count = self.Count + len(Labels)
+
+	def Labels(self):
+		# Tuple of labels for addData(labels=...)
+		return tuple(self.LabelBuffer[:self.Count].tolist())
+
+	def Data(self):
+		# Tuple of component tuples for addData(data=...)
+		return tuple(map(tuple, self.DataBuffer[:self.Count].tolist()))
+
+	def Payload(self):
+		return self.Labels(), self.Data()
+
+	def DataArray(self):
+		# Data rows as a (rows, NumberOfComponents) float64 array, a view of the buffer
+		return self.DataBuffer[:self.Count]
+
+def AddDataPayloadFromArrays(Labels, Data):
+	# Labels and data arguments of addData from a label array and a (rows,) or (rows, components) data array
+	Data = numpy.asarray(Data, dtype=numpy.float64)
+	Payload = AddDataPayload(len(Labels), 1 if Data.ndim == 1 else Data.shape[1])
+	Payload.Extend(Labels, Data)
+	return Payload.Payload()
+
+def AddDataFromArray(Data):
+	# Data argument of addData (tuple of component tuples) from a (rows,) or (rows, components) array, for labels built once
+	Data = numpy.asarray(Data, dtype=numpy.float64)
+	return tuple(map(tuple, Data.reshape(len(Data), -1).tolist()))
+
+# File of FieldContainerWriter: FIELD_CONTAINER_MAGIC, the blocks (at offsets aligned to FIELD_CONTAINER_ALIGNMENT bytes), the JSON
+# header index, then the offset of the index (little endian unsigned 64 bit) and FIELD_CONTAINER_MAGIC again
+FIELD_CONTAINER_MAGIC = b'ODBFIELDCONTAINER-1\n'
+FIELD_CONTAINER_ALIGNMENT = 64
+FIELD_CONTAINER_TRAILER = struct.calcsize('<Q') + len(FIELD_CONTAINER_MAGIC)
+
+class FieldContainerWriter:
+	# Labels once and the field arrays of the frames added in order, each array (labels,) or (labels, components) is written when its
+	# frame is added, only the header index is kept in memory. The file is written as Name+'.tmp' and renamed at Close
+
+	def __init__(self, Name, Labels):
+
+		self.Name = Name
+		self.TemporaryName = Name+'.tmp'
+		self.File = open(self.TemporaryName, 'wb')
+		self.File.write(FIELD_CONTAINER_MAGIC)
+
+		self.Labels = numpy.asarray(Labels, dtype=numpy.int64).reshape(-1)
+		self.Index = {'Labels': self.WriteBlock(self.Labels), 'Frames': []}
+
+	def WriteBlock(self, Array):
+		# Offset, dtype and shape of Array written at the next aligned offset
+		Array = numpy.ascontiguousarray(Array)
+
+		Offset = self.File.tell()
+		Padding = (-Offset) % FIELD_CONTAINER_ALIGNMENT
+		self.File.write(b'\0'*Padding)
+		Array.tofile(self.File)
+
+		return {'Offset': Offset + Padding, 'DType': Array.dtype.str, 'Shape': list(Array.shape)}
+
+	def AddFrame(self, FrameNumber, FrameValue, Fields):
+		# Fields is a list of (field name, array aligned to the labels), float32 arrays are kept in single precision
+		Blocks = {}
+		for FieldName, Data in Fields:
+			Data = numpy.asarray(Data)
+			if Data.dtype != numpy.float32:
+				Data = Data.astype(numpy.float64)
+			if len(Data) != len(self.Labels):
+				raise ValueError('Field '+FieldName+' of frame '+str(FrameNumber)+' has '+str(len(Data))+' rows for '+str(len(self.Labels))+' labels')
+			Blocks[FieldName] = self.WriteBlock(Data)
+
+		self.Index['Frames'].append({'FrameNumber': int(FrameNumber), 'FrameValue': float(FrameValue), 'Fields': Blocks})
+
+	def Close(self):
+		IndexOffset = self.File.tell()
+		self.File.write(json.dumps(self.Index).encode('ascii'))
+		self.File.write(struct.pack('<Q', IndexOffset) + FIELD_CONTAINER_MAGIC)
+		self.File.close()
+
+		if os.path.exists(self.Name):
+			os.remove(self.Name)
+		os.rename(self.TemporaryName, self.Name)
+
+class FieldContainerReader:
+	# Labels, frame numbers and frame values of a FieldContainerWriter file, the arrays are memory maps of its blocks
+
+	def __init__(self, Name):
+
+		self.Name = Name
+
+		ContainerFile = open(Name, 'rb')
+		Magic = ContainerFile.read(len(FIELD_CONTAINER_MAGIC))
+		ContainerFile.seek(-FIELD_CONTAINER_TRAILER, 2)
+		Trailer = ContainerFile.read(FIELD_CONTAINER_TRAILER)
+
+		if Magic != FIELD_CONTAINER_MAGIC or Trailer[-len(FIELD_CONTAINER_MAGIC):] != FIELD_CONTAINER_MAGIC:
+			ContainerFile.close()
+			raise ValueError(Name+' is not a complete field container file')
+
+		IndexOffset = struct.unpack('<Q', Trailer[:-len(FIELD_CONTAINER_MAGIC)])[0]
+		ContainerFile.seek(IndexOffset)
+		self.Index = json.loads(ContainerFile.read(os.path.getsize(Name) - FIELD_CONTAINER_TRAILER - IndexOffset).decode('ascii'))
+		ContainerFile.close()
+
+		# Weak references of the memory maps handed out, released by Close
+		self.Maps = []
+
+		self.Labels = self.Block(self.Index['Labels'])
+		self.FrameNumbers = [Frame['FrameNumber'] for Frame in self.Index['Frames']]
+		self.FrameValues = [Frame['FrameValue'] for Frame in self.Index['Frames']]
+
+	def Block(self, Block):
+		Shape = tuple(Block['Shape'])
+		if not numpy.prod(Shape):
+			return numpy.zeros(Shape, dtype=numpy.dtype(str(Block['DType'])))
+		Map = numpy.memmap(self.Name, dtype=numpy.dtype(str(Block['DType'])), mode='r', offset=Block['Offset'], shape=Shape)
+		self.Maps.append(weakref.ref(Map))
+		return Map
+
+	def FieldNames(self, FramePosition):
+		return list(self.Index['Frames'][FramePosition]['Fields'].keys())
+
+	def Field(self, FramePosition, FieldName):
+		# Array of FieldName of the frame at FramePosition (0 for the first frame added)
+		return self.Block(self.Index['Frames'][FramePosition]['Fields'][FieldName])
+
+	def Close(self):
+		# Releases the labels and the memory maps still held by the reader. The file stays in use (it cannot be removed on Windows)
+		# while an array given by Field is referenced, the caller deletes them before Close
+		self.Labels = None
+		StillMapped = [Map() for Map in self.Maps if Map() is not None]
+		self.Maps = []
+		if StillMapped:
+			raise ValueError(str(len(StillMapped))+' arrays of '+self.Name+' are still in use, delete them before closing the container')
@@ -0,0 +1,402 @@
+"""
+RuizParameterEngine.py
+
+Array based engine used by FrettingAssesmentUsingRuizParameter.py to calculate the RUIZ parameter.
+
+Every contact field is extracted once per frame and node set into a dense float array aligned to the sorted node labels of the set
+(see NodeSetLabelIndex in OdbArrayTools.py). Nodes of the set which have no value in the field output are filled with 0.0.
+The slip deltas, the RUIZ parameter and the relative slip are then calculated as single array operations instead of value-by-value
+python lists.
+
+FrettingOdbSession opens the ODB to read and the ODB to write once per run, caches step and frame lookups and writes all the steps
+of the run with a single save at the end.
+
+All node sets of a run are merged into one sorted set of unique labels, so nodes shared by overlapping node sets are calculated and
+written once. Each node set is read as its own region and scattered into the merged arrays. FrettingOdbSession.NodeSetView gives the positions of each node set in these arrays for reporting.
+
+ContactFieldCache keeps the extracted contact fields of the last frame read, so that a frame used as frame i of one step pair and
+frame i-1 of the next step pair is read from the ODB only once. No other frame is used twice, so one frame is kept and the size in MB
+is only an upper bound (a frame larger than it is not kept).
+
+EvaluateStepPairs can spread the step pairs over worker processes in short contiguous runs of at most STEP_PAIRS_PER_RUN step pairs
+(at least one run per worker), so the frame shared by two step pairs of a run is read once (only the frame at the boundary of two runs
+is read twice). The runs are returned in order as they finish, so their step pairs are checkpointed during the run. Each worker opens the ODB read only
+and returns the label, RUIZ parameter and relative slip arrays of its step pairs. The parent process does the sums and alone writes the
+output ODB.
+
+RuizAccumulator keeps the cumulative sums of a run and checkpoints them to a binary file after each step pair, together with the
+per step pair results in single precision. A restarted run with the same inputs continues after the last completed step pair and
+writes the steps of the completed pairs from the checkpoint without reading their frames again. The checkpoint also holds the path,
+size and modification time of the ODB read, a checkpoint of another (or a rewritten) ODB is not resumed.
+
+Please note:
+1. Keep this file, OdbArrayTools.py and ScriptProfiler.py in the same folder as FrettingAssesmentUsingRuizParameter.py
+2. numpy is shipped with Abaqus python, no extra installation is needed
+3. Worker processes are started with multiprocessing, use abq2018 python FrettingAssesmentUsingRuizParameter.py on Linux for parallel runs
+
+Revision history:
+REV-00 (18th October 2026): 1st release
+REV-01 (18th October 2026): Node set labels are indexed once per node set with NodeSetLabelIndex
+REV-02 (18th October 2026): Added RuizAccumulator with checkpoint and resume
+REV-03 (18th October 2026): Node sets of a run are merged into one set of unique labels
+REV-04 (18th October 2026): ODB OPEN, FIELD EXTRACTION, COMPUTE, ADDDATA and SAVE phases are profiled with ScriptProfiler
+REV-05 (18th October 2026): ContactFieldCache keeps only the last frame read, frames read by the worker processes are counted
+REV-06 (18th October 2026): Worker processes evaluate contiguous runs of step pairs (StepPairRuns), one task per run
+REV-07 (18th October 2026): RuizAccumulator resumes only a checkpoint of the same ODB to read (path, size and modification time)
+REV-08 (18th October 2026): Step pairs are split into runs of at most STEP_PAIRS_PER_RUN step pairs, streamed back as they finish
+REV-09 (18th October 2026): Several node sets are read one region per node set instead of on the whole instance
+REV-10 (18th October 2026): RuizAccumulator resumes from CheckpointName+'.tmp' if the checkpoint itself is missing
+REV-11 (18th October 2026): The labels given to addData are built once per step, not again with the data of every field
+
+Author:
+Ranjit GOPI
+Solution Consultant, SIMULIA India COE
+ranjit.gopi@3ds.com
+Simulia India Support Frontdesk:+91 44 43443000
+Simulia India Support Email: simulia.in.support@3ds.com
+3DS.COM/SIMULIA
+"""
+from odbAccess import *
+from abaqusConstants import *
+import os
+import time
+import multiprocessing
+import numpy
+from collections import OrderedDict
+from OdbArrayTools import NodeSetLabelIndex, AddDataPayloadFromArrays, AddDataFromArray
+from ScriptProfiler import ScriptProfiler
+
+def RuizKernel(CSHEAR1i, CSHEAR2i, CSLIP1i, CSLIP2i, CSLIP1iMinusOne, CSLIP2iMinusOne):
+	# RUIZ parameter and relative slip of one step pair, all inputs are label aligned arrays
+	A = CSLIP1i - CSLIP1iMinusOne
+	B = CSLIP2i - CSLIP2iMinusOne
+
+	RuizParameter = numpy.sqrt((CSHEAR1i*A)**2 + (CSHEAR2i*B)**2)
+	RelativeSlip = numpy.sqrt(A**2 + B**2)
+
+	return RuizParameter, RelativeSlip
+
+CONTACT_FIELD_NAMES = ('CSHEAR1', 'CSHEAR2', 'CSLIP1', 'CSLIP2')
+
+# Maximum number of step pairs of a worker task, a finished run is checkpointed before the later runs
+STEP_PAIRS_PER_RUN = 8
+
+def ExtractContactFields(Frame, LabelIndex):
+	# (sorted labels, CSHEAR1, CSHEAR2, CSLIP1, CSLIP2) of one frame and node set, LabelIndex is the NodeSetLabelIndex of the set
+	return (LabelIndex.Labels,) + tuple([LabelIndex.ScatterField(Frame, FieldName) for FieldName in CONTACT_FIELD_NAMES])
+
+def EvaluateNodeSet(ContactFieldsi, ContactFieldsiMinusOne):
+	# Sorted labels, RUIZ parameter and relative slip of one node set for one step pair
+	SortedLabels, CSHEAR1i, CSHEAR2i, CSLIP1i, CSLIP2i = ContactFieldsi
+	CSLIP1iMinusOne, CSLIP2iMinusOne = ContactFieldsiMinusOne[3], ContactFieldsiMinusOne[4]
+
+	RuizParameter, RelativeSlip = RuizKernel(CSHEAR1i, CSHEAR2i, CSLIP1i, CSLIP2i, CSLIP1iMinusOne, CSLIP2iMinusOne)
+
+	return SortedLabels, RuizParameter, RelativeSlip
+
+class ContactFieldCache:
+	# Least recently used cache of extracted contact fields keyed by (step number, frame number, node set names)
+	# Entries are dropped oldest first once there are more than MaxEntries or the arrays held exceed MaxMegaBytes
+	# A step pair reads frame i-1 before frame i, so one entry keeps frame i for the next step pair
+
+	def __init__(self, MaxMegaBytes=1024.0, MaxEntries=1):
+
+		self.MaxBytes = float(MaxMegaBytes)*1024*1024
+		self.MaxEntries = MaxEntries
+		self.Entries = OrderedDict()
+		self.Bytes = 0
+		self.FrameReads = 0
+
+	def Get(self, Key, Frame, LabelIndex):
+
+		if Key in self.Entries:
+			ContactFields = self.Entries.pop(Key)
+			self.Entries[Key] = ContactFields
+			return ContactFields
+
+		ContactFields = ExtractContactFields(Frame, LabelIndex)
+		self.FrameReads = self.FrameReads + 1
+
+		EntryBytes = sum([Array.nbytes for Array in ContactFields[1:]])
+
+		if EntryBytes <= self.MaxBytes:
+
+			while self.Entries and (len(self.Entries) >= self.MaxEntries or self.Bytes + EntryBytes > self.MaxBytes):
+				OldestKey = next(iter(self.Entries))
+				self.Bytes = self.Bytes - sum([Array.nbytes for Array in self.Entries.pop(OldestKey)[1:]])
+
+			self.Entries[Key] = ContactFields
+			self.Bytes = self.Bytes + EntryBytes
+
+		return ContactFields
+
+class FrettingOdbSession:
+	# Read and write ODBs of one fretting run, both are opened once and closed by Close()
+
+	# OdbToWriteName=None gives a read only session, as used by the worker processes
+
+	def __init__(self, OdbToReadName, OdbToWriteName, InstanceName='PART-1-1', CacheMegaBytes=1024.0, Profiler=None):
+
+		if Profiler is None:
+			Profiler = ScriptProfiler('RuizParameterEngine.py')
+		self.Profiler = Profiler
+
+		self.Profiler.Start('ODB OPEN')
+		OpenStart = time.time()
+
+		self.OdbToReadName = OdbToReadName
+		self.InstanceName = InstanceName
+		self.CacheMegaBytes = CacheMegaBytes
+
+		self.OdbToRead = openOdb(path=OdbToReadName, readOnly=True)
+		self.OdbToWrite = None
+		if OdbToWriteName is not None:
+			self.OdbToWrite = openOdb(path=OdbToWriteName, readOnly=False)
+
+		self.OpenTime = time.time() - OpenStart
+		self.Profiler.Stop()
+
+		self.StepNames = list(self.OdbToRead.steps.keys())
+		self.ReadInstance = self.OdbToRead.rootAssembly.instances[InstanceName] #ANY ORPHAN INPUT FILE CREATED BY ANSA OR HYPERMESH WILL HAVE DEFAULT INSTANCE NAME PART-1-1 IN ABAQUS
+		self.WriteInstance = None
+		if self.OdbToWrite is not None:
+			self.WriteInstance = self.OdbToWrite.rootAssembly.instances[InstanceName]
+
+		self.FrameLookup = {}
+		self.NodeSetLookup = {}
+		self.FieldCache = ContactFieldCache(CacheMegaBytes)
+		self.WorkerFrameReads = 0
+
+	def FrameReads(self):
+		# Frames read from the ODB by this process and by the worker processes of EvaluateStepPairs
+		return self.FieldCache.FrameReads + self.WorkerFrameReads
+
+	def StepName(self, StepNumber):
+		return self.StepNames[int(StepNumber)]
+
+	def Frame(self, StepNumber, FrameNumber):
+		key = (int(StepNumber), int(FrameNumber))
+		if key not in self.FrameLookup:
+			self.FrameLookup[key] = self.OdbToRead.steps[self.StepName(StepNumber)].frames[int(FrameNumber)]
+		return self.FrameLookup[key]
+
+	def NodeSets(self, NodeSetNames):
+		# NodeSetLabelIndex of the union of the node sets, built once and shared by all fields and frames
+		# Every node set is read as its own region, nodes shared by several sets are read again with the same values
+		Key = tuple(NodeSetNames)
+		if Key not in self.NodeSetLookup:
+			NodeSets = [self.ReadInstance.nodeSets[NodeSetName] for NodeSetName in NodeSetNames]
+			self.NodeSetLookup[Key] = NodeSetLabelIndex(NodeSets)
+		return self.NodeSetLookup[Key]
+
+	def NodeSetView(self, NodeSetNames, NodeSetName):
+		# Positions of one node set in the arrays of the union of NodeSetNames
+		return self.NodeSets(NodeSetNames).View(self.ReadInstance.nodeSets[NodeSetName])
+
+	def ContactFields(self, StepNumber, FrameNumber, NodeSetNames):
+		# Every frame is extracted once for the union of the node sets, the same frame is used as i of one step pair and i-1 of the next one
+		return self.FieldCache.Get((int(StepNumber), int(FrameNumber), tuple(NodeSetNames)), self.Frame(StepNumber, FrameNumber), self.NodeSets(NodeSetNames))
+
+	def WriteStep(self, StepName, Labels, FieldData):
+		# Step with a zero frame and a result frame, FieldData is a list of (field name, label aligned array)
+		step1 = self.OdbToWrite.Step(name=StepName,
+			description=StepName,
+			domain=TIME, timePeriod=1.0)
+
+		self.Profiler.Start('ADDDATA')
+
+		nodeLabelData, ZeroData = AddDataPayloadFromArrays(Labels, numpy.zeros(len(Labels)))
+
+		for analysisTime in (0.0, 1.0):
+
+			frameFinal = step1.Frame(incrementNumber=int(analysisTime),
+				frameValue=analysisTime,
+				description='Step Time= '+str(analysisTime))
+
+			for FieldName, Array in FieldData:
+
+				uField = frameFinal.FieldOutput(name=FieldName,
+					description=FieldName, type=SCALAR)
+
+				if analysisTime == 0.0:
+					Data = ZeroData
+				else:
+					Data = AddDataFromArray(Array)
+
+				uField.addData(position=NODAL, instance=self.WriteInstance,
+					labels=nodeLabelData,
+					data=Data)
+
+		self.Profiler.Stop(step=StepName)
+
+	def Close(self):
+		# Single save of all written steps
+		with self.Profiler.Phase('SAVE'):
+			if self.OdbToWrite is not None:
+				self.OdbToWrite.save()
+				self.OdbToWrite.close()
+			self.OdbToRead.close()
+
+def EvaluateStepPair(Session, StepPair, NodeSetNames):
+	# Labels, RUIZ parameter and relative slip of the union of the node sets for one step pair (step number i, frame number i, frame number i-1)
+	StepNumberi, FrameNumberi, FrameNumberiMinusOne = StepPair
+
+	# Frame i-1 first, frame i is then the frame kept by the cache for the next step pair
+	Session.Profiler.Start('FIELD EXTRACTION')
+	ContactFieldsiMinusOne = Session.ContactFields(int(StepNumberi)-1, FrameNumberiMinusOne, NodeSetNames)
+	ContactFieldsi = Session.ContactFields(StepNumberi, FrameNumberi, NodeSetNames)
+	Session.Profiler.Stop(step_pair=list(StepPair))
+
+	with Session.Profiler.Phase('COMPUTE'):
+		return EvaluateNodeSet(ContactFieldsi, ContactFieldsiMinusOne)
+
+WorkerSession = None
+
+def InitialiseWorker(OdbToReadName, InstanceName, CacheMegaBytes):
+	# Each worker process opens its own read only handle of the ODB
+	global WorkerSession
+	WorkerSession = FrettingOdbSession(OdbToReadName, None, InstanceName, CacheMegaBytes)
+
+def EvaluateStepPairRunInWorker(Arguments):
+	# Results of a run of consecutive step pairs and the number of frames the worker read from the ODB for them
+	StepPairs, NodeSetNames = Arguments
+	FrameReads = WorkerSession.FieldCache.FrameReads
+	Results = [EvaluateStepPair(WorkerSession, StepPair, NodeSetNames) for StepPair in StepPairs]
+	return Results, WorkerSession.FieldCache.FrameReads - FrameReads
+
+def StepPairRuns(StepPairs, NumberOfRuns):
+	# StepPairs split in order into NumberOfRuns contiguous runs, the lengths differ by at most one
+	Bounds = [(len(StepPairs)*Run)//NumberOfRuns for Run in range(NumberOfRuns + 1)]
+	return [StepPairs[Bounds[Run]:Bounds[Run+1]] for Run in range(NumberOfRuns)]
+
+def EvaluateStepPairs(Session, StepPairs, NodeSetNames, NumberOfProcesses=1):
+	# Results of all step pairs in order, step pairs are spread over worker processes if NumberOfProcesses > 1
+	if NumberOfProcesses <= 1 or len(StepPairs) < 2:
+		for StepPair in StepPairs:
+			yield EvaluateStepPair(Session, StepPair, NodeSetNames)
+		return
+
+	NumberOfProcesses = min(NumberOfProcesses, len(StepPairs))
+
+	# Short contiguous runs of step pairs, a frame shared by two step pairs of a run is read once and the results of a run are
+	# yielded (and checkpointed) as soon as it and the runs before it are finished
+	NumberOfRuns = max(NumberOfProcesses, (len(StepPairs) + STEP_PAIRS_PER_RUN - 1)//STEP_PAIRS_PER_RUN)
+	Runs = StepPairRuns(list(StepPairs), NumberOfRuns)
+
+	Pool = multiprocessing.Pool(processes=NumberOfProcesses, initializer=InitialiseWorker,
+		initargs=(Session.OdbToReadName, Session.InstanceName, Session.CacheMegaBytes))
+
+	try:
+		for Results, FrameReads in Pool.imap(EvaluateStepPairRunInWorker, [(Run, NodeSetNames) for Run in Runs], 1):
+			Session.WorkerFrameReads = Session.WorkerFrameReads + FrameReads
+			for Result in Results:
+				yield Result
+	finally:
+		Pool.terminate()
+		Pool.join()
+
+def OdbIdentity(OdbName):
+	# Absolute path, size in bytes and modification time of an ODB as strings, a checkpoint is resumed only for the same identity
+	return [os.path.abspath(OdbName), str(os.path.getsize(OdbName)), repr(os.path.getmtime(OdbName))]
+
+class RuizAccumulator:
+	# Cumulative RUIZ parameter and relative slip of a run, checkpointed to CheckpointName after each step pair
+	# The checkpoint holds the sums, the step pairs and node sets of the run, the ODB read (OdbToReadName) and the number of completed
+	# step pairs, CheckpointName+'.pairs' holds the RUIZ parameter and relative slip of each completed step pair as float32 records
+
+	def __init__(self, CheckpointName, StepPairs, NodeSetNames, OdbToReadName):
+
+		self.CheckpointName = CheckpointName
+		self.TemporaryName = CheckpointName+'.tmp'
+		self.PairsName = CheckpointName+'.pairs'
+		self.StepPairs = numpy.array(StepPairs, dtype=numpy.int64).reshape(-1, 3)
+		self.NodeSetNames = ','.join(NodeSetNames)
+		self.OdbToRead = OdbIdentity(OdbToReadName)
+
+		self.Labels = None
+		self.RuizSum = None
+		self.SlipSum = None
+		self.Completed = 0
+
+		# A crash between removing the old checkpoint and renaming the new one leaves only the temporary file
+		if os.path.exists(self.CheckpointName):
+			self.Load(self.CheckpointName)
+		elif os.path.exists(self.TemporaryName):
+			self.Load(self.TemporaryName)
+
+	def Load(self, FileName):
+		# Resume only if the checkpoint was written for the same step pairs and node sets from the same, unchanged ODB to read
+		try:
+			Checkpoint = dict(numpy.load(FileName).items())
+		except Exception:
+			# Only a temporary file of a crashed first checkpoint can be incomplete
+			print('Checkpoint '+FileName+' cannot be read, starting from the first step pair')
+			return
+
+		if not numpy.array_equal(Checkpoint['StepPairs'], self.StepPairs) or str(Checkpoint['NodeSetNames']) != self.NodeSetNames:
+			print('Checkpoint '+FileName+' is of other step pairs or node sets, starting from the first step pair')
+			return
+
+		if 'OdbToRead' not in Checkpoint or list(Checkpoint['OdbToRead']) != self.OdbToRead:
+			print('Checkpoint '+FileName+' is of another or a changed ODB to read, starting from the first step pair')
+			return
+
+		self.Labels = Checkpoint['Labels']
+		self.RuizSum = Checkpoint['RuizSum']
+		self.SlipSum = Checkpoint['SlipSum']
+		self.Completed = int(Checkpoint['Completed'])
+
+	def RecordSize(self):
+		# Bytes of one step pair record in the pairs file
+		return 2*len(self.Labels)*numpy.dtype(numpy.float32).itemsize
+
+	def CompletedPairs(self):
+		# (step pair index, labels, RUIZ parameter, relative slip) of the step pairs completed before a restart
+		if self.Completed == 0:
+			return
+
+		Records = numpy.fromfile(self.PairsName, dtype=numpy.float32, count=2*len(self.Labels)*self.Completed).reshape(self.Completed, 2, len(self.Labels))
+
+		for zerothindex in range(self.Completed):
+			yield zerothindex, self.Labels, Records[zerothindex, 0].astype(numpy.float64), Records[zerothindex, 1].astype(numpy.float64)
+
+	def Add(self, Labels, RuizParameter, RelativeSlip):
+		# Add the results of the next step pair and checkpoint
+
+		if self.Completed == 0:
+			self.Labels = numpy.asarray(Labels, dtype=numpy.int64)
+			self.RuizSum = RuizParameter.copy()
+			self.SlipSum = RelativeSlip.copy()
+			PairsFile = open(self.PairsName, 'wb')
+		else:
+			self.RuizSum = self.RuizSum + RuizParameter
+			self.SlipSum = self.SlipSum + RelativeSlip
+			# Records written after the last checkpoint of a crashed run are dropped
+			PairsFile = open(self.PairsName, 'r+b')
+			PairsFile.truncate(self.Completed*self.RecordSize())
+			PairsFile.seek(0, 2)
+
+		numpy.concatenate((RuizParameter, RelativeSlip)).astype(numpy.float32).tofile(PairsFile)
+		PairsFile.close()
+
+		self.Completed = self.Completed + 1
+
+		self.Checkpoint()
+
+	def Checkpoint(self):
+		# Written to a temporary file first so that a crash while writing keeps the previous checkpoint
+		CheckpointFile = open(self.TemporaryName, 'wb')
+		numpy.savez(CheckpointFile, Labels=self.Labels, RuizSum=self.RuizSum, SlipSum=self.SlipSum,
+			Completed=numpy.array(self.Completed), StepPairs=self.StepPairs, NodeSetNames=numpy.array(self.NodeSetNames),
+			OdbToRead=numpy.array(self.OdbToRead))
+		CheckpointFile.close()
+
+		if os.path.exists(self.CheckpointName):
+			os.remove(self.CheckpointName)
+		os.rename(self.TemporaryName, self.CheckpointName)
+
+	def Remove(self):
+		# Checkpoint files are removed once the output ODB is saved
+		for FileName in (self.CheckpointName, self.TemporaryName, self.PairsName):
+			if os.path.exists(FileName):
+				os.remove(FileName)
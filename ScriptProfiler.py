@@ -0,0 +1,151 @@
+"""
+ScriptProfiler.py
+
+Per-phase profiling of the Abaqus python scripts in this folder (fretting, Archard wear, ODB transfer and job automation scripts).
+
+For every named phase (for example ODB OPEN, FIELD EXTRACTION, COMPUTE, ADDDATA, SAVE) one JSON line is appended to the profile file
+with the wall time, the CPU time and the peak resident memory (RSS) of the process at the end of the phase.
+
+Profiling is switched on by setting the environment variable SCRIPT_PROFILE_FILE to the name of the profile file, for example:
+
+set SCRIPT_PROFILE_FILE=Script_Profile.jsonl (Windows) OR export SCRIPT_PROFILE_FILE=Script_Profile.jsonl (Linux)
+abq2018 python FrettingAssesmentUsingRuizParameter.py
+
+When the variable is not set the profiler is disabled and every call returns immediately.
+
+Usage in a script:
+
+Profiler = ScriptProfiler('ArchardWearIterator.py')
+Profiler.Start('ODB OPEN')
+...
+Profiler.Stop()
+
+OR
+
+with Profiler.Phase('SAVE'):
+	...
+
+Revision history:
+REV-00 (18th October 2026): 1st release
+
+Author:
+Ranjit GOPI
+Solution Consultant, SIMULIA India COE
+ranjit.gopi@3ds.com
+Simulia India Support Frontdesk:+91 44 43443000
+Simulia India Support Email: simulia.in.support@3ds.com
+3DS.COM/SIMULIA
+"""
+import os
+import sys
+import time
+import json
+
+def CpuTime():
+	# User plus system CPU time of this process in seconds
+	Times = os.times()
+	return Times[0] + Times[1]
+
+def PeakRssMegaBytes():
+	# Peak resident memory of this process in MB, None if it cannot be obtained on this platform
+	try:
+		import resource
+		PeakRss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+		if sys.platform == 'darwin':
+			return PeakRss/(1024.0*1024.0)
+		return PeakRss/1024.0
+	except ImportError:
+		pass
+
+	try:
+		import ctypes
+		import ctypes.wintypes
+
+		class PROCESS_MEMORY_COUNTERS(ctypes.Structure):
+			_fields_ = [('cb', ctypes.wintypes.DWORD),
+				('PageFaultCount', ctypes.wintypes.DWORD),
+				('PeakWorkingSetSize', ctypes.c_size_t),
+				('WorkingSetSize', ctypes.c_size_t),
+				('QuotaPeakPagedPoolUsage', ctypes.c_size_t),
+				('QuotaPagedPoolUsage', ctypes.c_size_t),
+				('QuotaPeakNonPagedPoolUsage', ctypes.c_size_t),
+				('QuotaNonPagedPoolUsage', ctypes.c_size_t),
+				('PagefileUsage', ctypes.c_size_t),
+				('PeakPagefileUsage', ctypes.c_size_t)]
+
+		Counters = PROCESS_MEMORY_COUNTERS()
+		Counters.cb = ctypes.sizeof(PROCESS_MEMORY_COUNTERS)
+		ctypes.windll.psapi.GetProcessMemoryInfo(ctypes.windll.kernel32.GetCurrentProcess(), ctypes.byref(Counters), Counters.cb)
+		return Counters.PeakWorkingSetSize/(1024.0*1024.0)
+	except Exception:
+		return None
+
+class NullPhase:
+	# Context manager used when profiling is disabled
+
+	def __enter__(self):
+		return self
+
+	def __exit__(self, *Arguments):
+		return False
+
+NULL_PHASE = NullPhase()
+
+class ProfiledPhase:
+	# Context manager of one enabled phase
+
+	def __init__(self, Profiler, PhaseName):
+		self.Profiler = Profiler
+		self.PhaseName = PhaseName
+
+	def __enter__(self):
+		self.Profiler.Start(self.PhaseName)
+		return self
+
+	def __exit__(self, *Arguments):
+		self.Profiler.Stop()
+		return False
+
+class ScriptProfiler:
+	# Records wall time, CPU time and peak RSS of named phases as JSON lines in FileName
+	# FileName defaults to the environment variable SCRIPT_PROFILE_FILE, without it the profiler is disabled
+
+	def __init__(self, ScriptName, FileName=None):
+
+		if FileName is None:
+			FileName = os.environ.get('SCRIPT_PROFILE_FILE')
+
+		self.ScriptName = ScriptName
+		self.FileName = FileName
+		self.Enabled = bool(FileName)
+		self.OpenPhases = []
+
+	def Start(self, PhaseName):
+		if not self.Enabled:
+			return
+		self.OpenPhases.append((PhaseName, time.time(), CpuTime()))
+
+	def Stop(self, **Extra):
+		# Ends the last started phase, Extra values (for example frame=3) are added to the record
+		if not self.Enabled or not self.OpenPhases:
+			return
+
+		PhaseName, WallStart, CpuStart = self.OpenPhases.pop()
+
+		Record = {'script': self.ScriptName,
+			'phase': PhaseName,
+			'wall_s': time.time() - WallStart,
+			'cpu_s': CpuTime() - CpuStart,
+			'peak_rss_mb': PeakRssMegaBytes(),
+			'pid': os.getpid(),
+			'timestamp': time.time()}
+		Record.update(Extra)
+
+		with open(self.FileName, 'a') as myfile:
+			myfile.write(json.dumps(Record, sort_keys=True) + '\n')
+
+	def Phase(self, PhaseName):
+		# with Profiler.Phase('SAVE'): ...
+		if not self.Enabled:
+			return NULL_PHASE
+		return ProfiledPhase(self, PhaseName)